@@ -0,0 +1,98 @@
+"""Test JobService queue claiming."""
+
+import pytest
+from datetime import datetime, timedelta
+
+from app.models.job import Job, JobStatus
+from app.services.job_service import JobService
+
+
+def _add_jobs(db_session, statuses):
+    """Add one job per status, each created a minute after the previous one."""
+    base = datetime(2024, 1, 1)
+    job_ids = []
+    for i, status in enumerate(statuses):
+        job = Job(
+            id=f"job_{i}",
+            status=status,
+            progress=0,
+            input_s3_key=f"uploads/{i}.mp4",
+            source_language="english",
+            target_language="hindi",
+            voice_id="test_voice_id",
+            created_at=base + timedelta(minutes=i),
+            updated_at=base + timedelta(minutes=i),
+        )
+        db_session.add(job)
+        job_ids.append(job.id)
+    db_session.commit()
+    return job_ids
+
+
+@pytest.mark.unit
+def test_get_next_pending_jobs_oldest_first(db_session):
+    """Test queued job IDs come back oldest first, up to the limit."""
+    job_ids = _add_jobs(db_session, [
+        JobStatus.QUEUED, JobStatus.PROCESSING, JobStatus.QUEUED, JobStatus.QUEUED, JobStatus.DONE,
+    ])
+    # Make the last queued job the oldest, so order can't come from insertion
+    db_session.query(Job).filter(Job.id == job_ids[3]).update(
+        {Job.created_at: datetime(2023, 12, 31)}
+    )
+    db_session.commit()
+    job_service = JobService(db_session)
+
+    assert job_service.get_next_pending_jobs() == [job_ids[3], job_ids[0], job_ids[2]]
+    assert job_service.get_next_pending_jobs(limit=2) == [job_ids[3], job_ids[0]]
+
+
+@pytest.mark.unit
+def test_get_next_pending_jobs_empty(db_session):
+    """Test no queued jobs gives an empty list."""
+    _add_jobs(db_session, [JobStatus.CREATED, JobStatus.DONE])
+
+    assert JobService(db_session).get_next_pending_jobs() == []
+
+
+@pytest.mark.unit
+def test_claim_job_marks_processing(db_session):
+    """Test claiming a queued job moves it to processing with progress 0."""
+    (job_id,) = _add_jobs(db_session, [JobStatus.QUEUED])
+    db_session.query(Job).update({Job.progress: 40})
+    db_session.commit()
+
+    job = JobService(db_session).claim_job(job_id)
+
+    assert job is not None
+    assert job.id == job_id
+    assert job.status == JobStatus.PROCESSING
+    assert job.progress == 0
+
+
+@pytest.mark.unit
+def test_claim_job_only_once(db_session):
+    """Test a job ID can be claimed by only one caller."""
+    (job_id,) = _add_jobs(db_session, [JobStatus.QUEUED])
+    job_service = JobService(db_session)
+
+    assert job_service.claim_job(job_id) is not None
+    assert job_service.claim_job(job_id) is None
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("status", [
+    JobStatus.CREATED, JobStatus.PROCESSING, JobStatus.DONE, JobStatus.FAILED,
+])
+def test_claim_job_not_queued(db_session, status):
+    """Test jobs that are not queued are left alone."""
+    (job_id,) = _add_jobs(db_session, [status])
+
+    assert JobService(db_session).claim_job(job_id) is None
+    db_session.expire_all()
+    assert db_session.get(Job, job_id).status == status
+
+
+@pytest.mark.unit
+def test_claim_job_unknown_id(db_session):
+    """Test claiming a job that doesn't exist returns None."""
+    assert JobService(db_session).claim_job("job_missing") is None
@@ -2,6 +2,7 @@
 
 import pytest
 from unittest.mock import Mock, patch, MagicMock
+from boto3.exceptions import S3UploadFailedError
 from botocore.exceptions import ClientError
 
 from app.services.s3_service import S3Service, S3ValidationError
@@ -142,6 +143,48 @@ def test_get_file_size_not_found(s3_service, mock_s3_client):
         s3_service.get_file_size("uploads/nonexistent.mp4")
 
 
+@pytest.mark.unit
+def test_get_etag(s3_service, mock_s3_client):
+    """Test getting a file's ETag without surrounding quotes."""
+    mock_s3_client.head_object.return_value = {"ETag": '"9b2cf535f27731c974343645a3985328"'}
+
+    etag = s3_service.get_etag("uploads/test.mp4")
+
+    assert etag == "9b2cf535f27731c974343645a3985328"
+
+
+@pytest.mark.unit
+def test_get_etag_not_found(s3_service, mock_s3_client):
+    """Test getting the ETag of a non-existent file."""
+    error_response = {"Error": {"Code": "404"}}
+    mock_s3_client.head_object.side_effect = ClientError(error_response, "head_object")
+
+    assert s3_service.get_etag("uploads/nonexistent.mp4") is None
+
+
+@pytest.mark.unit
+def test_get_object_if_exists_missing(s3_service, mock_s3_client):
+    """Test reading a non-existent object."""
+    error_response = {"Error": {"Code": "NoSuchKey"}}
+    mock_s3_client.get_object.side_effect = ClientError(error_response, "get_object")
+
+    assert s3_service.get_object_if_exists("cache/missing.json") is None
+
+
+@pytest.mark.unit
+def test_copy_file(s3_service, mock_s3_client):
+    """Test server-side copy within the bucket."""
+    s3_key = s3_service.copy_file("outputs/a_dubbed.mp4", "outputs/b_dubbed.mp4")
+
+    assert s3_key == "outputs/b_dubbed.mp4"
+    mock_s3_client.copy.assert_called_once_with(
+        {"Bucket": s3_service.bucket_name, "Key": "outputs/a_dubbed.mp4"},
+        s3_service.bucket_name,
+        "outputs/b_dubbed.mp4",
+        Config=s3_service.transfer_config
+    )
+
+
 @pytest.mark.unit
 def test_upload_file(s3_service, mock_s3_client):
     """Test uploading file to S3."""
@@ -153,7 +196,8 @@ def test_upload_file(s3_service, mock_s3_client):
     mock_s3_client.upload_file.assert_called_once_with(
         "/tmp/test.mp4",
         s3_service.bucket_name,
-        "outputs/test.mp4"
+        "outputs/test.mp4",
+        Config=s3_service.transfer_config
     )
 
 
@@ -168,7 +212,8 @@ def test_download_file(s3_service, mock_s3_client):
     mock_s3_client.download_file.assert_called_once_with(
         s3_service.bucket_name,
         "uploads/test.mp4",
-        "/tmp/test.mp4"
+        "/tmp/test.mp4",
+        Config=s3_service.transfer_config
     )
 
 
@@ -286,6 +331,21 @@ def test_upload_file_with_retry_failure_then_success(s3_service, mock_s3_client)
     mock_sleep.assert_called_once_with(1)  # First retry waits 1 second
 
 
+@pytest.mark.unit
+def test_upload_file_with_retry_upload_failed_error(s3_service, mock_s3_client):
+    """Test upload retry logic on boto3's S3UploadFailedError."""
+    mock_s3_client.upload_file.side_effect = [
+        S3UploadFailedError("Failed to upload"),  # First attempt fails
+        None  # Second attempt succeeds
+    ]
+
+    with patch('time.sleep'):  # Mock sleep to speed up test
+        s3_key = s3_service.upload_file_with_retry("/tmp/test.mp4", "outputs/test.mp4", max_retries=2)
+
+    assert s3_key == "outputs/test.mp4"
+    assert mock_s3_client.upload_file.call_count == 2
+
+
 @pytest.mark.unit
 def test_upload_file_with_retry_max_retries_exceeded(s3_service, mock_s3_client):
     """Test upload retry logic - all attempts fail."""
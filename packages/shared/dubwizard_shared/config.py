@@ -62,6 +62,34 @@ class SharedSettings(BaseSettings):
     USE_LOCAL_STORAGE: bool = False
     USE_MOCK_AI: bool = False
 
+    # Directory for job temp files (e.g. /dev/shm tmpfs); None uses the system default
+    WORKER_TMPFS_DIR: str | None = None
+
+    # Stream input video from S3 straight into FFmpeg for audio extraction.
+    # Off by default: MP4s with the moov atom at the end can't be demuxed from
+    # a pipe and pay for a failed FFmpeg run before the file fallback
+    WORKER_STREAM_EXTRACT: bool = False
+
+    # Jobs one worker processes in parallel (each on its own thread)
+    WORKER_CONCURRENCY: int = 4
+
+    # Reuse outputs of an earlier job with the same input file, languages and voice
+    ENABLE_RESULT_CACHE: bool = False
+
+    # Maximum concurrent ElevenLabs TTS requests across all jobs in a worker
+    # process (not multiplied by WORKER_CONCURRENCY)
+    ELEVENLABS_CONCURRENCY: int = 5
+
+    # Local Whisper transcription (faster-whisper); 0 uses the hosted API
+    WHISPER_BATCH_SIZE: int = 0
+    WHISPER_MODEL: str = "large-v3"
+    WHISPER_DEVICE: str = "auto"
+    # "auto" uses float16 on GPU and int8 on CPU
+    WHISPER_COMPUTE_TYPE: str = "auto"
+    # Decode audio in-process with PyAV and pass samples to local Whisper
+    # (no intermediate WAV); only applies when WHISPER_BATCH_SIZE > 0
+    USE_PYAV_EXTRACT: bool = False
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -15,6 +15,12 @@ ALLOWED_CONTENT_TYPES = {"video/mp4"}
 SUPPORTED_SOURCE_LANGUAGES = ["english"]
 SUPPORTED_TARGET_LANGUAGES = ["hindi"]
 
+# ISO 639-2 codes for tagging embedded subtitle tracks
+LANGUAGE_CODES = {
+    "english": "eng",
+    "hindi": "hin",
+}
+
 # S3 paths
 S3_UPLOADS_PREFIX = "uploads/"
 S3_OUTPUTS_PREFIX = "outputs/"
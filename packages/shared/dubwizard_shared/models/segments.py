@@ -83,6 +83,7 @@ class SynthesizedSegment:
     text: str              # Text that was synthesized
     audio_path: str        # Path to audio file
     actual_duration: float # Actual duration of synthesized audio
+    audio_offset: Optional[float] = None  # Start within audio_path when segments share a file
 
     @property
     def target_duration(self) -> float:
@@ -98,4 +99,5 @@ class SynthesizedSegment:
             "text": self.text,
             "audio_path": self.audio_path,
             "actual_duration": self.actual_duration,
+            "audio_offset": self.audio_offset,
         }
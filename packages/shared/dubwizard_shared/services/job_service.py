@@ -4,6 +4,7 @@ import logging
 import uuid
 from datetime import datetime
 from typing import Optional, List
+from sqlalchemy import text
 from sqlalchemy.orm import Session
 
 from dubwizard_shared.models.job import Job
@@ -12,6 +13,9 @@ from dubwizard_shared.schemas.job import JobCreate
 
 logger = logging.getLogger(__name__)
 
+# PostgreSQL channel the worker LISTENs on for newly queued jobs
+JOB_PENDING_CHANNEL = "job_pending"
+
 
 class JobService:
     """Service for managing job lifecycle and database operations."""
@@ -78,6 +82,9 @@ class JobService:
 
     def enqueue_job(self, job_id: str) -> Optional[Job]:
         """Mark job as queued for processing."""
+        if self.db.get_bind().dialect.name == "postgresql":
+            # Delivered to listening workers when the status update commits
+            self.db.execute(text(f"NOTIFY {JOB_PENDING_CHANNEL}"))
         return self.update_job_status(job_id, JobStatus.QUEUED, 0)
 
     def complete_job(
@@ -150,6 +157,45 @@ class JobService:
             logger.info(f"Found pending job: {job.id}")
         return job
 
+    def get_next_pending_jobs(self, limit: int = 16) -> List[str]:
+        """Get the IDs of up to ``limit`` oldest queued jobs in one query."""
+        rows = (
+            self.db.query(Job.id)
+            .filter(Job.status == JobStatus.QUEUED)
+            .order_by(Job.created_at.asc())
+            .limit(limit)
+            .all()
+        )
+        return [job_id for (job_id,) in rows]
+
+    def claim_job(self, job_id: str) -> Optional[Job]:
+        """
+        Move a queued job to processing if it is still queued.
+
+        The status check and update are one conditional UPDATE, so a job ID
+        fetched earlier is claimed by at most one worker.
+        """
+        claimed = (
+            self.db.query(Job)
+            .filter(Job.id == job_id, Job.status == JobStatus.QUEUED)
+            .update(
+                {
+                    Job.status: JobStatus.PROCESSING,
+                    Job.progress: 0,
+                    Job.updated_at: datetime.utcnow(),
+                },
+                synchronize_session=False,
+            )
+        )
+        self.db.commit()
+
+        if not claimed:
+            logger.debug(f"Job no longer queued: {job_id}")
+            return None
+
+        logger.info(f"Claimed job: {job_id}")
+        return self.get_job(job_id)
+
     def list_jobs(
         self, status: Optional[JobStatus] = None, limit: int = 100
     ) -> List[Job]:
@@ -1,10 +1,13 @@
 """S3 service for file storage and presigned URL generation shared across components."""
 
+import hashlib
 import logging
 import time
 import uuid
 from typing import Optional
 import boto3
+from boto3.exceptions import RetriesExceededError, S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
 from botocore.exceptions import ClientError
 from dubwizard_shared.config import shared_settings as settings
@@ -12,6 +15,12 @@ from dubwizard_shared.constants import MAX_VIDEO_SIZE_MB, ALLOWED_CONTENT_TYPES,
 
 logger = logging.getLogger(__name__)
 
+# Transfer tuning shared by all uploads/downloads: 8MB multipart parts with
+# up to 16 parts in flight, over one client connection pool
+TRANSFER_CHUNK_SIZE = 8 * 1024 * 1024
+TRANSFER_MAX_CONCURRENCY = 16
+MAX_POOL_CONNECTIONS = 32
+
 
 class S3ValidationError(Exception):
     """Custom exception for S3 validation errors."""
@@ -30,8 +39,17 @@ class S3Service:
                 region_name=settings.AWS_REGION,
                 aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
                 aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-                config=Config(signature_version='s3v4')
+                config=Config(
+                    signature_version='s3v4',
+                    max_pool_connections=MAX_POOL_CONNECTIONS,
+                )
             )
+        self.transfer_config = TransferConfig(
+            multipart_threshold=TRANSFER_CHUNK_SIZE,
+            multipart_chunksize=TRANSFER_CHUNK_SIZE,
+            max_concurrency=TRANSFER_MAX_CONCURRENCY,
+            use_threads=True,
+        )
         self.bucket_name = settings.S3_BUCKET_NAME
         self.local_storage_path = "/tmp/dubwizard_uploads"
         if self.is_dev:
@@ -167,6 +185,85 @@ class S3Service:
             logger.error(f"Failed to get file size for {s3_key}: {e}")
             raise
 
+    def get_etag(self, s3_key: str) -> Optional[str]:
+        """Get a file's ETag (content fingerprint), or None if it doesn't exist."""
+        if self.is_dev:
+            import os
+            path = os.path.join(self.local_storage_path, s3_key)
+            if not os.path.exists(path):
+                return None
+            digest = hashlib.md5()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(TRANSFER_CHUNK_SIZE), b""):
+                    digest.update(chunk)
+            return digest.hexdigest()
+
+        try:
+            response = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+            return response["ETag"].strip('"')
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "404":
+                return None
+            logger.error(f"Failed to get ETag for {s3_key}: {e}")
+            raise
+
+    def get_object_if_exists(self, s3_key: str) -> Optional[bytes]:
+        """Read a small object's contents, or None if it doesn't exist."""
+        if self.is_dev:
+            import os
+            try:
+                with open(os.path.join(self.local_storage_path, s3_key), "rb") as f:
+                    return f.read()
+            except FileNotFoundError:
+                return None
+
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=s3_key)
+            return response["Body"].read()
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                return None
+            logger.error(f"Failed to read {s3_key}: {e}")
+            raise
+
+    def put_object(self, s3_key: str, body: bytes, content_type: str = "application/json") -> str:
+        """Write a small object from memory."""
+        if self.is_dev:
+            import os
+            dest_path = os.path.join(self.local_storage_path, s3_key)
+            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+            with open(dest_path, "wb") as f:
+                f.write(body)
+            logger.info(f"Wrote object to Local Storage: {dest_path}")
+            return s3_key
+
+        self.s3_client.put_object(
+            Bucket=self.bucket_name, Key=s3_key, Body=body, ContentType=content_type
+        )
+        logger.info(f"Wrote object to S3: {s3_key}")
+        return s3_key
+
+    def copy_file(self, source_key: str, dest_key: str) -> str:
+        """Copy a file within the bucket (server-side, no download)."""
+        if self.is_dev:
+            import shutil
+            import os
+            src_path = os.path.join(self.local_storage_path, source_key)
+            dest_path = os.path.join(self.local_storage_path, dest_key)
+            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+            shutil.copy2(src_path, dest_path)
+            logger.info(f"Copied file in Local Storage: {source_key} to {dest_key}")
+            return dest_key
+
+        self.s3_client.copy(
+            {"Bucket": self.bucket_name, "Key": source_key},
+            self.bucket_name,
+            dest_key,
+            Config=self.transfer_config,
+        )
+        logger.info(f"Copied file in S3: {source_key} to {dest_key}")
+        return dest_key
+
     def upload_file(self, file_path: str, s3_key: str) -> str:
         """Upload a file directly to S3."""
         if self.is_dev:
@@ -178,7 +275,7 @@ class S3Service:
             logger.info(f"Uploaded file to Local Storage: {dest_path}")
             return s3_key
 
-        self.s3_client.upload_file(file_path, self.bucket_name, s3_key)
+        self.s3_client.upload_file(file_path, self.bucket_name, s3_key, Config=self.transfer_config)
         logger.info(f"Uploaded file to S3: {s3_key}")
         return s3_key
 
@@ -192,10 +289,20 @@ class S3Service:
             logger.info(f"Downloaded file from Local Storage: {src_path} to {local_path}")
             return local_path
 
-        self.s3_client.download_file(self.bucket_name, s3_key, local_path)
+        self.s3_client.download_file(self.bucket_name, s3_key, local_path, Config=self.transfer_config)
         logger.info(f"Downloaded file from S3: {s3_key} to {local_path}")
         return local_path
 
+    def get_object_stream(self, s3_key: str):
+        """Open a file in S3 as a readable stream."""
+        if self.is_dev:
+            import os
+            return open(os.path.join(self.local_storage_path, s3_key), "rb")
+
+        response = self.s3_client.get_object(Bucket=self.bucket_name, Key=s3_key)
+        logger.info(f"Opened S3 stream: {s3_key}")
+        return response["Body"]
+
     def upload_file_with_retry(self, file_path: str, s3_key: str, max_retries: int = 3) -> str:
         """Upload a file directly to S3 with retry logic."""
         if self.is_dev:
@@ -203,10 +310,10 @@ class S3Service:
 
         for attempt in range(max_retries + 1):
             try:
-                self.s3_client.upload_file(file_path, self.bucket_name, s3_key)
+                self.s3_client.upload_file(file_path, self.bucket_name, s3_key, Config=self.transfer_config)
                 logger.info(f"Uploaded file to S3: {s3_key} (attempt {attempt + 1})")
                 return s3_key
-            except ClientError as e:
+            except (ClientError, S3UploadFailedError) as e:
                 if attempt == max_retries:
                     logger.error(f"Failed to upload file to S3 after {max_retries + 1} attempts: {e}")
                     raise
@@ -222,10 +329,10 @@ class S3Service:
 
         for attempt in range(max_retries + 1):
             try:
-                self.s3_client.download_file(self.bucket_name, s3_key, local_path)
+                self.s3_client.download_file(self.bucket_name, s3_key, local_path, Config=self.transfer_config)
                 logger.info(f"Downloaded file from S3: {s3_key} to {local_path} (attempt {attempt + 1})")
                 return local_path
-            except ClientError as e:
+            except (ClientError, RetriesExceededError) as e:
                 if attempt == max_retries:
                     logger.error(f"Failed to download file from S3 after {max_retries + 1} attempts: {e}")
                     raise
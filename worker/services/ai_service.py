@@ -1,13 +1,18 @@
 """AI service integrations for transcription, translation, and TTS."""
 
+import base64
+import concurrent.futures
 import logging
 import os
+import threading
 import time
 import json
+import numpy as np
 import requests
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Iterator, List, Optional, Tuple, Union
 from openai import OpenAI
+from requests.adapters import HTTPAdapter
 
 from dubwizard_shared import (
     TranscriptionSegment,
@@ -31,6 +36,15 @@ class AIService:
     MAX_RETRIES = 2
     RETRY_DELAYS = [1, 2]  # Exponential backoff delays in seconds
 
+    # HTTP connection pool for ElevenLabs (kept alive across jobs)
+    HTTP_POOL_CONNECTIONS = 16
+    HTTP_POOL_MAXSIZE = 32
+
+    # Adjacent segments are merged into one TTS request while the group spans
+    # at most this many seconds and the gaps between them stay small
+    MAX_MERGED_DURATION = 15.0
+    MAX_MERGE_GAP = 1.0
+
     def __init__(
         self,
         openai_api_key: Optional[str] = None,
@@ -86,6 +100,49 @@ class AIService:
         self.elevenlabs_base_url = "https://api.elevenlabs.io/v1"
         self.elevenlabs_model = "eleven_multilingual_v2"
 
+        # Shared HTTP session so TLS connections are reused between requests
+        self.http_session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=self.HTTP_POOL_MAXSIZE,
+        )
+        self.http_session.mount("https://", adapter)
+
+        # Caps in-flight ElevenLabs requests across all jobs sharing this
+        # service, so parallel jobs stay within the account's limit
+        self._tts_slots = threading.BoundedSemaphore(max(1, settings.ELEVENLABS_CONCURRENCY))
+
+        # Local Whisper pipeline (loaded on first use)
+        self._whisper_pipeline = None
+        self._whisper_lock = threading.Lock()
+
+    def warm_up(self) -> None:
+        """
+        Load models ahead of the first job.
+
+        When local batched transcription is enabled, this loads the Whisper
+        weights and runs one short decode so model loading and device
+        initialization are not charged to the first job. Failures are logged
+        and left to surface on first real use.
+        """
+        if self.mock_mode or settings.WHISPER_BATCH_SIZE <= 0:
+            return
+
+        logger.info("Warming up local Whisper model...")
+        try:
+            pipeline = self._get_whisper_pipeline()
+            # One second of silence at Whisper's 16kHz sample rate
+            results, _info = pipeline.transcribe(
+                np.zeros(16000, dtype=np.float32),
+                language="en",
+                batch_size=1,
+            )
+            list(results)
+        except Exception as e:
+            logger.warning(f"Whisper warm-up failed: {e}")
+            return
+
+        logger.info("Whisper model ready")
 
     def _retry_with_backoff(self, func, description: str, *args, **kwargs):
         """
@@ -141,12 +198,7 @@ class AIService:
             FileNotFoundError: If audio file doesn't exist
         """
         if self.mock_mode:
-            logger.info("MOCK MODE: Returning dummy transcription")
-            return [
-                TranscriptionSegment(id=1, start=0.0, end=2.0, text="Hello world."),
-                TranscriptionSegment(id=2, start=2.5, end=4.5, text="This is a test video."),
-                TranscriptionSegment(id=3, start=5.0, end=7.0, text="For debugging purposes."),
-            ]
+            return self._mock_transcription()
 
         audio_path = Path(audio_path)
         if not audio_path.exists():
@@ -192,6 +244,222 @@ class AIService:
         logger.info(f"Transcribed {len(segments)} segments")
         return segments
 
+    def _mock_transcription(self) -> List[TranscriptionSegment]:
+        """Return dummy transcription segments for mock mode."""
+        logger.info("MOCK MODE: Returning dummy transcription")
+        return [
+            TranscriptionSegment(id=1, start=0.0, end=2.0, text="Hello world."),
+            TranscriptionSegment(id=2, start=2.5, end=4.5, text="This is a test video."),
+            TranscriptionSegment(id=3, start=5.0, end=7.0, text="For debugging purposes."),
+        ]
+
+    def _get_whisper_pipeline(self):
+        """
+        Load the local faster-whisper batched pipeline on first use.
+
+        Returns:
+            faster_whisper.BatchedInferencePipeline instance
+
+        Raises:
+            AIServiceError: If faster-whisper is not installed or the model fails to load
+        """
+        with self._whisper_lock:
+            if self._whisper_pipeline is None:
+                try:
+                    from faster_whisper import BatchedInferencePipeline, WhisperModel
+                except ImportError as e:
+                    raise AIServiceError(
+                        "faster-whisper is not installed (required when WHISPER_BATCH_SIZE > 0)"
+                    ) from e
+
+                device, compute_type = self._resolve_whisper_device()
+                logger.info(
+                    f"Loading Whisper model {settings.WHISPER_MODEL} on {device} ({compute_type})..."
+                )
+                try:
+                    model = WhisperModel(
+                        settings.WHISPER_MODEL,
+                        device=device,
+                        compute_type=compute_type,
+                    )
+                except Exception as e:
+                    raise AIServiceError(f"Failed to load Whisper model: {e}") from e
+
+                self._whisper_pipeline = BatchedInferencePipeline(model=model)
+
+            return self._whisper_pipeline
+
+    @staticmethod
+    def _resolve_whisper_device() -> Tuple[str, str]:
+        """
+        Resolve the device and quantization for the local Whisper model.
+
+        With the "auto" settings, CUDA is used when a GPU is visible, with
+        float16 weights on GPU and int8 on CPU.
+
+        Returns:
+            Tuple of (device, compute_type)
+        """
+        device = settings.WHISPER_DEVICE
+        if device == "auto":
+            import ctranslate2
+            device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+
+        compute_type = settings.WHISPER_COMPUTE_TYPE
+        if compute_type == "auto":
+            compute_type = "float16" if device == "cuda" else "int8"
+
+        return device, compute_type
+
+    def transcribe_audio_batched(
+        self,
+        audio_path: str,
+        language: str = "en",
+        batch_size: int = 16,
+    ) -> List[TranscriptionSegment]:
+        """
+        Transcribe audio locally with batched Whisper inference.
+
+        The audio is split into speech chunks with Silero VAD, each chunk is
+        padded to Whisper's 30s window, and the chunks are decoded together in
+        batches of ``batch_size``. Chunks carry no cross-chunk context, so this
+        removes the sequential dependency of long-form decoding. Timestamps
+        are mapped back to absolute positions using the VAD offsets.
+
+        Args:
+            audio_path: Path to audio file (WAV, MP3, etc.)
+            language: Language code (default "en" for English)
+            batch_size: Number of speech chunks decoded per forward pass
+
+        Returns:
+            List of TranscriptionSegment with timestamps
+
+        Raises:
+            AIServiceError: If transcription fails
+            FileNotFoundError: If audio file doesn't exist
+        """
+        if self.mock_mode:
+            return self._mock_transcription()
+
+        audio_path = Path(audio_path)
+        if not audio_path.exists():
+            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+        segments = list(self._iter_batched_transcription(audio_path, language, batch_size))
+
+        logger.info(f"Transcribed {len(segments)} segments")
+        return segments
+
+    def transcribe_audio_array(
+        self,
+        samples: np.ndarray,
+        language: str = "en",
+        batch_size: int = 16,
+    ) -> List[TranscriptionSegment]:
+        """
+        Transcribe decoded audio samples locally with batched Whisper inference.
+
+        Same as transcribe_audio_batched, but takes samples already decoded
+        in-process so no intermediate audio file is needed.
+
+        Args:
+            samples: 16kHz mono float32 samples in [-1.0, 1.0]
+            language: Language code (default "en" for English)
+            batch_size: Number of speech chunks decoded per forward pass
+
+        Returns:
+            List of TranscriptionSegment with timestamps
+
+        Raises:
+            AIServiceError: If transcription fails
+        """
+        if self.mock_mode:
+            return self._mock_transcription()
+
+        segments = list(self._iter_batched_transcription(samples, language, batch_size))
+
+        logger.info(f"Transcribed {len(segments)} segments")
+        return segments
+
+    def _iter_batched_transcription(
+        self,
+        audio: Union[Path, np.ndarray],
+        language: str,
+        batch_size: int,
+    ) -> Iterator[TranscriptionSegment]:
+        """Yield segments from the local batched pipeline as they are decoded."""
+        if isinstance(audio, np.ndarray):
+            source = f"{len(audio) / 16000:.1f}s of decoded samples"
+        else:
+            source = audio.name
+            audio = str(audio)
+        logger.info(f"Transcribing audio locally: {source} (batch size {batch_size})")
+
+        pipeline = self._get_whisper_pipeline()
+
+        try:
+            # faster-whisper returns a lazy generator; decoding happens as it
+            # is consumed
+            results, _info = pipeline.transcribe(
+                audio,
+                language=language,
+                batch_size=batch_size,
+            )
+
+            for i, seg in enumerate(results):
+                yield TranscriptionSegment(
+                    id=i + 1,
+                    start=seg.start,
+                    end=seg.end,
+                    text=seg.text.strip(),
+                )
+        except Exception as e:
+            raise AIServiceError(f"Batched Whisper transcription failed: {e}") from e
+
+    def transcribe_audio_stream(
+        self,
+        audio: Union[str, np.ndarray],
+        language: str = "en",
+        batch_size: int = 0,
+    ) -> Iterator[TranscriptionSegment]:
+        """
+        Transcribe audio, yielding segments as soon as they are available.
+
+        With the local batched pipeline (``batch_size > 0``) segments are
+        yielded as each decode batch completes, so callers can start
+        downstream work (e.g. translation) before transcription finishes.
+        The hosted Whisper APIs return the whole transcript at once, in which
+        case all segments are yielded after the single request completes.
+
+        Args:
+            audio: Path to audio file (WAV, MP3, etc.), or 16kHz mono float32
+                samples (local pipeline only)
+            language: Language code (default "en" for English)
+            batch_size: Local batched-inference size; 0 uses the hosted API
+
+        Yields:
+            TranscriptionSegment with timestamps, in order
+
+        Raises:
+            AIServiceError: If transcription fails
+            FileNotFoundError: If audio file doesn't exist
+        """
+        if self.mock_mode:
+            yield from self._mock_transcription()
+            return
+
+        if isinstance(audio, np.ndarray):
+            if batch_size <= 0:
+                raise AIServiceError("Decoded samples require local transcription (batch_size > 0)")
+            yield from self._iter_batched_transcription(audio, language, batch_size)
+        elif batch_size > 0:
+            audio_path = Path(audio)
+            if not audio_path.exists():
+                raise FileNotFoundError(f"Audio file not found: {audio_path}")
+            yield from self._iter_batched_transcription(audio_path, language, batch_size)
+        else:
+            yield from self.transcribe_audio(audio, language=language)
+
     def translate_segments(
         self,
         segments: List[TranscriptionSegment],
@@ -377,7 +645,8 @@ Output (JSON array of {len(segments)} strings):"""
                 }
             }
 
-            response = requests.post(url, json=data, headers=headers, timeout=60)
+            with self._tts_slots:
+                response = self.http_session.post(url, json=data, headers=headers, timeout=60)
 
             if response.status_code != 200:
                 raise AIServiceError(
@@ -399,6 +668,110 @@ Output (JSON array of {len(segments)} strings):"""
         logger.debug(f"Synthesized audio saved to {output_path} ({duration:.2f}s)")
         return str(output_path), duration
 
+    def synthesize_speech_with_timestamps(
+        self,
+        text: str,
+        voice_id: str,
+        output_path: str,
+    ) -> Tuple[str, dict]:
+        """
+        Synthesize speech using ElevenLabs and return character timings.
+
+        Args:
+            text: Text to synthesize
+            voice_id: ElevenLabs voice ID
+            output_path: Path to save audio file
+
+        Returns:
+            Tuple of (output_path, alignment) where alignment holds the
+            ``characters``, ``character_start_times_seconds`` and
+            ``character_end_times_seconds`` lists for ``text``
+
+        Raises:
+            AIServiceError: If synthesis fails
+        """
+        logger.debug(f"Synthesizing speech with timestamps: {text[:50]}...")
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        def _synthesize():
+            url = f"{self.elevenlabs_base_url}/text-to-speech/{voice_id}/with-timestamps"
+
+            headers = {
+                "Accept": "application/json",
+                "Content-Type": "application/json",
+                "xi-api-key": self.elevenlabs_api_key,
+            }
+
+            data = {
+                "text": text,
+                "model_id": self.elevenlabs_model,
+                "voice_settings": {
+                    "stability": 0.5,
+                    "similarity_boost": 0.75,
+                }
+            }
+
+            with self._tts_slots:
+                response = self.http_session.post(url, json=data, headers=headers, timeout=60)
+
+            if response.status_code != 200:
+                raise AIServiceError(
+                    f"ElevenLabs API error: {response.status_code} - {response.text}"
+                )
+
+            return response.json()
+
+        result = self._retry_with_backoff(_synthesize, "ElevenLabs TTS with timestamps")
+
+        try:
+            audio_content = base64.b64decode(result["audio_base64"])
+            alignment = result["alignment"]
+        except (KeyError, TypeError, ValueError) as e:
+            raise AIServiceError(f"Unexpected ElevenLabs timestamps response: {e}")
+
+        # Save audio file
+        with open(output_path, "wb") as f:
+            f.write(audio_content)
+
+        logger.debug(f"Synthesized audio saved to {output_path}")
+        return str(output_path), alignment
+
+    def _group_segments(
+        self,
+        segments: List[TranslationSegment],
+    ) -> List[List[TranslationSegment]]:
+        """
+        Greedily group adjacent segments for combined TTS requests.
+
+        A segment joins the current group while the group still spans at most
+        MAX_MERGED_DURATION seconds and the gap to the previous segment is at
+        most MAX_MERGE_GAP seconds.
+
+        Args:
+            segments: Translation segments in timeline order
+
+        Returns:
+            List of segment groups, in order
+        """
+        groups = []
+        current = []
+
+        for seg in segments:
+            if current and (
+                seg.start - current[-1].end > self.MAX_MERGE_GAP
+                or seg.end - current[0].start > self.MAX_MERGED_DURATION
+            ):
+                groups.append(current)
+                current = []
+            current.append(seg)
+
+        if current:
+            groups.append(current)
+
+        return groups
+
     def synthesize_segments(
         self,
         segments: List[TranslationSegment],
@@ -427,9 +800,7 @@ Output (JSON array of {len(segments)} strings):"""
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        synthesized_segments = []
-
-        for seg in segments:
+        def _synthesize_one(seg: TranslationSegment) -> SynthesizedSegment:
             output_path = output_dir / f"segment_{seg.id:04d}.mp3"
 
             audio_path, duration = self.synthesize_speech(
@@ -438,7 +809,7 @@ Output (JSON array of {len(segments)} strings):"""
                 output_path=str(output_path),
             )
 
-            synthesized_segment = SynthesizedSegment(
+            return SynthesizedSegment(
                 id=seg.id,
                 start=seg.start,
                 end=seg.end,
@@ -446,7 +817,79 @@ Output (JSON array of {len(segments)} strings):"""
                 audio_path=audio_path,
                 actual_duration=duration,
             )
-            synthesized_segments.append(synthesized_segment)
+
+        def _synthesize_group(group: List[TranslationSegment]) -> List[SynthesizedSegment]:
+            if len(group) == 1:
+                return [_synthesize_one(group[0])]
+
+            # Remember where each segment's text starts in the combined request
+            text_offsets = []
+            parts = []
+            position = 0
+            for seg in group:
+                text_offsets.append(position)
+                parts.append(seg.translated_text)
+                position += len(seg.translated_text) + 1
+            text = " ".join(parts)
+
+            output_path = output_dir / f"group_{group[0].id:04d}.mp3"
+            audio_path, alignment = self.synthesize_speech_with_timestamps(
+                text=text,
+                voice_id=voice_id,
+                output_path=str(output_path),
+            )
+
+            starts = alignment.get("character_start_times_seconds") or []
+            ends = alignment.get("character_end_times_seconds") or []
+            if len(starts) != len(text) or len(ends) != len(text):
+                logger.warning(
+                    f"Alignment does not match text for segments {group[0].id}-{group[-1].id}, "
+                    "synthesizing them individually"
+                )
+                return [_synthesize_one(seg) for seg in group]
+
+            # Each segment runs from its first character to the next
+            # segment's first character (the last one to the final character)
+            boundaries = [starts[offset] for offset in text_offsets] + [ends[-1]]
+
+            return [
+                SynthesizedSegment(
+                    id=seg.id,
+                    start=seg.start,
+                    end=seg.end,
+                    text=seg.translated_text,
+                    audio_path=audio_path,
+                    actual_duration=boundaries[i + 1] - boundaries[i],
+                    audio_offset=boundaries[i],
+                )
+                for i, seg in enumerate(group)
+            ]
+
+        # Short adjacent segments share one request so per-request latency
+        # is amortized; mock synthesis has no timestamps endpoint.
+        if self.mock_mode:
+            groups = [[seg] for seg in segments]
+        else:
+            groups = self._group_segments(segments)
+        logger.info(f"Synthesizing {len(segments)} segments in {len(groups)} requests")
+
+        # Requests are independent and network-bound, so issue them
+        # concurrently. The account's concurrency limit is enforced per
+        # request by _tts_slots, shared with other jobs' synthesis.
+        # executor.map preserves segment order.
+        max_workers = max(1, min(settings.ELEVENLABS_CONCURRENCY, len(groups)))
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            synthesized_segments = [
+                synthesized
+                for group_segments in executor.map(_synthesize_group, groups)
+                for synthesized in group_segments
+            ]
+        except Exception:
+            # Don't spend API calls on segments of a job that already failed
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+        executor.shutdown(wait=True)
 
         logger.info(f"Synthesized {len(synthesized_segments)} audio segments")
         return synthesized_segments
@@ -469,7 +912,7 @@ Output (JSON array of {len(segments)} strings):"""
         }
 
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = self.http_session.get(url, headers=headers, timeout=30)
 
             if response.status_code != 200:
                 raise AIServiceError(
@@ -3,11 +3,13 @@
 from worker.tasks.process_job import (
     JobProcessor,
     JobProcessingError,
+    get_ai_service,
     process_job,
 )
 
 __all__ = [
     "JobProcessor",
     "JobProcessingError",
+    "get_ai_service",
     "process_job",
 ]
@@ -1,25 +1,34 @@
 """Job processing pipeline for video dubbing."""
 
+import concurrent.futures
+import json
 import logging
 import os
 import shutil
 import tempfile
+import threading
 import time
+import wave
 from pathlib import Path
-from typing import Optional, Callable, List
+from typing import Optional, Callable, List, Tuple
+
+import numpy as np
 
 from dubwizard_shared import JobStatus, TranscriptionSegment, TranslationSegment, SynthesizedSegment, JobService, S3Service, shared_settings as settings
+from dubwizard_shared.constants import LANGUAGE_CODES
 from worker.services.ai_service import AIService, AIServiceError
 from worker.utils.ffmpeg_helpers import (
-    extract_audio,
+    extract_audio_multi,
+    extract_audio_from_stream,
     get_video_duration,
-    get_audio_duration,
-    mux_audio_video,
-    concatenate_audio_files,
-    convert_audio_format,
+    mux_audio_video_with_subs,
+    decode_audio_to_numpy,
+    stream_audio_to_array,
+    decode_audio_to_pcm,
+    encode_pcm_to_file,
     FFmpegError,
 )
-from worker.utils.subtitle_generator import save_srt, SubtitleError
+from worker.utils.subtitle_generator import save_srt_pair, SubtitleError
 
 logger = logging.getLogger(__name__)
 
@@ -29,12 +38,76 @@ class JobProcessingError(Exception):
     pass
 
 
+# Process-wide AI service, shared by every job so clients, HTTP connections
+# and local models are initialized once
+_AI_SERVICE: Optional[AIService] = None
+_AI_SERVICE_LOCK = threading.Lock()
+
+
+def get_ai_service() -> AIService:
+    """
+    Get the process-wide AIService instance, creating it on first use.
+
+    Returns:
+        Shared AIService instance
+    """
+    global _AI_SERVICE
+    if _AI_SERVICE is None:
+        with _AI_SERVICE_LOCK:
+            if _AI_SERVICE is None:
+                _AI_SERVICE = AIService()
+    return _AI_SERVICE
+
+
+def _fast_rmtree(path: str) -> int:
+    """
+    Remove a directory tree in a single pass.
+
+    Uses the file types cached by ``os.scandir`` instead of stat'ing each
+    entry, so every file costs one unlink. Symlinks are unlinked, never
+    followed.
+
+    Args:
+        path: Directory to remove
+
+    Returns:
+        Number of files removed
+    """
+    file_count = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                file_count += _fast_rmtree(entry.path)
+            else:
+                os.unlink(entry.path)
+                file_count += 1
+    os.rmdir(path)
+    return file_count
+
+
 class JobProcessor:
     """Processor for video dubbing jobs."""
 
     # Maximum video duration in seconds
     MAX_VIDEO_DURATION = settings.MAX_VIDEO_DURATION_SECONDS
 
+    # Thread pool size for independent pipeline steps (translation, subtitles, uploads)
+    MAX_WORKERS = 4
+
+    # Transcribed segments sent per translation request
+    TRANSLATION_BATCH_SIZE = 8
+
+    # Sample rate of the assembled dubbed audio track
+    DUBBED_SAMPLE_RATE = 44100
+
+    # Minimum free space required to use WORKER_TMPFS_DIR for a job; this much
+    # is reserved for each job running there
+    TMPFS_MIN_FREE_BYTES = 500 * 1024 * 1024
+
+    # Space reserved in WORKER_TMPFS_DIR by jobs running in this process
+    _tmpfs_lock = threading.Lock()
+    _tmpfs_reserved_bytes = 0
+
     def __init__(
         self,
         s3_service,
@@ -47,11 +120,11 @@ class JobProcessor:
         Args:
             s3_service: S3 service for file operations
             job_service: Job service for database operations
-            ai_service: AI service for transcription/translation/TTS (optional, created if not provided)
+            ai_service: AI service for transcription/translation/TTS (optional, shared instance if not provided)
         """
         self.s3_service = s3_service
         self.job_service = job_service
-        self.ai_service = ai_service or AIService()
+        self.ai_service = ai_service or get_ai_service()
 
     def process_job(
         self,
@@ -62,16 +135,16 @@ class JobProcessor:
         Process a dubbing job through the complete pipeline.
 
         Pipeline steps:
-        1. Download video from S3
+        1. Download video from S3 (streamed into step 3 when enabled)
         2. Validate video duration (<= 60s)
-        3. Extract audio to WAV using FFmpeg
+        3. Extract audio to WAV using FFmpeg (or decode in-process with PyAV)
         4. Transcribe audio with Whisper (with timestamps)
-        5. Translate transcript to target language
+        5. Translate transcript to target language (in batches, overlapping step 4)
         6. Generate TTS audio via ElevenLabs
         7. Create timing-adjusted dubbed audio
-        8. Mux dubbed audio into video using FFmpeg
-        9. Generate SRT subtitle files
-        10. Upload outputs to S3
+        8. Generate SRT subtitle files (concurrently with steps 6-7)
+        9. Mux dubbed audio and subtitles into video using FFmpeg
+        10. Upload outputs to S3 (in parallel)
         11. Mark job as completed
 
         Args:
@@ -95,9 +168,17 @@ class JobProcessor:
         logger.info(f"[{job_id}] Job config: source={job.source_language}, target={job.target_language}, voice={job.voice_id}")
 
         # Create temporary directory for processing
-        temp_dir = tempfile.mkdtemp(prefix=f"dubwizard_{job_id}_")
+        temp_root = self._get_temp_root(job_id)
+        try:
+            temp_dir = tempfile.mkdtemp(prefix=f"dubwizard_{job_id}_", dir=temp_root)
+        except Exception:
+            self._release_temp_root(temp_root)
+            raise
         logger.info(f"[{job_id}] Created temp directory: {temp_dir}")
 
+        # Pool for pipeline steps that can overlap (translation, subtitles, uploads)
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=self.MAX_WORKERS)
+
         try:
             # Update progress helper
             def update_progress(status: JobStatus, progress: int):
@@ -107,9 +188,28 @@ class JobProcessor:
                 elapsed = time.time() - start_time
                 logger.info(f"[{job_id}] {status} ({progress}%) - elapsed: {elapsed:.1f}s")
 
-            # Step 1: Download video from S3
             update_progress(JobStatus.PROCESSING, 0)
-            video_path = self._download_video(job_id, job.input_s3_key, temp_dir)
+
+            # Reuse the outputs of an identical earlier job if there is one
+            cache_key = self._get_cache_key(job_id, job) if settings.ENABLE_RESULT_CACHE else None
+            if cache_key and self._complete_from_cache(job_id, cache_key):
+                update_progress(JobStatus.DONE, 100)
+                total_time = time.time() - start_time
+                logger.info(f"[{job_id}] Job completed from result cache in {total_time:.1f}s")
+                return True
+
+            # Step 1: Download video from S3 (streamed into FFmpeg so step 3
+            # audio extraction overlaps with the download)
+            audio_path = Path(temp_dir) / "audio.wav"
+            # In-process decoding hands samples straight to local Whisper
+            decode_in_process = settings.USE_PYAV_EXTRACT and settings.WHISPER_BATCH_SIZE > 0
+            if settings.WORKER_STREAM_EXTRACT and not decode_in_process:
+                video_path, audio_extracted = self._download_and_extract_audio(
+                    job_id, job.input_s3_key, temp_dir, str(audio_path)
+                )
+            else:
+                video_path = self._download_video(job_id, job.input_s3_key, temp_dir)
+                audio_extracted = False
 
             # Step 2: Validate video duration
             duration = get_video_duration(video_path)
@@ -126,17 +226,51 @@ class JobProcessor:
             update_progress(JobStatus.TRANSCRIBING, 5)
 
             # Step 3: Extract audio to WAV (16kHz mono for Whisper)
-            audio_path = Path(temp_dir) / "audio.wav"
-            logger.info(f"[{job_id}] Extracting audio...")
-            extract_audio(video_path, str(audio_path), sample_rate=16000, channels=1)
+            # (single decode pass; add outputs here rather than re-decoding later)
+            if decode_in_process:
+                logger.info(f"[{job_id}] Decoding audio in-process...")
+                transcription_input = decode_audio_to_numpy(video_path, sample_rate=16000)
+            elif settings.WHISPER_BATCH_SIZE > 0 and not audio_extracted:
+                # Local Whisper takes samples directly; skip the WAV round-trip
+                logger.info(f"[{job_id}] Decoding audio through FFmpeg...")
+                transcription_input = stream_audio_to_array(video_path, sample_rate=16000)
+            else:
+                if not audio_extracted:
+                    logger.info(f"[{job_id}] Extracting audio...")
+                    extract_audio_multi(video_path, [
+                        (str(audio_path), {"acodec": "pcm_s16le", "ar": 16000, "ac": 1}),
+                    ])
+                transcription_input = str(audio_path)
             update_progress(JobStatus.TRANSCRIBING, 10)
 
-            # Step 4: Transcribe audio with Whisper
+            # Steps 4-5: Transcribe with Whisper and translate. Segments are
+            # handed to the pool in batches as they are transcribed, so
+            # translation of early segments overlaps with decoding of later ones.
             logger.info(f"[{job_id}] Transcribing audio with Whisper...")
-            transcription_segments = self.ai_service.transcribe_audio(
-                str(audio_path),
+            transcription_segments = []
+            translation_futures = []
+            batch = []
+
+            def submit_translation(batch: List[TranscriptionSegment]):
+                translation_futures.append(executor.submit(
+                    self.ai_service.translate_segments,
+                    batch,
+                    source_language=job.source_language,
+                    target_language=job.target_language,
+                ))
+
+            for segment in self.ai_service.transcribe_audio_stream(
+                transcription_input,
                 language="en",
-            )
+                batch_size=settings.WHISPER_BATCH_SIZE,
+            ):
+                transcription_segments.append(segment)
+                batch.append(segment)
+                if len(batch) == self.TRANSLATION_BATCH_SIZE:
+                    submit_translation(batch)
+                    batch = []
+            if batch:
+                submit_translation(batch)
 
             if not transcription_segments:
                 raise JobProcessingError(
@@ -146,16 +280,23 @@ class JobProcessor:
             logger.info(f"[{job_id}] Transcribed {len(transcription_segments)} segments")
             update_progress(JobStatus.TRANSLATING, 25)
 
-            # Step 5: Translate segments
             logger.info(f"[{job_id}] Translating to {job.target_language}...")
-            translation_segments = self.ai_service.translate_segments(
-                transcription_segments,
-                source_language=job.source_language,
-                target_language=job.target_language,
-            )
+            translation_segments = []
+            for i, future in enumerate(translation_futures, start=1):
+                translation_segments.extend(future.result())
+                update_progress(JobStatus.TRANSLATING, 25 + 25 * i // len(translation_futures))
             logger.info(f"[{job_id}] Translated {len(translation_segments)} segments")
             update_progress(JobStatus.SYNTHESIZING, 50)
 
+            # Step 8 (early): Generate subtitle files. They only depend on the
+            # translation, so they are written on the pool while speech is
+            # synthesized and the dubbed track is assembled.
+            source_srt_path = Path(temp_dir) / "source.srt"
+            target_srt_path = Path(temp_dir) / "target.srt"
+            srt_future = executor.submit(
+                save_srt_pair, translation_segments, str(source_srt_path), str(target_srt_path)
+            )
+
             # Step 6: Synthesize speech with ElevenLabs
             synth_dir = Path(temp_dir) / "synth"
             logger.info(f"[{job_id}] Synthesizing speech with voice {job.voice_id}...")
@@ -174,34 +315,37 @@ class JobProcessor:
             )
             update_progress(JobStatus.PROCESSING_VIDEO, 80)
 
-            # Step 8: Generate subtitle files
-            logger.info(f"[{job_id}] Generating subtitle files...")
-            source_srt_path = Path(temp_dir) / "source.srt"
-            target_srt_path = Path(temp_dir) / "target.srt"
-
-            save_srt(translation_segments, str(source_srt_path), use_translated=False)
-            save_srt(translation_segments, str(target_srt_path), use_translated=True)
+            srt_future.result()
             update_progress(JobStatus.PROCESSING_VIDEO, 85)
 
-            # Step 9: Mux audio into video
-            logger.info(f"[{job_id}] Muxing dubbed audio into video...")
+            # Step 9: Mux dubbed audio and both subtitle tracks into the video
+            # in a single FFmpeg pass
+            logger.info(f"[{job_id}] Muxing dubbed audio and subtitles into video...")
             output_video_path = Path(temp_dir) / "dubbed_video.mp4"
-            mux_audio_video(
+            mux_audio_video_with_subs(
                 video_path,
                 str(dubbed_audio_path),
+                str(source_srt_path),
+                str(target_srt_path),
                 str(output_video_path),
+                source_language=LANGUAGE_CODES.get(job.source_language, "und"),
+                target_language=LANGUAGE_CODES.get(job.target_language, "und"),
             )
             update_progress(JobStatus.PROCESSING_VIDEO, 90)
 
-            # Step 10: Upload outputs to S3
+            # Step 10: Upload outputs to S3 (in parallel). The raw SRTs are
+            # still uploaded for clients that want them separately.
             logger.info(f"[{job_id}] Uploading outputs to S3...")
             output_video_key = f"outputs/{job_id}_dubbed.mp4"
             source_subtitle_key = f"subtitles/{job_id}_source.srt"
             target_subtitle_key = f"subtitles/{job_id}_target.srt"
 
-            self.s3_service.upload_file_with_retry(str(output_video_path), output_video_key)
-            self.s3_service.upload_file_with_retry(str(source_srt_path), source_subtitle_key)
-            self.s3_service.upload_file_with_retry(str(target_srt_path), target_subtitle_key)
+            uploads = [
+                (str(output_video_path), output_video_key),
+                (str(source_srt_path), source_subtitle_key),
+                (str(target_srt_path), target_subtitle_key),
+            ]
+            list(executor.map(lambda upload: self.s3_service.upload_file_with_retry(*upload), uploads))
             update_progress(JobStatus.PROCESSING_VIDEO, 95)
 
             # Step 11: Mark job as completed
@@ -211,6 +355,13 @@ class JobProcessor:
                 source_subtitle_key=source_subtitle_key,
                 target_subtitle_key=target_subtitle_key,
             )
+            if cache_key:
+                self._store_cache_entry(job_id, cache_key, {
+                    "output_video_key": output_video_key,
+                    "source_subtitle_key": source_subtitle_key,
+                    "target_subtitle_key": target_subtitle_key,
+                    "video_duration": duration,
+                })
             update_progress(JobStatus.DONE, 100)
 
             total_time = time.time() - start_time
@@ -246,8 +397,139 @@ class JobProcessor:
             raise JobProcessingError(error_msg) from e
 
         finally:
+            # Let in-flight work finish before removing its files
+            executor.shutdown(wait=True, cancel_futures=True)
+
             # Clean up temporary directory
             self._cleanup_temp_dir(job_id, temp_dir)
+            self._release_temp_root(temp_root)
+
+    def _get_cache_key(self, job_id: str, job) -> Optional[str]:
+        """
+        Get the result cache key for a job.
+
+        The key combines the input file's ETag with the language pair and
+        voice, so only a true repeat of the same work hits the cache.
+
+        Args:
+            job_id: Job ID for logging
+            job: Job being processed
+
+        Returns:
+            S3 key of the cache pointer, or None if it can't be determined
+        """
+        try:
+            etag = self.s3_service.get_etag(job.input_s3_key)
+        except Exception as e:
+            logger.warning(f"[{job_id}] Result cache lookup failed: {e}")
+            return None
+
+        if not etag:
+            return None
+
+        return f"cache/{etag}_{job.source_language}_{job.target_language}_{job.voice_id}.json"
+
+    def _complete_from_cache(self, job_id: str, cache_key: str) -> bool:
+        """
+        Complete a job from a cached earlier result.
+
+        The cached outputs are copied to this job's output keys server-side,
+        so nothing is downloaded. Any failure falls back to normal processing.
+
+        Args:
+            job_id: Job ID to complete
+            cache_key: S3 key of the cache pointer
+
+        Returns:
+            True if the job was completed from the cache
+        """
+        try:
+            pointer = self.s3_service.get_object_if_exists(cache_key)
+            if pointer is None:
+                return False
+
+            cached = json.loads(pointer)
+            output_video_key = f"outputs/{job_id}_dubbed.mp4"
+            source_subtitle_key = f"subtitles/{job_id}_source.srt"
+            target_subtitle_key = f"subtitles/{job_id}_target.srt"
+
+            self.s3_service.copy_file(cached["output_video_key"], output_video_key)
+            self.s3_service.copy_file(cached["source_subtitle_key"], source_subtitle_key)
+            self.s3_service.copy_file(cached["target_subtitle_key"], target_subtitle_key)
+        except Exception as e:
+            logger.warning(f"[{job_id}] Result cache entry {cache_key} unusable, processing normally: {e}")
+            return False
+
+        logger.info(f"[{job_id}] Result cache hit: {cache_key}")
+        self.job_service.update_video_duration(job_id, cached["video_duration"])
+        self.job_service.complete_job(
+            job_id,
+            output_video_key=output_video_key,
+            source_subtitle_key=source_subtitle_key,
+            target_subtitle_key=target_subtitle_key,
+        )
+        return True
+
+    def _store_cache_entry(self, job_id: str, cache_key: str, entry: dict):
+        """
+        Record a completed job's outputs in the result cache.
+
+        Args:
+            job_id: Job ID for logging
+            cache_key: S3 key of the cache pointer
+            entry: Output keys and video duration of the job
+        """
+        try:
+            self.s3_service.put_object(cache_key, json.dumps(entry).encode("utf-8"))
+        except Exception as e:
+            logger.warning(f"[{job_id}] Failed to store result cache entry: {e}")
+
+    def _get_temp_root(self, job_id: str) -> Optional[str]:
+        """
+        Get the directory to create the job's temp directory in.
+
+        Uses WORKER_TMPFS_DIR (e.g. /dev/shm) so intermediate files stay in
+        RAM, unless it is unset, missing, or low on free space. Parallel jobs
+        share the directory, so each one reserves TMPFS_MIN_FREE_BYTES until
+        ``_release_temp_root`` is called; space reserved by other jobs doesn't
+        count as free.
+
+        Args:
+            job_id: Job ID for logging
+
+        Returns:
+            Directory path, or None for the system default temp directory
+        """
+        tmpfs_dir = settings.WORKER_TMPFS_DIR
+        if not tmpfs_dir:
+            return None
+
+        cls = JobProcessor
+        with cls._tmpfs_lock:
+            try:
+                free_bytes = shutil.disk_usage(tmpfs_dir).free - cls._tmpfs_reserved_bytes
+            except OSError as e:
+                logger.warning(f"[{job_id}] Temp directory {tmpfs_dir} unavailable ({e}), using default")
+                return None
+
+            if free_bytes < self.TMPFS_MIN_FREE_BYTES:
+                logger.warning(
+                    f"[{job_id}] Only {max(free_bytes, 0) / (1024 * 1024):.0f} MB free in {tmpfs_dir}, using default temp directory"
+                )
+                return None
+
+            cls._tmpfs_reserved_bytes += self.TMPFS_MIN_FREE_BYTES
+
+        return tmpfs_dir
+
+    def _release_temp_root(self, temp_root: Optional[str]) -> None:
+        """Return the tmpfs space reserved by ``_get_temp_root``."""
+        if temp_root is None:
+            return
+
+        cls = JobProcessor
+        with cls._tmpfs_lock:
+            cls._tmpfs_reserved_bytes -= self.TMPFS_MIN_FREE_BYTES
 
     def _download_video(self, job_id: str, s3_key: str, temp_dir: str) -> str:
         """
@@ -286,6 +568,69 @@ class JobProcessor:
         logger.info(f"[{job_id}] Video downloaded: {file_size:.2f} MB")
         return str(video_path)
 
+    def _download_and_extract_audio(
+        self, job_id: str, s3_key: str, temp_dir: str, audio_path: str
+    ) -> Tuple[str, bool]:
+        """
+        Stream video from S3 into FFmpeg while saving a copy for muxing.
+
+        Falls back to a regular download if the stream can't be read, and
+        leaves extraction to step 3 if FFmpeg can't decode from a pipe (e.g.
+        MP4s with the moov atom at the end).
+
+        Args:
+            job_id: Job ID for logging
+            s3_key: S3 key of the video
+            temp_dir: Temporary directory path
+            audio_path: Path for the extracted WAV file
+
+        Returns:
+            Tuple of (path to downloaded video file, whether audio was extracted)
+
+        Raises:
+            JobProcessingError: If download fails
+        """
+        video_path = Path(temp_dir) / "input.mp4"
+
+        logger.info(f"[{job_id}] Streaming video from S3: {s3_key}")
+
+        try:
+            stream = self.s3_service.get_object_stream(s3_key)
+        except Exception as e:
+            logger.warning(f"[{job_id}] Could not open S3 stream ({e}), downloading instead")
+            return self._download_video(job_id, s3_key, temp_dir), False
+
+        try:
+            extract_audio_from_stream(
+                stream, audio_path, sample_rate=16000, channels=1, tee_path=str(video_path)
+            )
+            # A WAV without samples would read as "no speech"; retry from the file
+            audio_extracted = self._wav_has_frames(audio_path)
+            if not audio_extracted:
+                logger.warning(f"[{job_id}] Streaming audio extraction produced no audio, will extract from file")
+        except FFmpegError as e:
+            # The full video was still saved; extract from the file instead
+            logger.warning(f"[{job_id}] Streaming audio extraction failed, will extract from file: {e}")
+            audio_extracted = False
+        except Exception as e:
+            logger.warning(f"[{job_id}] S3 stream failed ({e}), downloading instead")
+            return self._download_video(job_id, s3_key, temp_dir), False
+        finally:
+            stream.close()
+
+        file_size = video_path.stat().st_size / (1024 * 1024)  # MB
+        logger.info(f"[{job_id}] Video downloaded: {file_size:.2f} MB")
+        return str(video_path), audio_extracted
+
+    @staticmethod
+    def _wav_has_frames(wav_path: str) -> bool:
+        """Check that a WAV file exists and holds at least one audio frame."""
+        try:
+            with wave.open(wav_path, "rb") as wav:
+                return wav.getnframes() > 0
+        except (wave.Error, EOFError, OSError):
+            return False
+
     def _create_dubbed_audio(
         self,
         job_id: str,
@@ -296,8 +641,9 @@ class JobProcessor:
         """
         Create a single dubbed audio track from synthesized segments.
 
-        This method concatenates all synthesized audio segments into a single
-        audio file that matches the video duration.
+        Each segment is decoded to PCM once and written into a silent buffer
+        spanning the video at its target start time (overlapping speech is
+        mixed), then the buffer is encoded in a single FFmpeg call.
 
         Args:
             job_id: Job ID for logging
@@ -311,22 +657,47 @@ class JobProcessor:
         if not synthesized_segments:
             raise JobProcessingError("No audio segments to concatenate")
 
-        # Get all audio file paths
-        audio_files = [seg.audio_path for seg in synthesized_segments]
+        sample_rate = self.DUBBED_SAMPLE_RATE
 
         # Log segment info
         total_synth_duration = sum(seg.actual_duration for seg in synthesized_segments)
         logger.info(
-            f"[{job_id}] Concatenating {len(audio_files)} segments "
+            f"[{job_id}] Placing {len(synthesized_segments)} segments "
             f"(total synth duration: {total_synth_duration:.2f}s, video duration: {video_duration:.2f}s)"
         )
 
-        # Concatenate all audio segments
+        # Decode each audio file once, in parallel; each is a separate FFmpeg
+        # process. Grouped segments share a file and are sliced out below.
+        audio_paths = list(dict.fromkeys(seg.audio_path for seg in synthesized_segments))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.MAX_WORKERS) as executor:
+            decoded = dict(zip(audio_paths, executor.map(
+                lambda path: decode_audio_to_pcm(path, sample_rate=sample_rate),
+                audio_paths,
+            )))
+
+        # int32 accumulator so overlapping segments can be mixed without overflow
+        buffer = np.zeros(int(video_duration * sample_rate), dtype=np.int32)
+        for seg in synthesized_segments:
+            start = int(seg.start * sample_rate)
+            if start >= len(buffer):
+                logger.warning(f"[{job_id}] Segment {seg.id} starts after the end of the video, skipping")
+                continue
+
+            samples = decoded[seg.audio_path]
+            if seg.audio_offset is not None:
+                offset = int(seg.audio_offset * sample_rate)
+                samples = samples[offset:offset + int(seg.actual_duration * sample_rate)]
+
+            samples = samples[:len(buffer) - start]
+            buffer[start:start + len(samples)] += samples
+
+        np.clip(buffer, -32768, 32767, out=buffer)
+
         dubbed_audio_path = Path(temp_dir) / "dubbed_audio.mp3"
-        concatenate_audio_files(audio_files, str(dubbed_audio_path))
+        encode_pcm_to_file(buffer.astype(np.int16), str(dubbed_audio_path), sample_rate=sample_rate)
 
-        # Verify the output
-        actual_duration = get_audio_duration(str(dubbed_audio_path))
+        # Duration is known from the sample count; no need to probe the output
+        actual_duration = len(buffer) / sample_rate
         logger.info(f"[{job_id}] Dubbed audio created: {actual_duration:.2f}s")
 
         return str(dubbed_audio_path)
@@ -340,12 +711,10 @@ class JobProcessor:
             temp_dir: Path to temporary directory
         """
         try:
-            if os.path.exists(temp_dir):
-                # Count files before cleanup
-                file_count = sum(1 for _ in Path(temp_dir).rglob("*") if _.is_file())
-
-                shutil.rmtree(temp_dir)
-                logger.info(f"[{job_id}] Cleaned up temp directory ({file_count} files)")
+            file_count = _fast_rmtree(temp_dir)
+            logger.info(f"[{job_id}] Cleaned up temp directory ({file_count} files)")
+        except FileNotFoundError:
+            pass
         except Exception as e:
             logger.warning(f"[{job_id}] Failed to clean up temp directory: {e}")
 
@@ -0,0 +1,191 @@
+"""Tests for the AI service."""
+
+import base64
+import threading
+import time
+from unittest.mock import patch, MagicMock
+
+import pytest
+
+from worker.services.ai_service import AIService
+from worker.models.segments import TranslationSegment
+
+
+def _segment(seg_id, start, end, text=None):
+    return TranslationSegment(
+        id=seg_id, start=start, end=end,
+        original_text=f"Line {seg_id}", translated_text=text or f"Line {seg_id}",
+        source_language="english", target_language="hindi",
+    )
+
+
+@pytest.fixture
+def live_service():
+    """AIService configured for real (mocked-out) ElevenLabs requests."""
+    with patch("worker.services.ai_service.settings") as mock_settings:
+        mock_settings.ELEVENLABS_CONCURRENCY = 2
+        mock_settings.USE_MOCK_AI = False
+        mock_settings.GROQ_API_KEY = None
+        yield AIService(openai_api_key="sk-test", elevenlabs_api_key="el-test")
+
+
+class TestGroupSegments:
+    """Tests for AIService._group_segments."""
+
+    def test_close_segments_merged(self, live_service):
+        """Test segments with short gaps share a group."""
+        segments = [_segment(1, 0.0, 2.0), _segment(2, 2.5, 4.0), _segment(3, 4.2, 6.0)]
+
+        assert live_service._group_segments(segments) == [segments]
+
+    def test_gap_at_limit_merged(self, live_service):
+        """Test a gap of exactly MAX_MERGE_GAP still merges."""
+        segments = [_segment(1, 0.0, 2.0), _segment(2, 3.0, 4.0)]
+
+        assert live_service._group_segments(segments) == [segments]
+
+    def test_gap_over_limit_breaks_group(self, live_service):
+        """Test a gap over MAX_MERGE_GAP starts a new group."""
+        segments = [_segment(1, 0.0, 2.0), _segment(2, 3.1, 4.0), _segment(3, 4.5, 5.0)]
+
+        assert live_service._group_segments(segments) == [segments[:1], segments[1:]]
+
+    def test_span_at_limit_merged(self, live_service):
+        """Test a group may span exactly MAX_MERGED_DURATION."""
+        segments = [_segment(1, 0.0, 10.0), _segment(2, 10.5, 15.0)]
+
+        assert live_service._group_segments(segments) == [segments]
+
+    def test_span_over_limit_breaks_group(self, live_service):
+        """Test a segment that would stretch the group past MAX_MERGED_DURATION starts a new one."""
+        segments = [
+            _segment(1, 0.0, 7.0), _segment(2, 7.5, 14.0),
+            _segment(3, 14.5, 16.0), _segment(4, 16.5, 18.0),
+        ]
+
+        assert live_service._group_segments(segments) == [segments[:2], segments[2:]]
+
+    def test_empty(self, live_service):
+        """Test no segments gives no groups."""
+        assert live_service._group_segments([]) == []
+
+
+class TestSynthesizeSegments:
+    """Tests for AIService.synthesize_segments."""
+
+    @staticmethod
+    def _segments(count):
+        # Gaps wider than MAX_MERGE_GAP keep every segment in its own request
+        return [
+            TranslationSegment(
+                id=i, start=i * 3, end=i * 3 + 1,
+                original_text=f"Line {i}", translated_text=f"पंक्ति {i}",
+                source_language="english", target_language="hindi",
+            )
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def _post(alignment):
+        """Fake ElevenLabs POST: timestamps JSON for groups, MP3 bytes otherwise."""
+        def post(url, **kwargs):
+            if url.endswith("/with-timestamps"):
+                return MagicMock(status_code=200, json=MagicMock(return_value={
+                    "audio_base64": base64.b64encode(b"group-mp3").decode(),
+                    "alignment": alignment(kwargs["json"]["text"]),
+                }))
+            return MagicMock(status_code=200, content=b"mp3")
+        return post
+
+    @patch("worker.utils.ffmpeg_helpers.get_audio_duration", return_value=1.0)
+    def test_group_split_by_alignment(self, mock_duration, live_service, tmp_path):
+        """Test a merged request is split at each segment's first character."""
+        segments = [_segment(1, 0.0, 1.0, "Hello"), _segment(2, 1.2, 2.0, "World")]
+
+        def alignment(text):
+            # 0.1s per character of "Hello World"
+            return {
+                "characters": list(text),
+                "character_start_times_seconds": [i * 0.1 for i in range(len(text))],
+                "character_end_times_seconds": [(i + 1) * 0.1 for i in range(len(text))],
+            }
+
+        live_service.http_session.post = MagicMock(side_effect=self._post(alignment))
+
+        result = live_service.synthesize_segments(segments, "voice", str(tmp_path))
+
+        live_service.http_session.post.assert_called_once()
+        assert [seg.id for seg in result] == [1, 2]
+        assert all(seg.audio_path == str(tmp_path / "group_0001.mp3") for seg in result)
+        assert (tmp_path / "group_0001.mp3").read_bytes() == b"group-mp3"
+        assert result[0].audio_offset == pytest.approx(0.0)
+        assert result[0].actual_duration == pytest.approx(0.6)
+        assert result[1].audio_offset == pytest.approx(0.6)
+        assert result[1].actual_duration == pytest.approx(0.5)
+        assert (result[1].start, result[1].end) == (1.2, 2.0)
+
+    @patch("worker.utils.ffmpeg_helpers.get_audio_duration", return_value=1.0)
+    def test_alignment_mismatch_falls_back(self, mock_duration, live_service, tmp_path):
+        """Test a group whose alignment doesn't match its text is synthesized per segment."""
+        segments = [_segment(1, 0.0, 1.0, "Hello"), _segment(2, 1.2, 2.0, "World")]
+
+        def alignment(text):
+            # One character short of the request text
+            return {
+                "characters": list(text[:-1]),
+                "character_start_times_seconds": [0.0] * (len(text) - 1),
+                "character_end_times_seconds": [0.1] * (len(text) - 1),
+            }
+
+        live_service.http_session.post = MagicMock(side_effect=self._post(alignment))
+
+        result = live_service.synthesize_segments(segments, "voice", str(tmp_path))
+
+        urls = [call.args[0] for call in live_service.http_session.post.call_args_list]
+        assert len(urls) == 3
+        assert sum(url.endswith("/with-timestamps") for url in urls) == 1
+        assert [seg.audio_path for seg in result] == [
+            str(tmp_path / "segment_0001.mp3"), str(tmp_path / "segment_0002.mp3"),
+        ]
+        assert all(seg.audio_offset is None for seg in result)
+        assert all(seg.actual_duration == 1.0 for seg in result)
+
+    @patch("worker.utils.ffmpeg_helpers.get_audio_duration", return_value=1.0)
+    @patch("worker.services.ai_service.settings")
+    def test_concurrent_jobs_share_request_limit(self, mock_settings, mock_duration, tmp_path):
+        """Test two jobs synthesizing at once never exceed ELEVENLABS_CONCURRENCY."""
+        mock_settings.ELEVENLABS_CONCURRENCY = 3
+        mock_settings.USE_MOCK_AI = False
+        mock_settings.GROQ_API_KEY = None
+        service = AIService(openai_api_key="sk-test", elevenlabs_api_key="el-test")
+
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def post(*args, **kwargs):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return MagicMock(status_code=200, content=b"mp3")
+
+        service.http_session.post = MagicMock(side_effect=post)
+
+        jobs = [
+            threading.Thread(
+                target=service.synthesize_segments,
+                args=(self._segments(8), "voice", str(tmp_path / f"job{i}")),
+            )
+            for i in range(2)
+        ]
+        for job in jobs:
+            job.start()
+        for job in jobs:
+            job.join()
+
+        assert service.http_session.post.call_count == 16
+        assert peak <= 3
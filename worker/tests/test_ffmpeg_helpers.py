@@ -1,67 +1,269 @@
 """Tests for FFmpeg helper functions."""
 
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
+import asyncio
+import io
 import json
 import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import numpy as np
 
 from worker.utils.ffmpeg_helpers import (
     extract_audio,
+    extract_audio_multi,
+    extract_audio_from_stream,
     get_video_duration,
     get_video_metadata,
     mux_audio_video,
+    mux_audio_video_with_subs,
     concatenate_audio_files,
+    decode_audio_to_numpy,
+    stream_audio_to_array,
+    decode_audio_to_pcm,
+    encode_pcm_to_file,
     convert_audio_format,
     get_audio_duration,
+    clear_probe_cache,
     FFmpegError,
     _run_ffmpeg,
+    _run_ffmpeg_async,
     _run_ffprobe,
+    extract_audio_async,
+    concatenate_audio_files_async,
 )
 
 
+# What FFmpeg/FFprobe print when an input file is missing
+ENOENT_STDERR = "nonexistent.mp4: No such file or directory\n"
+
+# A minimal SRT file with one entry
+SRT_ENTRY = "1\n00:00:00,000 --> 00:00:01,000\nHello\n"
+
+
+def _ffmpeg_process(returncode=0, stderr="", stdout=b""):
+    """Build a mock Popen process for _run_ffmpeg and _run_ffmpeg_pipe."""
+    proc = MagicMock()
+    proc.stdout = io.BytesIO(stdout)
+    proc.stderr = io.BytesIO(stderr.encode())
+    proc.wait.return_value = returncode
+    return proc
+
+
 class TestRunFFmpeg:
     """Tests for _run_ffmpeg helper."""
 
-    @patch("subprocess.run")
-    def test_run_ffmpeg_success(self, mock_run):
+    @patch("subprocess.Popen")
+    def test_run_ffmpeg_success(self, mock_popen):
         """Test successful FFmpeg execution."""
-        mock_run.return_value = MagicMock(returncode=0, stderr="", stdout="")
+        mock_popen.return_value = _ffmpeg_process()
 
         result = _run_ffmpeg(["ffmpeg", "-version"], "test")
 
         assert result.returncode == 0
-        mock_run.assert_called_once()
+        mock_popen.assert_called_once()
 
-    @patch("subprocess.run")
-    def test_run_ffmpeg_failure(self, mock_run):
+    @patch("subprocess.Popen")
+    def test_run_ffmpeg_failure(self, mock_popen):
         """Test FFmpeg execution failure."""
-        mock_run.return_value = MagicMock(returncode=1, stderr="Error message")
+        mock_popen.return_value = _ffmpeg_process(returncode=1, stderr="Error message\n")
 
         with pytest.raises(FFmpegError) as exc_info:
             _run_ffmpeg(["ffmpeg", "-invalid"], "test")
 
         assert "FFmpeg failed" in str(exc_info.value)
+        assert "Error message" in str(exc_info.value)
 
-    @patch("subprocess.run")
-    def test_run_ffmpeg_timeout(self, mock_run):
+    @patch("subprocess.Popen")
+    def test_run_ffmpeg_timeout(self, mock_popen):
         """Test FFmpeg timeout."""
-        mock_run.side_effect = subprocess.TimeoutExpired(cmd="ffmpeg", timeout=300)
+        proc = _ffmpeg_process()
+        proc.wait.side_effect = [subprocess.TimeoutExpired(cmd="ffmpeg", timeout=300), -9]
+        mock_popen.return_value = proc
 
         with pytest.raises(FFmpegError) as exc_info:
             _run_ffmpeg(["ffmpeg", "-version"], "test")
 
         assert "timed out" in str(exc_info.value)
+        proc.kill.assert_called_once()
 
-    @patch("subprocess.run")
-    def test_run_ffmpeg_not_found(self, mock_run):
+    @patch("subprocess.Popen")
+    def test_run_ffmpeg_not_found(self, mock_popen):
         """Test FFmpeg not installed."""
-        mock_run.side_effect = FileNotFoundError()
+        mock_popen.side_effect = FileNotFoundError()
 
         with pytest.raises(FFmpegError) as exc_info:
             _run_ffmpeg(["ffmpeg", "-version"], "test")
 
         assert "not installed" in str(exc_info.value)
 
+    @patch("subprocess.Popen")
+    def test_run_ffmpeg_skips_close_fds(self, mock_popen):
+        """Test FFmpeg is spawned without the close_fds sweep."""
+        mock_popen.return_value = _ffmpeg_process()
+
+        _run_ffmpeg(["ffmpeg", "-version"], "test")
+
+        assert mock_popen.call_args.kwargs["close_fds"] is False
+
+    @patch("subprocess.Popen")
+    def test_run_ffmpeg_missing_input(self, mock_popen):
+        """Test FFmpeg's missing-input error maps to FileNotFoundError."""
+        mock_popen.return_value = _ffmpeg_process(returncode=1, stderr=ENOENT_STDERR)
+
+        with pytest.raises(FileNotFoundError):
+            _run_ffmpeg(["ffmpeg", "-i", "nonexistent.mp4"], "test")
+
+    @patch("worker.utils.ffmpeg_helpers.STDERR_TAIL_LINES", 2)
+    @patch("subprocess.Popen")
+    def test_run_ffmpeg_keeps_stderr_tail(self, mock_popen):
+        """Test only the last stderr lines are kept."""
+        mock_popen.return_value = _ffmpeg_process(
+            returncode=1, stderr="banner\nline 1\nline 2\nfatal error\n"
+        )
+
+        with pytest.raises(FFmpegError) as exc_info:
+            _run_ffmpeg(["ffmpeg", "-i", "in.mp4"], "test")
+
+        assert "fatal error" in str(exc_info.value)
+        assert "banner" not in str(exc_info.value)
+
+    @patch("subprocess.Popen")
+    def test_run_ffmpeg_writes_input(self, mock_popen):
+        """Test text input is written to FFmpeg's stdin."""
+        proc = _ffmpeg_process()
+        mock_popen.return_value = proc
+
+        _run_ffmpeg(["ffmpeg", "-i", "pipe:0"], "test", input="file 'a.mp3'\n")
+
+        proc.stdin.write.assert_called_once_with(b"file 'a.mp3'\n")
+        proc.stdin.close.assert_called_once()
+
+    @patch("subprocess.Popen")
+    def test_run_ffmpeg_progress_callback(self, mock_popen):
+        """Test -progress updates reach the callback and not the stderr tail."""
+        mock_popen.return_value = _ffmpeg_process(
+            stderr="out_time_ms=500000\nprogress=continue\n"
+                   "out_time_ms=1000000\nprogress=end\n"
+        )
+        updates = []
+
+        result = _run_ffmpeg(["ffmpeg", "-i", "in.mp4", "out.wav"], "test", progress_cb=updates.append)
+
+        cmd = mock_popen.call_args[0][0]
+        assert cmd[:4] == ["ffmpeg", "-nostats", "-progress", "pipe:2"]
+        assert [u["out_time_ms"] for u in updates] == ["500000", "1000000"]
+        assert updates[-1]["progress"] == "end"
+        assert result.stderr == ""
+
+
+class TestRunFFmpegAsync:
+    """Tests for _run_ffmpeg_async function."""
+
+    @staticmethod
+    def _process(returncode=0, stdout=b"", stderr=b""):
+        proc = MagicMock(returncode=returncode)
+        proc.communicate = AsyncMock(return_value=(stdout, stderr))
+        proc.wait = AsyncMock(return_value=returncode)
+        return proc
+
+    @patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+    def test_run_ffmpeg_async_success(self, mock_exec):
+        """Test successful async FFmpeg execution."""
+        mock_exec.return_value = self._process(stdout=b"ok")
+
+        result = asyncio.run(_run_ffmpeg_async(["ffmpeg", "-version"], "test"))
+
+        assert result == b"ok"
+        assert mock_exec.call_args[0] == ("ffmpeg", "-version")
+
+    @patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+    def test_run_ffmpeg_async_failure(self, mock_exec):
+        """Test failed async FFmpeg execution."""
+        mock_exec.return_value = self._process(returncode=1, stderr=b"Error")
+
+        with pytest.raises(FFmpegError, match="FFmpeg failed"):
+            asyncio.run(_run_ffmpeg_async(["ffmpeg", "-invalid"], "test"))
+
+    @patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+    def test_run_ffmpeg_async_not_found(self, mock_exec):
+        """Test async FFmpeg not installed."""
+        mock_exec.side_effect = FileNotFoundError()
+
+        with pytest.raises(FFmpegError, match="not installed"):
+            asyncio.run(_run_ffmpeg_async(["ffmpeg"], "test"))
+
+    @patch("worker.utils.ffmpeg_helpers.ASYNC_FFMPEG_CONCURRENCY", 2)
+    @patch("asyncio.create_subprocess_exec", new_callable=AsyncMock)
+    def test_run_ffmpeg_async_bounded(self, mock_exec):
+        """Test that gathered jobs never exceed the concurrency limit."""
+        running = 0
+        peak = 0
+
+        async def communicate(input=None):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return b"", b""
+
+        def spawn(*args, **kwargs):
+            proc = self._process()
+            proc.communicate = communicate
+            return proc
+
+        mock_exec.side_effect = spawn
+
+        async def run_all():
+            await asyncio.gather(*(_run_ffmpeg_async(["ffmpeg"], "test") for _ in range(6)))
+
+        asyncio.run(run_all())
+
+        assert mock_exec.call_count == 6
+        assert peak == 2
+
+    @patch("worker.utils.ffmpeg_helpers._run_ffmpeg_async", new_callable=AsyncMock)
+    def test_extract_audio_async_success(self, mock_ffmpeg, tmp_path):
+        """Test async extraction builds the same command as extract_audio."""
+        video_path = tmp_path / "video.mp4"
+        output_path = tmp_path / "audio.wav"
+
+        async def create_output(*args, **kwargs):
+            output_path.touch()
+            return b""
+
+        mock_ffmpeg.side_effect = create_output
+
+        result = asyncio.run(extract_audio_async(str(video_path), str(output_path)))
+
+        assert result == str(output_path)
+        call_args = mock_ffmpeg.call_args[0][0]
+        assert "-ar" in call_args
+        assert "16000" in call_args
+
+    @patch("worker.utils.ffmpeg_helpers._run_ffmpeg_async", new_callable=AsyncMock)
+    def test_concatenate_async_pipes_list(self, mock_ffmpeg, tmp_path):
+        """Test async concatenation pipes the concat list."""
+        audio1 = tmp_path / "audio1.mp3"
+        output_path = tmp_path / "output.mp3"
+
+        async def create_output(*args, **kwargs):
+            output_path.touch()
+            return b""
+
+        mock_ffmpeg.side_effect = create_output
+
+        result = asyncio.run(
+            concatenate_audio_files_async([str(audio1)], str(output_path), format="wav")
+        )
+
+        assert result == str(output_path)
+        assert f"file '{audio1}'" in mock_ffmpeg.call_args.kwargs["input"]
+
 
 class TestRunFFprobe:
     """Tests for _run_ffprobe helper."""
@@ -69,16 +271,17 @@ class TestRunFFprobe:
     @patch("subprocess.run")
     def test_run_ffprobe_success(self, mock_run):
         """Test successful FFprobe execution."""
-        mock_run.return_value = MagicMock(returncode=0, stdout='{"format": {}}', stderr="")
+        mock_run.return_value = MagicMock(returncode=0, stdout=b'{"format": {}}', stderr=b"")
 
         result = _run_ffprobe(["ffprobe", "-version"], "test")
 
-        assert result == '{"format": {}}'
+        assert result == b'{"format": {}}'
+        assert "text" not in mock_run.call_args.kwargs
 
     @patch("subprocess.run")
     def test_run_ffprobe_failure(self, mock_run):
         """Test FFprobe execution failure."""
-        mock_run.return_value = MagicMock(returncode=1, stderr="Error")
+        mock_run.return_value = MagicMock(returncode=1, stderr=b"Error")
 
         with pytest.raises(FFmpegError):
             _run_ffprobe(["ffprobe", "-invalid"], "test")
@@ -87,8 +290,11 @@ class TestRunFFprobe:
 class TestExtractAudio:
     """Tests for extract_audio function."""
 
-    def test_extract_audio_file_not_found(self, tmp_path):
+    @patch("subprocess.Popen")
+    def test_extract_audio_file_not_found(self, mock_popen, tmp_path):
         """Test extraction with non-existent video."""
+        mock_popen.return_value = _ffmpeg_process(returncode=1, stderr=ENOENT_STDERR)
+
         with pytest.raises(FileNotFoundError):
             extract_audio(
                 str(tmp_path / "nonexistent.mp4"),
@@ -116,6 +322,22 @@ class TestExtractAudio:
         assert result == str(output_path)
         mock_ffmpeg.assert_called_once()
 
+        # Decoder threading is requested before the input
+        call_args = mock_ffmpeg.call_args[0][0]
+        assert call_args.index("-threads") < call_args.index("-i")
+        assert "-hwaccel" not in call_args
+
+    @patch("worker.utils.ffmpeg_helpers._FFMPEG", "/opt/ffmpeg/bin/ffmpeg")
+    @patch("worker.utils.ffmpeg_helpers._run_ffmpeg")
+    def test_extract_audio_uses_resolved_binary(self, mock_ffmpeg, tmp_path):
+        """Test commands use the executable path resolved at import."""
+        output_path = tmp_path / "output.wav"
+        mock_ffmpeg.side_effect = lambda *args, **kwargs: output_path.touch()
+
+        extract_audio(str(tmp_path / "input.mp4"), str(output_path))
+
+        assert mock_ffmpeg.call_args[0][0][0] == "/opt/ffmpeg/bin/ffmpeg"
+
     @patch("worker.utils.ffmpeg_helpers._run_ffmpeg")
     def test_extract_audio_custom_params(self, mock_ffmpeg, tmp_path):
         """Test audio extraction with custom parameters."""
@@ -144,6 +366,144 @@ class TestExtractAudio:
         assert "2" in call_args
 
 
+class TestExtractAudioMulti:
+    """Tests for extract_audio_multi function."""
+
+    def test_extract_audio_multi_no_outputs(self, tmp_path):
+        """Test extraction with an empty output list."""
+        video_path = tmp_path / "input.mp4"
+        video_path.touch()
+
+        with pytest.raises(ValueError):
+            extract_audio_multi(str(video_path), [])
+
+    @patch("worker.utils.ffmpeg_helpers._run_ffmpeg")
+    def test_extract_audio_multi_single_pass(self, mock_ffmpeg, tmp_path):
+        """Test that all outputs are produced by one FFmpeg invocation."""
+        video_path = tmp_path / "input.mp4"
+        video_path.touch()
+        whisper_path = tmp_path / "whisper.wav"
+        norm_path = tmp_path / "norm.wav"
+
+        def create_outputs(*args, **kwargs):
+            whisper_path.touch()
+            norm_path.touch()
+            return MagicMock(returncode=0)
+
+        mock_ffmpeg.side_effect = create_outputs
+
+        result = extract_audio_multi(str(video_path), [
+            (str(whisper_path), {"ar": 16000, "ac": 1}),
+            (str(norm_path), {"af": "loudnorm"}),
+        ])
+
+        assert result == [str(whisper_path), str(norm_path)]
+        mock_ffmpeg.assert_called_once()
+        call_args = mock_ffmpeg.call_args[0][0]
+        assert call_args.count("-i") == 1
+        assert call_args.count("-map") == 2
+        assert call_args.index("16000") < call_args.index(str(whisper_path))
+        assert call_args.index("loudnorm") > call_args.index(str(whisper_path))
+
+    @patch("worker.utils.ffmpeg_helpers._run_ffmpeg")
+    def test_extract_audio_multi_missing_output(self, mock_ffmpeg, tmp_path):
+        """Test failure when an output is not created."""
+        video_path = tmp_path / "input.mp4"
+        video_path.touch()
+        mock_ffmpeg.return_value = MagicMock(returncode=0)
+
+        with pytest.raises(FFmpegError):
+            extract_audio_multi(
+                str(video_path),
+                [(str(tmp_path / "out.wav"), {"ar": 16000})]
+            )
+
+
+class TestExtractAudioFromStream:
+    """Tests for extract_audio_from_stream function."""
+
+    @staticmethod
+    def _mock_process(returncode, on_wait=None, stderr=b""):
+        proc = MagicMock()
+        proc.stderr = io.BytesIO(stderr)
+
+        def wait(timeout=None):
+            if on_wait:
+                on_wait()
+            return returncode
+
+        proc.wait.side_effect = wait
+        return proc
+
+    @patch("subprocess.Popen")
+    def test_extract_from_stream_success(self, mock_popen, tmp_path):
+        """Test streaming extraction pipes data to FFmpeg and saves a copy."""
+        output_path = tmp_path / "audio.wav"
+        tee_path = tmp_path / "input.mp4"
+        proc = self._mock_process(0, on_wait=output_path.touch)
+        mock_popen.return_value = proc
+
+        result = extract_audio_from_stream(
+            io.BytesIO(b"video-bytes"),
+            str(output_path),
+            tee_path=str(tee_path),
+        )
+
+        assert result == str(output_path)
+        assert tee_path.read_bytes() == b"video-bytes"
+        proc.stdin.write.assert_called_once_with(b"video-bytes")
+        call_args = mock_popen.call_args[0][0]
+        assert "pipe:0" in call_args
+
+    @patch("subprocess.Popen")
+    def test_extract_from_stream_failure_keeps_copy(self, mock_popen, tmp_path):
+        """Test FFmpeg failure still saves the full stream copy."""
+        tee_path = tmp_path / "input.mp4"
+        proc = self._mock_process(1, stderr=b"moov atom not found")
+        proc.stdin.write.side_effect = BrokenPipeError()
+        mock_popen.return_value = proc
+
+        with pytest.raises(FFmpegError) as exc_info:
+            extract_audio_from_stream(
+                io.BytesIO(b"video-bytes"),
+                str(tmp_path / "audio.wav"),
+                tee_path=str(tee_path),
+            )
+
+        assert "moov atom" in str(exc_info.value)
+        assert tee_path.read_bytes() == b"video-bytes"
+
+    @patch("worker.utils.ffmpeg_helpers.FFMPEG_TIMEOUT", 0.1)
+    @patch("subprocess.Popen")
+    def test_extract_from_stream_stalled_write_times_out(self, mock_popen, tmp_path):
+        """Test a write FFmpeg never reads is ended by the timeout and the process reaped."""
+        killed = threading.Event()
+        proc = self._mock_process(-9)
+        proc.kill.side_effect = killed.set
+
+        def stalled_write(chunk):
+            # Blocks like a full pipe until FFmpeg is killed
+            killed.wait(5)
+            raise BrokenPipeError()
+
+        proc.stdin.write.side_effect = stalled_write
+        mock_popen.return_value = proc
+
+        with pytest.raises(FFmpegError, match="timed out"):
+            extract_audio_from_stream(io.BytesIO(b"video-bytes"), str(tmp_path / "audio.wav"))
+
+        proc.kill.assert_called_once()
+        proc.wait.assert_called()
+
+    @patch("subprocess.Popen")
+    def test_extract_from_stream_ffmpeg_not_installed(self, mock_popen, tmp_path):
+        """Test a missing FFmpeg binary is reported as not installed."""
+        mock_popen.side_effect = FileNotFoundError()
+
+        with pytest.raises(FFmpegError, match="not installed"):
+            extract_audio_from_stream(io.BytesIO(b"video-bytes"), str(tmp_path / "audio.wav"))
+
+
 class TestGetVideoDuration:
     """Tests for get_video_duration function."""
 
@@ -166,6 +526,20 @@ class TestGetVideoDuration:
 
         assert duration == 45.5
 
+    @patch("worker.utils.ffmpeg_helpers._run_ffprobe")
+    def test_get_duration_cached(self, mock_ffprobe, tmp_path):
+        """Test repeated duration queries reuse the probe result."""
+        video_path = tmp_path / "input.mp4"
+        video_path.touch()
+
+        mock_ffprobe.return_value = json.dumps({
+            "format": {"duration": "12.0"}
+        })
+
+        assert get_video_duration(str(video_path)) == 12.0
+        assert get_video_duration(str(video_path)) == 12.0
+        mock_ffprobe.assert_called_once()
+
     @patch("worker.utils.ffmpeg_helpers._run_ffprobe")
     def test_get_duration_invalid_json(self, mock_ffprobe, tmp_path):
         """Test duration with invalid JSON response."""
@@ -181,8 +555,11 @@ class TestGetVideoDuration:
 class TestGetVideoMetadata:
     """Tests for get_video_metadata function."""
 
-    def test_get_metadata_file_not_found(self, tmp_path):
+    @patch("subprocess.run")
+    def test_get_metadata_file_not_found(self, mock_run, tmp_path):
         """Test metadata with non-existent video."""
+        mock_run.return_value = MagicMock(returncode=1, stderr=ENOENT_STDERR, stdout="")
+
         with pytest.raises(FileNotFoundError):
             get_video_metadata(str(tmp_path / "nonexistent.mp4"))
 
@@ -192,24 +569,21 @@ class TestGetVideoMetadata:
         video_path = tmp_path / "input.mp4"
         video_path.touch()
 
-        # First call for video metadata
-        video_response = json.dumps({
+        # Single probe returns both streams
+        mock_ffprobe.return_value = json.dumps({
             "format": {"duration": "45.5"},
-            "streams": [{
-                "width": 1920,
-                "height": 1080,
-                "r_frame_rate": "30/1",
-                "codec_name": "h264"
-            }]
-        })
-
-        # Second call for audio metadata
-        audio_response = json.dumps({
-            "streams": [{"codec_name": "aac"}]
+            "streams": [
+                {
+                    "codec_type": "video",
+                    "width": 1920,
+                    "height": 1080,
+                    "r_frame_rate": "30/1",
+                    "codec_name": "h264"
+                },
+                {"codec_type": "audio", "codec_name": "aac"},
+            ]
         })
 
-        mock_ffprobe.side_effect = [video_response, audio_response]
-
         metadata = get_video_metadata(str(video_path))
 
         assert metadata["width"] == 1920
@@ -218,13 +592,33 @@ class TestGetVideoMetadata:
         assert metadata["video_codec"] == "h264"
         assert metadata["audio_codec"] == "aac"
         assert metadata["duration"] == 45.5
+        mock_ffprobe.assert_called_once()
+
+    @patch("worker.utils.ffmpeg_helpers._run_ffprobe")
+    def test_get_metadata_cached_copy(self, mock_ffprobe, tmp_path):
+        """Test repeated metadata queries reuse the probe but not the dict."""
+        video_path = tmp_path / "input.mp4"
+        video_path.touch()
+
+        mock_ffprobe.return_value = json.dumps({"format": {"duration": "10.0"}})
+
+        first = get_video_metadata(str(video_path))
+        first["duration"] = 0
+        second = get_video_metadata(str(video_path))
+
+        assert second["duration"] == 10.0
+        mock_ffprobe.assert_called_once()
 
 
 class TestMuxAudioVideo:
     """Tests for mux_audio_video function."""
 
-    def test_mux_video_not_found(self, tmp_path):
+    @patch("worker.utils.ffmpeg_helpers._probe_audio_codec", return_value=None)
+    @patch("subprocess.Popen")
+    def test_mux_video_not_found(self, mock_popen, mock_probe, tmp_path):
         """Test muxing with non-existent video."""
+        mock_popen.return_value = _ffmpeg_process(returncode=1, stderr=ENOENT_STDERR)
+
         audio_path = tmp_path / "audio.wav"
         audio_path.touch()
 
@@ -235,8 +629,11 @@ class TestMuxAudioVideo:
                 str(tmp_path / "output.mp4")
             )
 
-    def test_mux_audio_not_found(self, tmp_path):
+    @patch("subprocess.Popen")
+    def test_mux_audio_not_found(self, mock_popen, tmp_path):
         """Test muxing with non-existent audio."""
+        mock_popen.return_value = _ffmpeg_process(returncode=1, stderr=ENOENT_STDERR)
+
         video_path = tmp_path / "video.mp4"
         video_path.touch()
 
@@ -292,9 +689,149 @@ class TestMuxAudioVideo:
             keep_original_audio=True
         )
 
-        # Verify amix filter was used
+        # Verify amix filter was used and video is not re-encoded
         call_args = mock_ffmpeg.call_args[0][0]
         assert "amix" in str(call_args)
+        assert call_args[call_args.index("-c:v") + 1] == "copy"
+        assert call_args[call_args.index("-movflags") + 1] == "+faststart"
+
+    @pytest.mark.parametrize("codec,expected", [("aac", "copy"), ("mp3", "copy"), ("pcm_s16le", "aac")])
+    @patch("worker.utils.ffmpeg_helpers._probe_audio_codec")
+    @patch("worker.utils.ffmpeg_helpers._run_ffmpeg")
+    def test_mux_copies_compatible_audio(self, mock_ffmpeg, mock_probe, codec, expected, tmp_path):
+        """Test AAC/MP3 audio is stream-copied and other codecs are encoded."""
+        video_path = tmp_path / "video.mp4"
+        video_path.touch()
+        audio_path = tmp_path / "audio.bin"
+        audio_path.touch()
+        output_path = tmp_path / "output.mp4"
+        mock_probe.return_value = codec
+        mock_ffmpeg.side_effect = lambda *args, **kwargs: output_path.touch()
+
+        mux_audio_video(str(video_path), str(audio_path), str(output_path))
+
+        call_args = mock_ffmpeg.call_args[0][0]
+        assert call_args[call_args.index("-c:a") + 1] == expected
+        assert call_args[call_args.index("-c:v") + 1] == "copy"
+        assert ("-b:a" in call_args) == (expected == "aac")
+
+    @patch("worker.utils.ffmpeg_helpers._run_ffprobe")
+    @patch("worker.utils.ffmpeg_helpers._run_ffmpeg")
+    def test_mux_encodes_when_probe_fails(self, mock_ffmpeg, mock_ffprobe, tmp_path):
+        """Test a failed codec probe falls back to AAC encoding."""
+        video_path = tmp_path / "video.mp4"
+        video_path.touch()
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.touch()
+        output_path = tmp_path / "output.mp4"
+        mock_ffprobe.side_effect = FFmpegError("FFprobe failed")
+        mock_ffmpeg.side_effect = lambda *args, **kwargs: output_path.touch()
+
+        mux_audio_video(str(video_path), str(audio_path), str(output_path))
+
+        call_args = mock_ffmpeg.call_args[0][0]
+        assert call_args[call_args.index("-c:a") + 1] == "aac"
+
+
+class TestMuxAudioVideoWithSubs:
+    """Tests for mux_audio_video_with_subs function."""
+
+    @patch("worker.utils.ffmpeg_helpers._probe_audio_codec", return_value=None)
+    @patch("subprocess.Popen")
+    def test_mux_with_subs_srt_not_found(self, mock_popen, mock_probe, tmp_path):
+        """Test muxing with non-existent subtitle file."""
+        mock_popen.return_value = _ffmpeg_process(returncode=1, stderr=ENOENT_STDERR)
+
+        video_path = tmp_path / "video.mp4"
+        video_path.touch()
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.touch()
+
+        with pytest.raises(FileNotFoundError):
+            mux_audio_video_with_subs(
+                str(video_path),
+                str(audio_path),
+                str(tmp_path / "missing.srt"),
+                str(tmp_path / "missing.srt"),
+                str(tmp_path / "output.mp4")
+            )
+
+    @patch("worker.utils.ffmpeg_helpers._run_ffmpeg")
+    def test_mux_with_subs_success(self, mock_ffmpeg, tmp_path):
+        """Test audio and subtitles are muxed in one FFmpeg call."""
+        inputs = []
+        for name in ("video.mp4", "audio.mp3", "source.srt", "target.srt"):
+            path = tmp_path / name
+            path.write_text(SRT_ENTRY if name.endswith(".srt") else "")
+            inputs.append(str(path))
+        output_path = tmp_path / "output.mp4"
+
+        def create_output(*args, **kwargs):
+            output_path.touch()
+            return MagicMock(returncode=0)
+
+        mock_ffmpeg.side_effect = create_output
+
+        result = mux_audio_video_with_subs(
+            *inputs,
+            str(output_path),
+            source_language="eng",
+            target_language="hin"
+        )
+
+        assert result == str(output_path)
+        mock_ffmpeg.assert_called_once()
+        call_args = mock_ffmpeg.call_args[0][0]
+        assert call_args[call_args.index("-c:v") + 1] == "copy"
+        assert "mov_text" in call_args
+        assert "language=hin" in call_args
+
+    @patch("worker.utils.ffmpeg_helpers._run_ffmpeg")
+    def test_mux_with_subs_skips_empty_srt(self, mock_ffmpeg, tmp_path):
+        """Test an SRT without entries is not passed to FFmpeg."""
+        video_path = tmp_path / "video.mp4"
+        video_path.touch()
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.touch()
+        source_srt = tmp_path / "source.srt"
+        source_srt.write_text(SRT_ENTRY)
+        target_srt = tmp_path / "target.srt"
+        target_srt.write_text("")
+        output_path = tmp_path / "output.mp4"
+
+        def create_output(*args, **kwargs):
+            output_path.touch()
+            return MagicMock(returncode=0)
+
+        mock_ffmpeg.side_effect = create_output
+
+        mux_audio_video_with_subs(
+            str(video_path), str(audio_path), str(source_srt), str(target_srt),
+            str(output_path), source_language="eng", target_language="hin",
+        )
+
+        call_args = mock_ffmpeg.call_args[0][0]
+        assert str(target_srt) not in call_args
+        assert str(source_srt) in call_args
+        assert "3:s" not in call_args
+        assert call_args[call_args.index("-metadata:s:s:0") + 1] == "language=eng"
+        assert "-metadata:s:s:1" not in call_args
+
+    @patch("worker.utils.ffmpeg_helpers.mux_audio_video")
+    def test_mux_with_subs_all_empty_falls_back(self, mock_mux, tmp_path):
+        """Test muxing without any subtitle entries only replaces the audio."""
+        paths = []
+        for name in ("video.mp4", "audio.mp3", "source.srt", "target.srt"):
+            path = tmp_path / name
+            path.write_text("\n")
+            paths.append(str(path))
+        output_path = str(tmp_path / "output.mp4")
+        mock_mux.return_value = output_path
+
+        result = mux_audio_video_with_subs(*paths, output_path)
+
+        assert result == output_path
+        mock_mux.assert_called_once_with(paths[0], paths[1], output_path)
 
 
 class TestConcatenateAudioFiles:
@@ -305,8 +842,11 @@ class TestConcatenateAudioFiles:
         with pytest.raises(ValueError):
             concatenate_audio_files([], str(tmp_path / "output.mp3"))
 
-    def test_concatenate_file_not_found(self, tmp_path):
+    @patch("subprocess.Popen")
+    def test_concatenate_file_not_found(self, mock_popen, tmp_path):
         """Test concatenation with non-existent file."""
+        mock_popen.return_value = _ffmpeg_process(returncode=1, stderr=ENOENT_STDERR)
+
         with pytest.raises(FileNotFoundError):
             concatenate_audio_files(
                 [str(tmp_path / "nonexistent.mp3")],
@@ -336,12 +876,245 @@ class TestConcatenateAudioFiles:
 
         assert result == str(output_path)
 
+        # MP3 inputs are stream-copied through the concat protocol
+        call_args = mock_ffmpeg.call_args[0][0]
+        assert f"concat:{audio1}|{audio2}" in call_args
+        assert "copy" in call_args
+        assert mock_ffmpeg.call_args.kwargs["input"] is None
+        assert not (tmp_path / "concat_list.txt").exists()
+
+    @patch("worker.utils.ffmpeg_helpers._run_ffmpeg")
+    def test_concatenate_partitioned_keeps_order(self, mock_ffmpeg, tmp_path):
+        """Test MP3 partitions are joined concurrently and then in order."""
+        audio_files = [str(tmp_path / f"seg_{i}.mp3") for i in range(5)]
+        output_path = tmp_path / "output.mp3"
+
+        def create_output(args, *rest, **kwargs):
+            Path(args[-1]).touch()
+            return MagicMock(returncode=0)
+
+        mock_ffmpeg.side_effect = create_output
+
+        result = concatenate_audio_files(audio_files, str(output_path), parallel=2)
+
+        assert result == str(output_path)
+        assert mock_ffmpeg.call_count == 3
+
+        inputs = [call[0][0][call[0][0].index("-i") + 1] for call in mock_ffmpeg.call_args_list]
+        partials, final = sorted(inputs[:2]), inputs[2]
+        assert partials == sorted([
+            "concat:" + "|".join(audio_files[:3]),
+            "concat:" + "|".join(audio_files[3:]),
+        ])
+        final_parts = final[len("concat:"):].split("|")
+        assert [Path(part).name for part in final_parts] == ["part_0.mp3", "part_1.mp3"]
+        # Partial files are removed afterwards
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["output.mp3"]
+
+    @patch("worker.utils.ffmpeg_helpers._run_ffmpeg")
+    def test_concatenate_wav_pipes_list(self, mock_ffmpeg, tmp_path):
+        """Test that non-MP3 concatenation pipes the concat list."""
+        audio1 = tmp_path / "audio1.wav"
+        audio2 = tmp_path / "audio2.wav"
+        output_path = tmp_path / "output.wav"
+
+        def create_output(*args, **kwargs):
+            output_path.touch()
+            return MagicMock(returncode=0)
+
+        mock_ffmpeg.side_effect = create_output
+
+        concatenate_audio_files([str(audio1), str(audio2)], str(output_path), format="wav")
+
+        # Concat list is piped in rather than written next to the output
+        call_args = mock_ffmpeg.call_args[0][0]
+        assert "pipe:0" in call_args
+        assert "pcm_s16le" in call_args
+        assert f"file '{audio1}'" in mock_ffmpeg.call_args.kwargs["input"]
+        assert not (tmp_path / "concat_list.txt").exists()
+
+
+class TestDecodeAudioToNumpy:
+    """Tests for decode_audio_to_numpy function."""
+
+    @staticmethod
+    def _fake_av(chunks):
+        av = MagicMock()
+        av.error.FFmpegError = type("FFmpegError", (Exception,), {})
+        frames = [MagicMock(**{"to_ndarray.return_value": chunk[np.newaxis, :]}) for chunk in chunks]
+        container = av.open.return_value.__enter__.return_value
+        container.decode.return_value = frames
+        av.AudioResampler.return_value.resample.side_effect = (
+            lambda frame: [frame] if frame is not None else []
+        )
+        return av
+
+    def test_decode_to_numpy_success(self, tmp_path):
+        """Test decoded frames are concatenated into one float32 array."""
+        chunks = [np.full(4, 0.5, dtype=np.float32), np.full(2, -0.25, dtype=np.float32)]
+        av = self._fake_av(chunks)
+
+        with patch.dict(sys.modules, {"av": av}):
+            samples = decode_audio_to_numpy(str(tmp_path / "video.mp4"))
+
+        assert samples.dtype == np.float32
+        assert samples.tolist() == [0.5] * 4 + [-0.25] * 2
+        av.AudioResampler.assert_called_once_with(format="flt", layout="mono", rate=16000)
+
+    def test_decode_to_numpy_decode_error(self, tmp_path):
+        """Test PyAV decode errors are raised as FFmpegError."""
+        av = self._fake_av([])
+        av.open.side_effect = av.error.FFmpegError("Invalid data found")
+
+        with patch.dict(sys.modules, {"av": av}):
+            with pytest.raises(FFmpegError):
+                decode_audio_to_numpy(str(tmp_path / "video.mp4"))
+
+    def test_decode_to_numpy_without_pyav(self, tmp_path):
+        """Test a clear error when PyAV is not installed."""
+        with patch.dict(sys.modules, {"av": None}):
+            with pytest.raises(FFmpegError) as exc_info:
+                decode_audio_to_numpy(str(tmp_path / "video.mp4"))
+
+        assert "PyAV" in str(exc_info.value)
+
+
+class TestStreamAudioToArray:
+    """Tests for stream_audio_to_array function."""
+
+    @patch("subprocess.Popen")
+    def test_stream_to_array_success(self, mock_popen, tmp_path):
+        """Test piped f32le output is returned as float32 samples."""
+        samples = np.array([0.0, 0.5, -0.5, 1.0], dtype=np.float32)
+        mock_popen.return_value = _ffmpeg_process(stdout=samples.tobytes())
+
+        result = stream_audio_to_array(str(tmp_path / "video.mp4"))
+
+        assert result.dtype == np.float32
+        assert result.tolist() == [0.0, 0.5, -0.5, 1.0]
+        call_args = mock_popen.call_args[0][0]
+        assert "f32le" in call_args
+        assert "16000" in call_args
+        assert call_args[-1] == "pipe:1"
+
+    @patch("subprocess.Popen")
+    def test_stream_to_array_file_not_found(self, mock_popen, tmp_path):
+        """Test decoding a missing file."""
+        mock_popen.return_value = _ffmpeg_process(returncode=1, stderr=ENOENT_STDERR)
+
+        with pytest.raises(FileNotFoundError):
+            stream_audio_to_array(str(tmp_path / "nonexistent.mp4"))
+
+
+class TestDecodeAudioToPcm:
+    """Tests for decode_audio_to_pcm function."""
+
+    @patch("subprocess.Popen")
+    def test_decode_file_not_found(self, mock_popen, tmp_path):
+        """Test decoding non-existent audio."""
+        mock_popen.return_value = _ffmpeg_process(returncode=1, stderr=ENOENT_STDERR)
+
+        with pytest.raises(FileNotFoundError):
+            decode_audio_to_pcm(str(tmp_path / "nonexistent.mp3"))
+
+    @patch("subprocess.Popen")
+    def test_decode_success(self, mock_popen, tmp_path):
+        """Test decoded stdout is returned as int16 samples."""
+        audio_path = tmp_path / "audio.mp3"
+        audio_path.touch()
+        pcm = np.array([0, 1, -1, 32767], dtype=np.int16)
+        mock_popen.return_value = _ffmpeg_process(stdout=pcm.tobytes())
+
+        samples = decode_audio_to_pcm(str(audio_path), sample_rate=22050)
+
+        assert samples.dtype == np.int16
+        assert samples.tolist() == [0, 1, -1, 32767]
+        call_args = mock_popen.call_args[0][0]
+        assert call_args[1] == "-nostats"
+        assert "s16le" in call_args
+        assert "22050" in call_args
+
+    @patch("worker.utils.ffmpeg_helpers.STDERR_TAIL_LINES", 2)
+    @patch("subprocess.Popen")
+    def test_decode_keeps_stderr_tail(self, mock_popen, tmp_path):
+        """Test only the last stderr lines are kept when decoding fails."""
+        mock_popen.return_value = _ffmpeg_process(
+            returncode=1, stderr="banner\nline 1\nline 2\nfatal error\n"
+        )
+
+        with pytest.raises(FFmpegError) as exc_info:
+            decode_audio_to_pcm(str(tmp_path / "audio.mp3"))
+
+        assert "fatal error" in str(exc_info.value)
+        assert "banner" not in str(exc_info.value)
+
+    @patch("subprocess.Popen")
+    def test_decode_timeout(self, mock_popen, tmp_path):
+        """Test a hung decode is killed at the timeout."""
+        proc = _ffmpeg_process()
+        proc.wait.side_effect = [subprocess.TimeoutExpired(cmd="ffmpeg", timeout=300), -9]
+        mock_popen.return_value = proc
+
+        with pytest.raises(FFmpegError) as exc_info:
+            decode_audio_to_pcm(str(tmp_path / "audio.mp3"))
+
+        assert "timed out" in str(exc_info.value)
+        proc.kill.assert_called_once()
+
+
+class TestEncodePcmToFile:
+    """Tests for encode_pcm_to_file function."""
+
+    @patch("subprocess.Popen")
+    def test_encode_success(self, mock_popen, tmp_path):
+        """Test samples are piped to FFmpeg's stdin."""
+        output_path = tmp_path / "output.mp3"
+        samples = np.array([1, 2, 3], dtype=np.int16)
+        proc = _ffmpeg_process()
+
+        def create_output(*args, **kwargs):
+            output_path.touch()
+            return proc
+
+        mock_popen.side_effect = create_output
+
+        result = encode_pcm_to_file(samples, str(output_path))
+
+        assert result == str(output_path)
+        proc.stdin.write.assert_called_once_with(samples.tobytes())
+        proc.stdin.close.assert_called_once()
+
+    @patch("subprocess.Popen")
+    def test_encode_failure(self, mock_popen, tmp_path):
+        """Test encoding failure raises FFmpegError."""
+        mock_popen.return_value = _ffmpeg_process(returncode=1, stderr="Encoder error")
+
+        with pytest.raises(FFmpegError) as exc_info:
+            encode_pcm_to_file(np.zeros(4, dtype=np.int16), str(tmp_path / "output.mp3"))
+
+        assert "Encoder error" in str(exc_info.value)
+
+    @patch("subprocess.Popen")
+    def test_encode_ffmpeg_exits_early(self, mock_popen, tmp_path):
+        """Test FFmpeg closing stdin early reports its error, not BrokenPipeError."""
+        proc = _ffmpeg_process(returncode=1, stderr="Unknown encoder\n")
+        proc.stdin.write.side_effect = BrokenPipeError()
+        mock_popen.return_value = proc
+
+        with pytest.raises(FFmpegError) as exc_info:
+            encode_pcm_to_file(np.zeros(4, dtype=np.int16), str(tmp_path / "output.mp3"))
+
+        assert "Unknown encoder" in str(exc_info.value)
+
 
 class TestConvertAudioFormat:
     """Tests for convert_audio_format function."""
 
-    def test_convert_file_not_found(self, tmp_path):
+    @patch("subprocess.Popen")
+    def test_convert_file_not_found(self, mock_popen, tmp_path):
         """Test conversion with non-existent file."""
+        mock_popen.return_value = _ffmpeg_process(returncode=1, stderr=ENOENT_STDERR)
+
         with pytest.raises(FileNotFoundError):
             convert_audio_format(
                 str(tmp_path / "nonexistent.wav"),
@@ -365,12 +1138,28 @@ class TestConvertAudioFormat:
 
         assert result == str(output_path)
 
+    @patch("worker.utils.ffmpeg_helpers._run_ffmpeg")
+    def test_convert_optional_params(self, mock_ffmpeg, tmp_path):
+        """Test sample rate and channels are only passed when given."""
+        output_path = tmp_path / "output.wav"
+        mock_ffmpeg.side_effect = lambda *args, **kwargs: output_path.touch()
+
+        convert_audio_format(str(tmp_path / "input.mp3"), str(output_path), channels=2)
+
+        call_args = mock_ffmpeg.call_args[0][0]
+        assert "-ar" not in call_args
+        assert call_args[call_args.index("-ac") + 1] == "2"
+        assert call_args[-2:] == ["-y", str(output_path)]
+
 
 class TestGetAudioDuration:
     """Tests for get_audio_duration function."""
 
-    def test_get_audio_duration_file_not_found(self, tmp_path):
+    @patch("subprocess.run")
+    def test_get_audio_duration_file_not_found(self, mock_run, tmp_path):
         """Test duration with non-existent audio."""
+        mock_run.return_value = MagicMock(returncode=1, stderr=ENOENT_STDERR, stdout="")
+
         with pytest.raises(FileNotFoundError):
             get_audio_duration(str(tmp_path / "nonexistent.wav"))
 
@@ -387,3 +1176,21 @@ class TestGetAudioDuration:
         duration = get_audio_duration(str(audio_path))
 
         assert duration == 30.5
+
+    @patch("worker.utils.ffmpeg_helpers._run_ffprobe")
+    def test_get_audio_duration_cache_cleared(self, mock_ffprobe, tmp_path):
+        """Test that clear_probe_cache forces a new probe."""
+        audio_path = tmp_path / "audio.wav"
+        audio_path.touch()
+
+        mock_ffprobe.return_value = json.dumps({
+            "format": {"duration": "30.5"}
+        })
+
+        get_audio_duration(str(audio_path))
+        get_audio_duration(str(audio_path))
+        assert mock_ffprobe.call_count == 1
+
+        clear_probe_cache()
+        get_audio_duration(str(audio_path))
+        assert mock_ffprobe.call_count == 2
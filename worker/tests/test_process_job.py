@@ -0,0 +1,336 @@
+"""Tests for the job processor."""
+
+import json
+import logging
+from unittest.mock import patch, MagicMock, call
+
+import numpy as np
+import pytest
+
+from worker.tasks.process_job import JobProcessor, JobProcessingError
+from dubwizard_shared import JobStatus, SynthesizedSegment, shared_settings
+
+
+def _processor():
+    return JobProcessor(
+        s3_service=MagicMock(),
+        job_service=MagicMock(),
+        ai_service=MagicMock(),
+    )
+
+
+def _segment(seg_id, start, duration, audio_path, audio_offset=None):
+    return SynthesizedSegment(
+        id=seg_id,
+        start=start,
+        end=start + duration,
+        text=f"Segment {seg_id}",
+        audio_path=audio_path,
+        actual_duration=duration,
+        audio_offset=audio_offset,
+    )
+
+
+@patch.object(JobProcessor, "DUBBED_SAMPLE_RATE", 10)
+@patch("worker.tasks.process_job.encode_pcm_to_file")
+@patch("worker.tasks.process_job.decode_audio_to_pcm")
+class TestCreateDubbedAudio:
+    """Tests for JobProcessor._create_dubbed_audio (10 samples per second)."""
+
+    @staticmethod
+    def _encoded(mock_encode):
+        mock_encode.assert_called_once()
+        buffer = mock_encode.call_args[0][0]
+        assert buffer.dtype == np.int16
+        return buffer.tolist()
+
+    def test_segment_placed_at_start_time(self, mock_decode, mock_encode, tmp_path):
+        """Test a segment is written at its start time with silence around it."""
+        mock_decode.return_value = np.array([1, 2, 3], dtype=np.int16)
+
+        result = _processor()._create_dubbed_audio(
+            "job", [_segment(1, 0.3, 0.3, "a.mp3")], 1.0, str(tmp_path)
+        )
+
+        assert result == str(tmp_path / "dubbed_audio.mp3")
+        assert self._encoded(mock_encode) == [0, 0, 0, 1, 2, 3, 0, 0, 0, 0]
+
+    def test_overlapping_segments_are_mixed_and_clipped(self, mock_decode, mock_encode, tmp_path):
+        """Test overlapping speech is summed and clipped to the int16 range."""
+        decoded = {
+            "a.mp3": np.array([30000, 30000, -30000, 100], dtype=np.int16),
+            "b.mp3": np.array([30000, -30000, 200], dtype=np.int16),
+        }
+        mock_decode.side_effect = lambda path, sample_rate: decoded[path]
+
+        _processor()._create_dubbed_audio(
+            "job",
+            [_segment(1, 0.0, 0.4, "a.mp3"), _segment(2, 0.1, 0.3, "b.mp3")],
+            0.5,
+            str(tmp_path),
+        )
+
+        assert self._encoded(mock_encode) == [30000, 32767, -32768, 300, 0]
+
+    def test_segment_after_video_end_is_skipped(self, mock_decode, mock_encode, tmp_path, caplog):
+        """Test a segment starting past the video is skipped with a warning."""
+        mock_decode.return_value = np.array([5, 5], dtype=np.int16)
+
+        with caplog.at_level(logging.WARNING):
+            _processor()._create_dubbed_audio(
+                "job", [_segment(7, 1.5, 0.2, "a.mp3")], 1.0, str(tmp_path)
+            )
+
+        assert self._encoded(mock_encode) == [0] * 10
+        assert "Segment 7 starts after the end of the video" in caplog.text
+
+    def test_segment_past_video_end_is_truncated(self, mock_decode, mock_encode, tmp_path):
+        """Test a segment running past the video is cut at the end."""
+        mock_decode.return_value = np.array([1, 2, 3, 4, 5], dtype=np.int16)
+
+        _processor()._create_dubbed_audio(
+            "job", [_segment(1, 0.8, 0.5, "a.mp3")], 1.0, str(tmp_path)
+        )
+
+        assert self._encoded(mock_encode) == [0] * 8 + [1, 2]
+
+    def test_grouped_segments_sliced_by_offset(self, mock_decode, mock_encode, tmp_path):
+        """Test segments sharing one file are cut out by audio_offset and actual_duration."""
+        mock_decode.return_value = np.arange(1, 11, dtype=np.int16)
+
+        _processor()._create_dubbed_audio(
+            "job",
+            [
+                _segment(1, 0.0, 0.3, "group.mp3", audio_offset=0.0),
+                _segment(2, 0.5, 0.2, "group.mp3", audio_offset=0.3),
+            ],
+            1.0,
+            str(tmp_path),
+        )
+
+        # The shared file is decoded once
+        mock_decode.assert_called_once_with("group.mp3", sample_rate=10)
+        assert self._encoded(mock_encode) == [1, 2, 3, 0, 0, 4, 5, 0, 0, 0]
+
+
+class _PipelineStarted(Exception):
+    """Raised by a patched first pipeline step to show the job was processed normally."""
+
+
+CACHE_KEY = "cache/etag123_english_hindi_voice.json"
+CACHED_ENTRY = {
+    "output_video_key": "outputs/job_old_dubbed.mp4",
+    "source_subtitle_key": "subtitles/job_old_source.srt",
+    "target_subtitle_key": "subtitles/job_old_target.srt",
+    "video_duration": 12.5,
+}
+
+
+@patch.object(shared_settings, "WORKER_TMPFS_DIR", None)
+@patch.object(JobProcessor, "_download_video", side_effect=_PipelineStarted)
+class TestResultCache:
+    """Tests for completing jobs from the result cache."""
+
+    @staticmethod
+    def _cached_processor(pointer):
+        processor = _processor()
+        processor.job_service.get_job.return_value = MagicMock(
+            input_s3_key="uploads/video.mp4",
+            source_language="english",
+            target_language="hindi",
+            voice_id="voice",
+        )
+        processor.s3_service.get_etag.return_value = "etag123"
+        processor.s3_service.get_object_if_exists.return_value = pointer
+        return processor
+
+    @patch.object(shared_settings, "ENABLE_RESULT_CACHE", True)
+    def test_hit_copies_outputs_and_completes(self, mock_download):
+        """Test a cache hit copies the earlier outputs and skips the pipeline."""
+        processor = self._cached_processor(json.dumps(CACHED_ENTRY).encode())
+
+        assert processor.process_job("job_new") is True
+
+        processor.s3_service.get_object_if_exists.assert_called_once_with(CACHE_KEY)
+        assert processor.s3_service.copy_file.call_args_list == [
+            call("outputs/job_old_dubbed.mp4", "outputs/job_new_dubbed.mp4"),
+            call("subtitles/job_old_source.srt", "subtitles/job_new_source.srt"),
+            call("subtitles/job_old_target.srt", "subtitles/job_new_target.srt"),
+        ]
+        processor.job_service.update_video_duration.assert_called_once_with("job_new", 12.5)
+        processor.job_service.complete_job.assert_called_once_with(
+            "job_new",
+            output_video_key="outputs/job_new_dubbed.mp4",
+            source_subtitle_key="subtitles/job_new_source.srt",
+            target_subtitle_key="subtitles/job_new_target.srt",
+        )
+        processor.job_service.update_job_status.assert_called_with("job_new", JobStatus.DONE, 100)
+        mock_download.assert_not_called()
+
+    @patch.object(shared_settings, "ENABLE_RESULT_CACHE", True)
+    def test_miss_runs_pipeline(self, mock_download):
+        """Test a missing cache entry processes the job normally."""
+        processor = self._cached_processor(None)
+
+        with pytest.raises(JobProcessingError):
+            processor.process_job("job_new")
+
+        mock_download.assert_called_once()
+        processor.s3_service.copy_file.assert_not_called()
+        processor.job_service.complete_job.assert_not_called()
+
+    @patch.object(shared_settings, "ENABLE_RESULT_CACHE", True)
+    def test_failed_copy_falls_back_to_pipeline(self, mock_download, caplog):
+        """Test an entry whose outputs can't be copied (stale or partial) is ignored."""
+        processor = self._cached_processor(json.dumps(CACHED_ENTRY).encode())
+        processor.s3_service.copy_file.side_effect = [None, Exception("NoSuchKey")]
+
+        with caplog.at_level(logging.WARNING), pytest.raises(JobProcessingError):
+            processor.process_job("job_new")
+
+        assert f"Result cache entry {CACHE_KEY} unusable" in caplog.text
+        mock_download.assert_called_once()
+        processor.job_service.complete_job.assert_not_called()
+
+    @patch.object(shared_settings, "ENABLE_RESULT_CACHE", True)
+    def test_incomplete_entry_falls_back_to_pipeline(self, mock_download):
+        """Test an entry missing an output key is ignored."""
+        entry = {key: value for key, value in CACHED_ENTRY.items() if key != "target_subtitle_key"}
+        processor = self._cached_processor(json.dumps(entry).encode())
+
+        with pytest.raises(JobProcessingError):
+            processor.process_job("job_new")
+
+        mock_download.assert_called_once()
+        processor.job_service.complete_job.assert_not_called()
+
+    @patch.object(shared_settings, "ENABLE_RESULT_CACHE", False)
+    def test_disabled_skips_cache(self, mock_download):
+        """Test ENABLE_RESULT_CACHE=False never looks up the cache."""
+        processor = self._cached_processor(json.dumps(CACHED_ENTRY).encode())
+
+        with pytest.raises(JobProcessingError):
+            processor.process_job("job_new")
+
+        processor.s3_service.get_etag.assert_not_called()
+        processor.s3_service.get_object_if_exists.assert_not_called()
+        mock_download.assert_called_once()
+
+
+class TestStoreCacheEntry:
+    """Tests for JobProcessor._store_cache_entry."""
+
+    def test_entry_written_as_json(self):
+        """Test the entry is stored as JSON under the cache key."""
+        processor = _processor()
+
+        processor._store_cache_entry("job", CACHE_KEY, CACHED_ENTRY)
+
+        key, body = processor.s3_service.put_object.call_args[0]
+        assert key == CACHE_KEY
+        assert json.loads(body) == CACHED_ENTRY
+
+    def test_write_failure_ignored(self, caplog):
+        """Test a failed write only logs a warning."""
+        processor = _processor()
+        processor.s3_service.put_object.side_effect = Exception("AccessDenied")
+
+        with caplog.at_level(logging.WARNING):
+            processor._store_cache_entry("job", CACHE_KEY, CACHED_ENTRY)
+
+        assert "Failed to store result cache entry" in caplog.text
+
+
+@patch.object(JobProcessor, "TMPFS_MIN_FREE_BYTES", 100)
+@patch.object(JobProcessor, "_tmpfs_reserved_bytes", 0)
+@patch("worker.tasks.process_job.shutil.disk_usage")
+class TestTempRoot:
+    """Tests for the tmpfs reservation in _get_temp_root / _release_temp_root."""
+
+    def test_unset_uses_default(self, mock_disk_usage):
+        """Test no WORKER_TMPFS_DIR uses the system temp directory."""
+        with patch.object(shared_settings, "WORKER_TMPFS_DIR", None):
+            assert _processor()._get_temp_root("job") is None
+
+        mock_disk_usage.assert_not_called()
+
+    def test_missing_dir_uses_default(self, mock_disk_usage, caplog):
+        """Test a WORKER_TMPFS_DIR that can't be checked falls back to disk."""
+        mock_disk_usage.side_effect = FileNotFoundError("no such directory")
+
+        with patch.object(shared_settings, "WORKER_TMPFS_DIR", "/dev/shm/missing"), \
+                caplog.at_level(logging.WARNING):
+            assert _processor()._get_temp_root("job") is None
+
+        assert "Temp directory /dev/shm/missing unavailable" in caplog.text
+        assert JobProcessor._tmpfs_reserved_bytes == 0
+
+    def test_reserves_space_per_job(self, mock_disk_usage, tmp_path):
+        """Test each job reserves space until free minus reserved runs short."""
+        mock_disk_usage.return_value = MagicMock(free=250)
+        processor = _processor()
+
+        with patch.object(shared_settings, "WORKER_TMPFS_DIR", str(tmp_path)):
+            assert processor._get_temp_root("job_0") == str(tmp_path)
+            assert processor._get_temp_root("job_1") == str(tmp_path)
+            # 250 free - 200 reserved is below the 100 minimum
+            assert processor._get_temp_root("job_2") is None
+
+        assert JobProcessor._tmpfs_reserved_bytes == 200
+
+    def test_low_free_space_uses_default(self, mock_disk_usage, tmp_path, caplog):
+        """Test a tmpfs with less than TMPFS_MIN_FREE_BYTES free falls back to disk."""
+        mock_disk_usage.return_value = MagicMock(free=99)
+
+        with patch.object(shared_settings, "WORKER_TMPFS_DIR", str(tmp_path)), \
+                caplog.at_level(logging.WARNING):
+            assert _processor()._get_temp_root("job") is None
+
+        assert "using default temp directory" in caplog.text
+        assert JobProcessor._tmpfs_reserved_bytes == 0
+
+    def test_release(self, mock_disk_usage, tmp_path):
+        """Test releasing returns the reservation, and releasing None does nothing."""
+        mock_disk_usage.return_value = MagicMock(free=1000)
+        processor = _processor()
+
+        with patch.object(shared_settings, "WORKER_TMPFS_DIR", str(tmp_path)):
+            temp_root = processor._get_temp_root("job")
+        processor._release_temp_root(None)
+        assert JobProcessor._tmpfs_reserved_bytes == 100
+
+        processor._release_temp_root(temp_root)
+        assert JobProcessor._tmpfs_reserved_bytes == 0
+
+    @patch.object(shared_settings, "ENABLE_RESULT_CACHE", False)
+    @patch.object(JobProcessor, "_download_video", side_effect=_PipelineStarted)
+    def test_process_job_releases_on_failure(self, mock_download, mock_disk_usage, tmp_path):
+        """Test process_job returns its reservation when the job fails."""
+        mock_disk_usage.return_value = MagicMock(free=1000)
+        processor = _processor()
+
+        def download(job_id, s3_key, temp_dir):
+            assert temp_dir.startswith(str(tmp_path))
+            assert JobProcessor._tmpfs_reserved_bytes == 100
+            raise _PipelineStarted()
+
+        mock_download.side_effect = download
+
+        with patch.object(shared_settings, "WORKER_TMPFS_DIR", str(tmp_path)), \
+                pytest.raises(JobProcessingError):
+            processor.process_job("job")
+
+        mock_download.assert_called_once()
+        assert JobProcessor._tmpfs_reserved_bytes == 0
+        assert list(tmp_path.iterdir()) == []
+
+    @patch("worker.tasks.process_job.tempfile.mkdtemp", side_effect=OSError("No space left"))
+    def test_process_job_releases_if_mkdtemp_fails(self, mock_mkdtemp, mock_disk_usage, tmp_path):
+        """Test the reservation is returned if the temp directory can't be created."""
+        mock_disk_usage.return_value = MagicMock(free=1000)
+
+        with patch.object(shared_settings, "WORKER_TMPFS_DIR", str(tmp_path)), \
+                pytest.raises(OSError):
+            _processor().process_job("job")
+
+        assert JobProcessor._tmpfs_reserved_bytes == 0
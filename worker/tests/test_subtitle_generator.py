@@ -7,7 +7,9 @@ from worker.utils.subtitle_generator import (
     format_srt_time,
     parse_srt_time,
     generate_srt,
+    stream_srt,
     save_srt,
+    save_srt_pair,
     parse_srt,
     load_srt,
     validate_srt,
@@ -44,6 +46,15 @@ class TestFormatSrtTime:
         assert format_srt_time(1.123) == "00:00:01,123"
         assert format_srt_time(1.999) == "00:00:01,999"
 
+    def test_format_rounds_milliseconds(self):
+        """Test float error doesn't truncate to the previous millisecond."""
+        assert format_srt_time(4.35) == "00:00:04,350"
+        assert format_srt_time(59.9996) == "00:01:00,000"
+
+    def test_format_hours_beyond_two_digits(self):
+        """Test hours past 99 are not truncated."""
+        assert format_srt_time(360000.5) == "100:00:00,500"
+
     def test_format_negative(self):
         """Test formatting negative values (should clamp to 0)."""
         assert format_srt_time(-5) == "00:00:00,000"
@@ -79,6 +90,21 @@ class TestParseSrtTime:
         with pytest.raises(ValueError):
             parse_srt_time("00:00:00")  # Missing milliseconds
 
+    def test_parse_agrees_with_parse_srt(self):
+        """Test parse_srt_time accepts the same fractions as parse_srt."""
+        for start, end in [
+            ("00:00:01,5", "00:00:02.25"),
+            ("00:00:01,500", "00:00:02,250"),
+            ("00:00:01,5000", "00:00:02,2500"),
+        ]:
+            srt_content = f"1\n{start} --> {end}\nText"
+
+            segment = parse_srt(srt_content)[0]
+
+            assert segment["start"] == parse_srt_time(start) == 1.5
+            assert segment["end"] == parse_srt_time(end) == 2.25
+            assert validate_srt(srt_content) == (True, [])
+
     def test_roundtrip(self):
         """Test format -> parse roundtrip."""
         test_values = [0, 1.5, 65.123, 3661.999, 7200]
@@ -169,6 +195,96 @@ class TestGenerateSrt:
         assert "Also valid" in srt
         # Empty segment should be skipped
 
+    def test_generate_numbers_consecutively_after_skip(self):
+        """Test entries stay consecutively numbered when one is skipped."""
+        segments = [
+            TranscriptionSegment(id=1, start=0, end=5, text="Valid"),
+            TranscriptionSegment(id=2, start=5, end=10, text=" "),
+            TranscriptionSegment(id=3, start=10, end=15, text="Also valid"),
+        ]
+
+        srt = generate_srt(segments)
+
+        assert [seg["id"] for seg in parse_srt(srt)] == [1, 2]
+        assert validate_srt(srt) == (True, [])
+
+    def test_generate_timestamps_match_format_srt_time(self):
+        """Test bulk timestamp formatting agrees with format_srt_time."""
+        times = [0, 0.0005, 0.0015, 1.2345, 59.9996, 3599.9995, 3661.123, 360000.5]
+        segments = [
+            TranscriptionSegment(id=i, start=t, end=t + 0.25, text="Line")
+            for i, t in enumerate(times, start=1)
+        ]
+
+        srt = generate_srt(segments)
+
+        for t in times:
+            assert f"{format_srt_time(t)} --> {format_srt_time(t + 0.25)}" in srt
+
+    def test_generate_swaps_reversed_timing_without_mutating(self):
+        """Test reversed timings are written swapped and the segment is left as is."""
+        segment = TranscriptionSegment(id=1, start=5, end=2, text="Backwards")
+
+        srt = generate_srt([segment])
+
+        assert "00:00:02,000 --> 00:00:05,000" in srt
+        assert (segment.start, segment.end) == (5, 2)
+
+    def test_generate_rejects_negative_timing(self):
+        """Test negative timestamps raise SubtitleError naming the segments."""
+        segments = [
+            TranscriptionSegment(id=1, start=0, end=1, text="Fine"),
+            TranscriptionSegment(id=2, start=-1, end=1, text="Bad"),
+        ]
+
+        with pytest.raises(SubtitleError, match=r"segments \[2\]"):
+            generate_srt(segments)
+
+    def test_generate_rejects_infinite_timing(self):
+        """Test infinite timestamps raise instead of wrapping into garbage times."""
+        segments = [
+            TranscriptionSegment(id=1, start=0, end=1, text="Fine"),
+            TranscriptionSegment(id=2, start=1, end=float("inf"), text="Endless"),
+        ]
+
+        with pytest.raises(SubtitleError, match=r"segments \[2\]"):
+            generate_srt(segments)
+
+    def test_generate_warns_once_for_skipped_segments(self, caplog):
+        """Test skipped segments are reported in a single warning."""
+        segments = [
+            TranscriptionSegment(id=i, start=i, end=i + 1, text="")
+            for i in range(1, 4)
+        ]
+
+        with caplog.at_level("WARNING"):
+            srt = generate_srt(segments)
+
+        assert srt == ""
+        assert len(caplog.records) == 1
+        assert "3 empty" in caplog.records[0].getMessage()
+
+
+class TestStreamSrt:
+    """Tests for stream_srt function."""
+
+    def test_stream_matches_generate(self, tmp_path):
+        """Test streaming to a file writes the same content as generate_srt."""
+        segments = [
+            TranslationSegment(
+                id=i, start=i, end=i + 0.5,
+                original_text=f"Line {i}", translated_text=f"पंक्ति {i}",
+                source_language="english", target_language="hindi",
+            )
+            for i in range(1, 4)
+        ]
+        srt_file = tmp_path / "streamed.srt"
+
+        with open(srt_file, "w", encoding="utf-8", newline="") as fh:
+            stream_srt(segments, fh, use_translated=True)
+
+        assert srt_file.read_text(encoding="utf-8") == generate_srt(segments, use_translated=True)
+
 
 class TestSaveSrt:
     """Tests for save_srt function."""
@@ -199,6 +315,48 @@ class TestSaveSrt:
 
         assert output_path.exists()
 
+    def test_save_matches_generate_srt(self, tmp_path):
+        """Test that the streamed file matches the generated string."""
+        segments = [
+            TranscriptionSegment(id=1, start=0, end=5, text="Héllo"),
+            TranscriptionSegment(id=2, start=5, end=10, text=""),
+            TranscriptionSegment(id=3, start=10, end=15, text="World"),
+        ]
+
+        output_path = tmp_path / "test.srt"
+        save_srt(segments, str(output_path))
+
+        assert output_path.read_bytes() == generate_srt(segments).encode("utf-8")
+
+
+class TestSaveSrtPair:
+    """Tests for save_srt_pair function."""
+
+    def test_save_pair_matches_save_srt(self, tmp_path):
+        """Test both files match what save_srt writes separately."""
+        segments = [
+            TranslationSegment(
+                id=1, start=0, end=2,
+                original_text="Hello", translated_text="नमस्ते",
+                source_language="english", target_language="hindi"
+            ),
+            TranslationSegment(
+                id=2, start=2.5, end=4,
+                original_text="World", translated_text="दुनिया",
+                source_language="english", target_language="hindi"
+            ),
+        ]
+
+        source_path, target_path = save_srt_pair(
+            segments, str(tmp_path / "source.srt"), str(tmp_path / "target.srt")
+        )
+        save_srt(segments, str(tmp_path / "expected_source.srt"), use_translated=False)
+        save_srt(segments, str(tmp_path / "expected_target.srt"), use_translated=True)
+
+        assert Path(source_path).read_bytes() == (tmp_path / "expected_source.srt").read_bytes()
+        assert Path(target_path).read_bytes() == (tmp_path / "expected_target.srt").read_bytes()
+        assert "दुनिया" in Path(target_path).read_text(encoding="utf-8")
+
 
 class TestParseSrt:
     """Tests for parse_srt function."""
@@ -249,6 +407,46 @@ Line two"""
         assert parse_srt("") == []
         assert parse_srt("   ") == []
 
+    def test_parse_bytes_matches_str(self):
+        """Test UTF-8 bytes parse the same as the decoded string."""
+        srt_content = (
+            "1\r\n00:00:00,000 --> 00:00:01,500\r\nनमस्ते\r\n\r\n"
+            "oops\r\n\r\n"
+            "2\r\n00:00:02,000 --> 00:00:03,000\r\nHello\r\nworld"
+        )
+
+        segments = parse_srt(srt_content.encode("utf-8"))
+
+        assert segments == parse_srt(srt_content)
+        assert segments[0]["text"] == "नमस्ते"
+        assert segments[1]["text"] == "Hello\nworld"
+
+    def test_parse_skips_malformed_block(self):
+        """Test a malformed block is skipped without swallowing its neighbours."""
+        srt_content = """1
+00:00:00,000 --> 00:00:01,000
+
+2
+00:00:02,000 --> 00:00:03,000
+Kept"""
+
+        segments = parse_srt(srt_content)
+
+        assert len(segments) == 1
+        assert segments[0]["id"] == 2
+        assert segments[0]["text"] == "Kept"
+
+    def test_parse_dot_and_short_fraction(self):
+        """Test timestamps with a dot separator and short fraction."""
+        srt_content = """1
+00:00:01.5 --> 00:00:02,25
+Hello"""
+
+        segments = parse_srt(srt_content)
+
+        assert segments[0]["start"] == 1.5
+        assert segments[0]["end"] == 2.25
+
 
 class TestLoadSrt:
     """Tests for load_srt function."""
@@ -272,6 +470,24 @@ Test content"""
         with pytest.raises(FileNotFoundError):
             load_srt(str(tmp_path / "nonexistent.srt"))
 
+    def test_load_crlf_file(self, tmp_path):
+        """Test loading a file with Windows line endings."""
+        srt_file = tmp_path / "crlf.srt"
+        srt_file.write_bytes(
+            "1\r\n00:00:00,000 --> 00:00:01,500\r\nHéllo\r\n\r\n"
+            "2\r\n00:00:02,000 --> 00:00:03,000\r\nWorld\r\n".encode("utf-8")
+        )
+
+        segments = load_srt(str(srt_file))
+
+        assert [seg["text"] for seg in segments] == ["Héllo", "World"]
+        assert segments[0]["end"] == 1.5
+
+    def test_load_directory_raises_subtitle_error(self, tmp_path):
+        """Test read failures other than a missing file are wrapped."""
+        with pytest.raises(SubtitleError):
+            load_srt(str(tmp_path))
+
 
 class TestValidateSrt:
     """Tests for validate_srt function."""
@@ -313,6 +529,45 @@ Second (overlaps)"""
         assert not is_valid
         assert any("Overlapping" in e for e in errors)
 
+    def test_validate_overlap_with_earlier_block(self):
+        """Test overlap is detected against any earlier block, not just the previous one."""
+        srt = """1
+00:00:00,000 --> 00:00:20,000
+Long
+
+2
+00:00:05,000 --> 00:00:06,000
+Inside
+
+3
+00:00:07,000 --> 00:00:08,000
+Also inside
+"""
+
+        is_valid, errors = validate_srt(srt)
+
+        assert not is_valid
+        assert errors == [
+            "Block 2: Overlapping with previous segment",
+            "Block 3: Overlapping with previous segment",
+        ]
+
+    def test_validate_reports_malformed_blocks_in_order(self):
+        """Test malformed blocks are diagnosed and numbered with their neighbours."""
+        srt = (
+            "1\r\n00:00:00,000 --> 00:00:01,000\r\nFirst\r\n\r\n"
+            "2\r\n00:00:01,000 -> 00:00:02,000\r\nBad arrow\r\n\r\n"
+            "7\r\n00:00:03,000 --> 00:00:04,000\r\nWrong id\r\n"
+        )
+
+        is_valid, errors = validate_srt(srt)
+
+        assert not is_valid
+        assert errors == [
+            "Block 2: Missing ' --> ' in timestamp",
+            "Block 3: Segment ID mismatch (expected 3, got 7)",
+        ]
+
     def test_validate_end_before_start(self):
         """Test detecting end time before start time."""
         srt_content = """1
@@ -0,0 +1,175 @@
+"""Tests for the worker main loop."""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from unittest.mock import patch, MagicMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+from dubwizard_shared import Base, Job, JobService, JobStatus
+from worker.tasks.process_job import JobProcessingError
+from worker.worker import Worker
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    """Sessions on a fresh SQLite database."""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'jobs.db'}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    engine.dispose()
+
+
+def _queue_jobs(db, count, first=0):
+    """Add queued jobs, each created a minute after the previous one."""
+    base = datetime(2024, 1, 1)
+    job_ids = []
+    for i in range(first, first + count):
+        db.add(Job(
+            id=f"job_{i}",
+            status=JobStatus.QUEUED,
+            progress=0,
+            input_s3_key=f"uploads/{i}.mp4",
+            source_language="english",
+            target_language="hindi",
+            voice_id="voice",
+            created_at=base + timedelta(minutes=i),
+            updated_at=base + timedelta(minutes=i),
+        ))
+        job_ids.append(f"job_{i}")
+    db.commit()
+    return job_ids
+
+
+def _polling_worker(session_factory):
+    """A Worker with only the state the polling loop needs (no engine or services)."""
+    worker = Worker.__new__(Worker)
+    worker.db = session_factory()
+    worker._pending_queue = deque()
+    return worker
+
+
+class TestClaimNextJob:
+    """Tests for Worker._claim_next_job."""
+
+    def test_claims_oldest_and_prefetches_rest(self, session_factory):
+        """Test one query fills the local queue and the oldest job is claimed."""
+        worker = _polling_worker(session_factory)
+        job_ids = _queue_jobs(worker.db, 3)
+
+        assert worker._claim_next_job() == job_ids[0]
+        assert list(worker._pending_queue) == job_ids[1:]
+        assert worker.db.get(Job, job_ids[0]).status == JobStatus.PROCESSING
+
+    def test_skips_ids_claimed_by_another_worker(self, session_factory):
+        """Test a prefetched ID another worker already claimed is skipped."""
+        worker = _polling_worker(session_factory)
+        job_ids = _queue_jobs(worker.db, 3)
+        assert worker._claim_next_job() == job_ids[0]
+
+        other = JobService(session_factory())
+        assert other.claim_job(job_ids[1]) is not None
+
+        assert worker._claim_next_job() == job_ids[2]
+        assert not worker._pending_queue
+
+    def test_refills_when_queue_runs_dry(self, session_factory):
+        """Test an empty local queue is refilled with newly queued jobs."""
+        worker = _polling_worker(session_factory)
+        (first,) = _queue_jobs(worker.db, 1)
+        assert worker._claim_next_job() == first
+        assert worker._claim_next_job() is None
+
+        later = _queue_jobs(session_factory(), 2, first=1)
+
+        assert worker._claim_next_job() == later[0]
+        assert list(worker._pending_queue) == later[1:]
+
+    def test_batch_size_limits_prefetch(self, session_factory):
+        """Test no more than PENDING_BATCH_SIZE IDs are held locally."""
+        worker = _polling_worker(session_factory)
+        worker.PENDING_BATCH_SIZE = 2
+        job_ids = _queue_jobs(worker.db, 4)
+
+        assert worker._claim_next_job() == job_ids[0]
+        assert list(worker._pending_queue) == [job_ids[1]]
+
+
+def _running_worker(session_factory, concurrency):
+    """A polling Worker with a job pool but no LISTEN connection or services."""
+    worker = _polling_worker(session_factory)
+    worker.concurrency = concurrency
+    worker.engine = MagicMock()
+    worker.Session = scoped_session(session_factory)
+    # More pool threads than slots, so only run() can hold the limit
+    worker.pool = ThreadPoolExecutor(max_workers=concurrency + 2, thread_name_prefix="job")
+    worker._listen_conn = None
+    worker.s3_service = MagicMock()
+    worker.ai_service = MagicMock()
+    return worker
+
+
+class TestProcessJob:
+    """Tests for Worker._process_job."""
+
+    @pytest.mark.parametrize("error", [RuntimeError("boom"), JobProcessingError("failed")])
+    @patch("worker.worker.JobProcessor")
+    def test_session_removed_when_processor_raises(self, mock_processor, error):
+        """Test the job thread's session is removed even if the job raises."""
+        mock_processor.return_value.process_job.side_effect = error
+        worker = Worker.__new__(Worker)
+        worker.Session = MagicMock()
+        worker.s3_service = MagicMock()
+        worker.ai_service = MagicMock()
+
+        worker._process_job("job_0")
+
+        mock_processor.return_value.process_job.assert_called_once_with("job_0")
+        worker.Session.remove.assert_called_once()
+
+
+class TestRun:
+    """Tests for Worker.run."""
+
+    @patch("worker.worker.signal.signal")
+    @patch("worker.worker.JobProcessor")
+    def test_in_flight_jobs_capped_at_concurrency(
+        self, mock_processor, mock_signal, session_factory
+    ):
+        """Test no more than WORKER_CONCURRENCY jobs run at once."""
+        worker = _running_worker(session_factory, concurrency=2)
+        job_ids = _queue_jobs(worker.db, 6)
+
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+        processed = []
+
+        def process_job(job_id):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+                processed.append(job_id)
+                if len(processed) == len(job_ids):
+                    worker.stop()
+
+        mock_processor.return_value.process_job.side_effect = process_job
+
+        runner = threading.Thread(target=worker.run)
+        runner.start()
+        runner.join(timeout=10)
+
+        assert not runner.is_alive()
+        assert sorted(processed) == job_ids
+        assert peak == 2
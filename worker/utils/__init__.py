@@ -3,19 +3,32 @@
 from worker.utils.ffmpeg_helpers import (
     FFmpegError,
     extract_audio,
+    extract_audio_multi,
+    extract_audio_async,
+    extract_audio_from_stream,
     get_video_duration,
     get_video_metadata,
     get_audio_duration,
+    clear_probe_cache,
     mux_audio_video,
+    mux_audio_video_with_subs,
     concatenate_audio_files,
+    concatenate_audio_files_async,
+    decode_audio_to_numpy,
+    stream_audio_to_array,
+    decode_audio_to_pcm,
+    encode_pcm_to_file,
     convert_audio_format,
+    convert_audio_format_async,
 )
 from worker.utils.subtitle_generator import (
     SubtitleError,
     format_srt_time,
     parse_srt_time,
     generate_srt,
+    stream_srt,
     save_srt,
+    save_srt_pair,
     parse_srt,
     load_srt,
     validate_srt,
@@ -24,17 +37,30 @@ from worker.utils.subtitle_generator import (
 __all__ = [
     "FFmpegError",
     "extract_audio",
+    "extract_audio_multi",
+    "extract_audio_async",
+    "extract_audio_from_stream",
     "get_video_duration",
     "get_video_metadata",
     "get_audio_duration",
+    "clear_probe_cache",
     "mux_audio_video",
+    "mux_audio_video_with_subs",
     "concatenate_audio_files",
+    "concatenate_audio_files_async",
+    "decode_audio_to_numpy",
+    "stream_audio_to_array",
+    "decode_audio_to_pcm",
+    "encode_pcm_to_file",
     "convert_audio_format",
+    "convert_audio_format_async",
     "SubtitleError",
     "format_srt_time",
     "parse_srt_time",
     "generate_srt",
+    "stream_srt",
     "save_srt",
+    "save_srt_pair",
     "parse_srt",
     "load_srt",
     "validate_srt",
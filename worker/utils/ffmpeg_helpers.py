@@ -1,62 +1,204 @@
 """FFmpeg helper functions for video/audio processing."""
 
+import asyncio
+import collections
+import functools
 import logging
+import os
+import shutil
 import subprocess
+import tempfile
+import threading
 import json
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # Optional: faster ffprobe JSON parsing
+    _loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+# Executables resolved once, so spawns skip the PATH search; if a binary
+# isn't found the bare name is kept and the spawn reports it as missing
+_FFMPEG = shutil.which("ffmpeg") or "ffmpeg"
+_FFPROBE = shutil.which("ffprobe") or "ffprobe"
+
+# Read size when piping streams into FFmpeg
+STREAM_CHUNK_SIZE = 1 << 20
+
+# FFmpeg/FFprobe stderr text for a missing input file (ENOENT)
+MISSING_FILE_MARKER = "No such file or directory"
+
+# Python creates fds non-inheritable (PEP 446), so children don't need the
+# per-spawn sweep over the whole fd table that close_fds=True performs
+CLOSE_FDS = False
+
+# Seconds an FFmpeg/FFprobe run may take before it is killed
+FFMPEG_TIMEOUT = 300
+
+# Lines of FFmpeg stderr kept for error reports
+STDERR_TAIL_LINES = 256
+
+# Entries kept per probe cache (keyed on path, mtime and size)
+PROBE_CACHE_SIZE = 1024
+
+# Inputs per partition when an MP3 concatenation is split across processes
+CONCAT_PARTITION_SIZE = 32
+
+# Audio codecs that can be stream-copied into these containers when muxing
+COPYABLE_AUDIO_CODECS = {"aac", "mp3"}
+COPY_AUDIO_CONTAINERS = {".mp4", ".m4v", ".mov"}
+
+# Upper bound on FFmpeg processes run concurrently by the async helpers
+ASYNC_FFMPEG_CONCURRENCY = os.cpu_count() or 4
+
+# asyncio semaphores belong to one event loop, so keep one per loop
+_async_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 class FFmpegError(Exception):
     """Exception raised when FFmpeg operations fail."""
     pass
 
 
-def _run_ffmpeg(args: list, description: str) -> subprocess.CompletedProcess:
+def _raise_tool_error(tool: str, stderr: str) -> None:
+    """
+    Raise the appropriate exception for a failed FFmpeg/FFprobe run.
+
+    Input files are not stat'ed up front; FFmpeg's own ENOENT report is
+    mapped to FileNotFoundError instead.
+
+    Raises:
+        FileNotFoundError: If the tool reported a missing input file
+        FFmpegError: For any other failure
+    """
+    logger.error(f"{tool} error: {stderr}")
+    if MISSING_FILE_MARKER in stderr:
+        raise FileNotFoundError(stderr.strip())
+    raise FFmpegError(f"{tool} failed: {stderr}")
+
+
+def _drain_stderr(
+    stderr,
+    tail: Deque[bytes],
+    progress_cb: Optional[Callable[[Dict[str, str]], None]] = None,
+) -> None:
+    """
+    Read FFmpeg's stderr to EOF, keeping only the last lines.
+
+    With ``progress_cb``, ``-progress`` key=value lines are collected into a
+    dict that is passed to the callback at every ``progress=`` line; they are
+    left out of the tail.
+    """
+    progress = {}
+    for line in stderr:
+        if progress_cb is not None:
+            key, sep, value = line.strip().partition(b"=")
+            if sep and key and b" " not in key:
+                progress[key.decode("ascii", "replace")] = value.decode("utf-8", "replace")
+                if key == b"progress":
+                    try:
+                        progress_cb(progress)
+                    except Exception as e:
+                        logger.warning(f"FFmpeg progress callback failed: {e}")
+                    progress = {}
+                continue
+        tail.append(line)
+
+
+def _run_ffmpeg(
+    args: list,
+    description: str,
+    input: Optional[str] = None,
+    progress_cb: Optional[Callable[[Dict[str, str]], None]] = None,
+) -> subprocess.CompletedProcess:
     """
     Run FFmpeg command with error handling.
 
+    stderr is drained by a reader thread and only the last
+    ``STDERR_TAIL_LINES`` lines are kept, so memory stays bounded however
+    verbose FFmpeg is.
+
     Args:
         args: FFmpeg command arguments
         description: Description of the operation for logging
+        input: Optional text to feed to FFmpeg's stdin (e.g. a concat list)
+        progress_cb: Optional callback receiving FFmpeg's ``-progress``
+            fields (e.g. ``out_time_ms``, ``frame``) after each update
 
     Returns:
-        CompletedProcess result
+        CompletedProcess result; stderr holds the kept tail
 
     Raises:
         FFmpegError: If FFmpeg command fails
     """
-    try:
-        logger.info(f"Running FFmpeg: {description}")
-        logger.debug(f"FFmpeg command: {' '.join(args)}")
+    # Global options go right after the binary; the periodic stats line is
+    # replaced by -progress output when a callback wants it
+    cmd = [args[0], "-nostats"]
+    if progress_cb is not None:
+        cmd.extend(["-progress", "pipe:2"])
+    cmd.extend(args[1:])
 
-        result = subprocess.run(
-            args,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
+    logger.info(f"Running FFmpeg: {description}")
+    logger.debug(f"FFmpeg command: {' '.join(cmd)}")
+
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE if input is not None else None,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            close_fds=CLOSE_FDS,
         )
+    except FileNotFoundError:
+        logger.error("FFmpeg not found in PATH")
+        raise FFmpegError("FFmpeg is not installed or not in PATH")
 
-        if result.returncode != 0:
-            logger.error(f"FFmpeg error: {result.stderr}")
-            raise FFmpegError(f"FFmpeg failed: {result.stderr}")
+    tail = collections.deque(maxlen=STDERR_TAIL_LINES)
+    reader = threading.Thread(
+        target=_drain_stderr, args=(proc.stderr, tail, progress_cb), daemon=True
+    )
+    reader.start()
 
-        return result
+    if input is not None:
+        try:
+            proc.stdin.write(input.encode("utf-8"))
+            proc.stdin.close()
+        except BrokenPipeError:
+            # FFmpeg exited early; its stderr explains why
+            pass
 
+    try:
+        returncode = proc.wait(timeout=FFMPEG_TIMEOUT)
     except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
         logger.error(f"FFmpeg timeout: {description}")
         raise FFmpegError(f"FFmpeg operation timed out: {description}")
-    except FileNotFoundError:
-        logger.error("FFmpeg not found in PATH")
-        raise FFmpegError("FFmpeg is not installed or not in PATH")
+    reader.join()
 
+    stderr = b"".join(tail).decode("utf-8", "replace")
+    if returncode != 0:
+        _raise_tool_error("FFmpeg", stderr)
 
-def _run_ffprobe(args: list, description: str) -> str:
+    return subprocess.CompletedProcess(cmd, returncode, stderr=stderr)
+
+
+def _run_ffprobe(args: list, description: str) -> bytes:
     """
     Run FFprobe command with error handling.
 
+    Output is returned as raw bytes; the JSON decoder takes them directly.
+
     Args:
         args: FFprobe command arguments
         description: Description of the operation for logging
@@ -74,16 +216,9 @@ def _run_ffprobe(args: list, description: str) -> str:
         result = subprocess.run(
             args,
             capture_output=True,
-            text=True,
-            timeout=60  # 1 minute timeout
+            timeout=60,  # 1 minute timeout
+            close_fds=CLOSE_FDS,
         )
-
-        if result.returncode != 0:
-            logger.error(f"FFprobe error: {result.stderr}")
-            raise FFmpegError(f"FFprobe failed: {result.stderr}")
-
-        return result.stdout
-
     except subprocess.TimeoutExpired:
         logger.error(f"FFprobe timeout: {description}")
         raise FFmpegError(f"FFprobe operation timed out: {description}")
@@ -91,6 +226,151 @@ def _run_ffprobe(args: list, description: str) -> str:
         logger.error("FFprobe not found in PATH")
         raise FFmpegError("FFprobe is not installed or not in PATH")
 
+    if result.returncode != 0:
+        _raise_tool_error("FFprobe", result.stderr.decode("utf-8", "replace"))
+
+    return result.stdout
+
+
+def _feed_stdin(stdin, data: bytes) -> None:
+    """Write ``data`` to a process's stdin and close it."""
+    try:
+        stdin.write(data)
+        stdin.close()
+    except BrokenPipeError:
+        # FFmpeg exited early; its stderr explains why
+        pass
+
+
+def _run_ffmpeg_pipe(args: list, description: str, input: Optional[bytes] = None) -> bytes:
+    """
+    Run FFmpeg command that exchanges raw bytes over stdin/stdout.
+
+    As in ``_run_ffmpeg``, only the last ``STDERR_TAIL_LINES`` lines of
+    stderr are kept. stdin, stdout and stderr are each serviced by their own
+    thread, so a large input can't deadlock against unread output and a hung
+    FFmpeg is still killed at the timeout.
+
+    Args:
+        args: FFmpeg command arguments
+        description: Description of the operation for logging
+        input: Optional bytes to feed to FFmpeg's stdin
+
+    Returns:
+        stdout output from FFmpeg
+
+    Raises:
+        FFmpegError: If FFmpeg command fails
+    """
+    cmd = [args[0], "-nostats", *args[1:]]
+
+    logger.info(f"Running FFmpeg: {description}")
+    logger.debug(f"FFmpeg command: {' '.join(cmd)}")
+
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE if input is not None else None,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            close_fds=CLOSE_FDS,
+        )
+    except FileNotFoundError:
+        logger.error("FFmpeg not found in PATH")
+        raise FFmpegError("FFmpeg is not installed or not in PATH")
+
+    tail = collections.deque(maxlen=STDERR_TAIL_LINES)
+    output = []
+    pipes = [
+        threading.Thread(target=_drain_stderr, args=(proc.stderr, tail), daemon=True),
+        threading.Thread(target=lambda: output.append(proc.stdout.read()), daemon=True),
+    ]
+    if input is not None:
+        pipes.append(threading.Thread(target=_feed_stdin, args=(proc.stdin, input), daemon=True))
+    for pipe in pipes:
+        pipe.start()
+
+    try:
+        returncode = proc.wait(timeout=FFMPEG_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+        logger.error(f"FFmpeg timeout: {description}")
+        raise FFmpegError(f"FFmpeg operation timed out: {description}")
+    finally:
+        for pipe in pipes:
+            pipe.join()
+
+    if returncode != 0:
+        _raise_tool_error("FFmpeg", b"".join(tail).decode("utf-8", "replace"))
+
+    return b"".join(output)
+
+
+def _get_async_semaphore() -> asyncio.Semaphore:
+    """Return the FFmpeg concurrency semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    semaphore = _async_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(ASYNC_FFMPEG_CONCURRENCY)
+        _async_semaphores[loop] = semaphore
+    return semaphore
+
+
+async def _run_ffmpeg_async(
+    args: list,
+    description: str,
+    input: Optional[str] = None,
+) -> bytes:
+    """
+    Run FFmpeg command without blocking the event loop.
+
+    At most ``ASYNC_FFMPEG_CONCURRENCY`` commands run at once, so callers
+    can ``asyncio.gather`` any number of independent jobs.
+
+    Args:
+        args: FFmpeg command arguments
+        description: Description of the operation for logging
+        input: Optional text to feed to FFmpeg's stdin (e.g. a concat list)
+
+    Returns:
+        stdout output from FFmpeg
+
+    Raises:
+        FFmpegError: If FFmpeg command fails
+    """
+    async with _get_async_semaphore():
+        logger.info(f"Running FFmpeg: {description}")
+        logger.debug(f"FFmpeg command: {' '.join(args)}")
+
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *args,
+                stdin=asyncio.subprocess.PIPE if input is not None else asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                close_fds=CLOSE_FDS,
+            )
+        except FileNotFoundError:
+            logger.error("FFmpeg not found in PATH")
+            raise FFmpegError("FFmpeg is not installed or not in PATH")
+
+        try:
+            stdout, stderr = await asyncio.wait_for(
+                proc.communicate(input.encode("utf-8") if input is not None else None),
+                timeout=FFMPEG_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            logger.error(f"FFmpeg timeout: {description}")
+            raise FFmpegError(f"FFmpeg operation timed out: {description}")
+
+    if proc.returncode != 0:
+        _raise_tool_error("FFmpeg", stderr.decode("utf-8", "replace"))
+
+    return stdout
+
 
 def extract_audio(
     video_path: str,
@@ -114,18 +394,144 @@ def extract_audio(
         FFmpegError: If extraction fails
         FileNotFoundError: If input video doesn't exist
     """
-    video_path = Path(video_path)
-    output_path = Path(output_path)
+    return extract_audio_multi(video_path, [(output_path, _wav_options(sample_rate, channels))])[0]
 
-    if not video_path.exists():
-        raise FileNotFoundError(f"Video file not found: {video_path}")
 
-    # Ensure output directory exists
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+async def extract_audio_async(
+    video_path: str,
+    output_path: str,
+    sample_rate: int = 16000,
+    channels: int = 1
+) -> str:
+    """
+    Async variant of ``extract_audio``.
+
+    Raises:
+        FFmpegError: If extraction fails
+        FileNotFoundError: If input video doesn't exist
+    """
+    args, output_paths = _extract_audio_multi_command(
+        video_path, [(output_path, _wav_options(sample_rate, channels))]
+    )
+    await _run_ffmpeg_async(args, f"Extract audio from {Path(video_path).name}")
+    return _check_extracted_audio(output_paths)[0]
+
+
+def _wav_options(sample_rate: int, channels: int) -> Dict:
+    """Output options for a PCM WAV extraction."""
+    return {
+        "acodec": "pcm_s16le",  # PCM 16-bit little-endian
+        "ar": sample_rate,  # Sample rate
+        "ac": channels,  # Channels
+    }
+
+
+def _extract_audio_multi_command(
+    video_path: str,
+    outputs: List[Tuple[str, Dict]],
+) -> Tuple[list, List[Path]]:
+    """Build the FFmpeg arguments for ``extract_audio_multi``."""
+    if not outputs:
+        raise ValueError("No outputs provided for audio extraction")
 
     args = [
-        "ffmpeg",
+        _FFMPEG,
+        "-threads", "0",  # Decoder threads: one per core
         "-i", str(video_path),
+        "-y",  # Overwrite outputs
+    ]
+
+    output_paths = []
+    for output_path, options in outputs:
+        output_path = Path(output_path)
+        # Ensure output directory exists
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        args.extend(["-map", "0:a", "-vn"])
+        for key, value in options.items():
+            args.extend([f"-{key}", str(value)])
+        args.append(str(output_path))
+        output_paths.append(output_path)
+
+    return args, output_paths
+
+
+def _check_extracted_audio(output_paths: List[Path]) -> List[str]:
+    """Verify that every extraction output was written."""
+    for output_path in output_paths:
+        if not output_path.exists():
+            raise FFmpegError(f"Audio extraction failed: output file not created")
+        logger.info(f"Audio extracted to {output_path}")
+
+    return [str(output_path) for output_path in output_paths]
+
+
+def extract_audio_multi(
+    video_path: str,
+    outputs: List[Tuple[str, Dict]],
+) -> List[str]:
+    """
+    Extract several audio outputs from a video with a single FFmpeg run.
+
+    The container is demuxed and the audio stream decoded once; each output
+    gets its own encoder/filter options, e.g.
+    ``[("whisper.wav", {"ar": 16000, "ac": 1}),
+    ("normalized.wav", {"af": "loudnorm"})]``.
+
+    Args:
+        video_path: Path to input video file
+        outputs: List of (output_path, options) tuples; each option key is
+            passed to FFmpeg as ``-<key> <value>`` for that output
+
+    Returns:
+        List of paths to extracted audio files, in the order given
+
+    Raises:
+        FFmpegError: If extraction fails
+        FileNotFoundError: If input video doesn't exist
+        ValueError: If no outputs are given
+    """
+    args, output_paths = _extract_audio_multi_command(video_path, outputs)
+    _run_ffmpeg(args, f"Extract audio from {Path(video_path).name}")
+    return _check_extracted_audio(output_paths)
+
+
+def extract_audio_from_stream(
+    stream,
+    output_path: str,
+    sample_rate: int = 16000,
+    channels: int = 1,
+    tee_path: Optional[str] = None,
+) -> str:
+    """
+    Extract audio as WAV from a video byte stream piped into FFmpeg.
+
+    Decoding overlaps with reading the stream (e.g. an S3 download), so the
+    video never has to be written to disk before extraction starts. If
+    ``tee_path`` is given, the stream is also saved there; the copy is always
+    completed, even if FFmpeg fails, so callers can fall back to
+    ``extract_audio`` on the saved file.
+
+    Args:
+        stream: Readable binary file-like object with the video data
+        output_path: Path for output WAV file
+        sample_rate: Audio sample rate (default 16000 for Whisper)
+        channels: Number of audio channels (default 1 for mono)
+        tee_path: Optional path to save a copy of the streamed video
+
+    Returns:
+        Path to extracted audio file
+
+    Raises:
+        FFmpegError: If extraction fails
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    args = [
+        _FFMPEG,
+        "-threads", "0",  # Decoder threads: one per core
+        "-i", "pipe:0",
         "-vn",  # No video
         "-acodec", "pcm_s16le",  # PCM 16-bit little-endian
         "-ar", str(sample_rate),  # Sample rate
@@ -134,7 +540,93 @@ def extract_audio(
         str(output_path)
     ]
 
-    _run_ffmpeg(args, f"Extract audio from {video_path.name}")
+    description = "Extract audio from stream"
+    logger.info(f"Running FFmpeg: {description}")
+    logger.debug(f"FFmpeg command: {' '.join(args)}")
+
+    proc = None
+    error = None
+    try:
+        proc = subprocess.Popen(
+            args,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            close_fds=CLOSE_FDS,
+        )
+    except FileNotFoundError:
+        logger.error("FFmpeg not found in PATH")
+        error = "FFmpeg is not installed or not in PATH"
+
+    tail = collections.deque(maxlen=STDERR_TAIL_LINES)
+    reader = None
+    watchdog = None
+    timed_out = threading.Event()
+    if proc is not None:
+        # Drain stderr in the background so FFmpeg never blocks on a full pipe
+        reader = threading.Thread(target=_drain_stderr, args=(proc.stderr, tail), daemon=True)
+        reader.start()
+
+        # The timeout covers the copy as well: killing FFmpeg also unblocks a
+        # write stuck on a pipe it has stopped reading
+        def _kill_on_timeout():
+            timed_out.set()
+            proc.kill()
+
+        watchdog = threading.Timer(FFMPEG_TIMEOUT, _kill_on_timeout)
+        watchdog.daemon = True
+        watchdog.start()
+
+    ffmpeg_stdin = proc.stdin if proc is not None else None
+    tee_file = open(tee_path, "wb") if tee_path else None
+    try:
+        while True:
+            chunk = stream.read(STREAM_CHUNK_SIZE)
+            if not chunk:
+                break
+            if tee_file:
+                tee_file.write(chunk)
+            if ffmpeg_stdin:
+                try:
+                    ffmpeg_stdin.write(chunk)
+                except OSError:
+                    # FFmpeg exited early or was killed (broken pipe); keep saving the copy
+                    ffmpeg_stdin = None
+            elif not tee_file:
+                break
+    except BaseException:
+        # Reading the source failed; don't leave FFmpeg or its reader behind
+        if proc is not None:
+            watchdog.cancel()
+            proc.kill()
+            proc.wait()
+            reader.join()
+        raise
+    finally:
+        if tee_file:
+            tee_file.close()
+        if proc is not None:
+            try:
+                proc.stdin.close()
+            except OSError:
+                pass
+
+    if error:
+        raise FFmpegError(error)
+
+    try:
+        # The watchdog kills FFmpeg once the deadline passes
+        returncode = proc.wait()
+    finally:
+        watchdog.cancel()
+    reader.join()
+
+    if timed_out.is_set():
+        logger.error(f"FFmpeg timeout: {description}")
+        raise FFmpegError(f"FFmpeg operation timed out: {description}")
+
+    if returncode != 0:
+        _raise_tool_error("FFmpeg", b"".join(tail).decode("utf-8", "replace"))
 
     if not output_path.exists():
         raise FFmpegError(f"Audio extraction failed: output file not created")
@@ -147,6 +639,9 @@ def get_video_duration(video_path: str) -> float:
     """
     Get video duration in seconds.
 
+    Results are cached per (path, mtime, size), so repeated queries for an
+    unchanged file don't spawn another ffprobe.
+
     Args:
         video_path: Path to video file
 
@@ -157,23 +652,43 @@ def get_video_duration(video_path: str) -> float:
         FFmpegError: If duration cannot be determined
         FileNotFoundError: If video doesn't exist
     """
-    video_path = Path(video_path)
+    return _probe_video_duration(*_probe_cache_key(video_path))
 
-    if not video_path.exists():
-        raise FileNotFoundError(f"Video file not found: {video_path}")
 
+def _probe_cache_key(path: str) -> Tuple[str, int, int]:
+    """
+    Build the (path, mtime_ns, size) key for the probe caches.
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+    """
+    stat = os.stat(path)
+    return str(path), stat.st_mtime_ns, stat.st_size
+
+
+def clear_probe_cache() -> None:
+    """Drop all cached ffprobe results."""
+    _probe_video_duration.cache_clear()
+    _probe_video_metadata.cache_clear()
+    _probe_audio_duration.cache_clear()
+    _probe_audio_codec.cache_clear()
+
+
+@functools.lru_cache(maxsize=PROBE_CACHE_SIZE)
+def _probe_video_duration(video_path: str, mtime_ns: int, size: int) -> float:
+    """Probe video duration; mtime_ns and size only serve as cache keys."""
     args = [
-        "ffprobe",
+        _FFPROBE,
         "-v", "error",
         "-show_entries", "format=duration",
         "-of", "json",
-        str(video_path)
+        video_path
     ]
 
-    output = _run_ffprobe(args, f"Get duration of {video_path.name}")
+    output = _run_ffprobe(args, f"Get duration of {Path(video_path).name}")
 
     try:
-        data = json.loads(output)
+        data = _loads(output)
         duration = float(data["format"]["duration"])
         logger.info(f"Video duration: {duration:.2f} seconds")
         return duration
@@ -185,6 +700,9 @@ def get_video_metadata(video_path: str) -> Dict:
     """
     Get video metadata including resolution, fps, and codec.
 
+    Results are cached per (path, mtime, size); each call returns a fresh
+    copy of the cached dict.
+
     Args:
         video_path: Path to video file
 
@@ -201,17 +719,19 @@ def get_video_metadata(video_path: str) -> Dict:
         FFmpegError: If metadata cannot be determined
         FileNotFoundError: If video doesn't exist
     """
-    video_path = Path(video_path)
+    return dict(_probe_video_metadata(*_probe_cache_key(video_path)))
 
-    if not video_path.exists():
-        raise FileNotFoundError(f"Video file not found: {video_path}")
 
+@functools.lru_cache(maxsize=PROBE_CACHE_SIZE)
+def _probe_video_metadata(video_path: str, mtime_ns: int, size: int) -> Dict:
+    """Probe video metadata; mtime_ns and size only serve as cache keys."""
+    video_path = Path(video_path)
+
+    # One probe for both streams: first video and first audio stream win
     args = [
-        "ffprobe",
+        _FFPROBE,
         "-v", "error",
-        "-select_streams", "v:0",
-        "-show_entries", "stream=width,height,r_frame_rate,codec_name",
-        "-show_entries", "format=duration",
+        "-show_entries", "stream=codec_type,codec_name,width,height,r_frame_rate:format=duration",
         "-of", "json",
         str(video_path)
     ]
@@ -219,41 +739,30 @@ def get_video_metadata(video_path: str) -> Dict:
     output = _run_ffprobe(args, f"Get metadata of {video_path.name}")
 
     try:
-        data = json.loads(output)
+        data = _loads(output)
 
         metadata = {
             "duration": float(data.get("format", {}).get("duration", 0)),
         }
 
-        if data.get("streams"):
-            stream = data["streams"][0]
-            metadata["width"] = stream.get("width")
-            metadata["height"] = stream.get("height")
-            metadata["video_codec"] = stream.get("codec_name")
-
-            # Parse frame rate (e.g., "30/1" or "30000/1001")
-            fps_str = stream.get("r_frame_rate", "0/1")
-            if "/" in fps_str:
-                num, den = fps_str.split("/")
-                metadata["fps"] = float(num) / float(den) if float(den) != 0 else 0
-            else:
-                metadata["fps"] = float(fps_str)
-
-        # Get audio codec
-        audio_args = [
-            "ffprobe",
-            "-v", "error",
-            "-select_streams", "a:0",
-            "-show_entries", "stream=codec_name",
-            "-of", "json",
-            str(video_path)
-        ]
+        for stream in data.get("streams", []):
+            codec_type = stream.get("codec_type")
+
+            if codec_type == "video" and "video_codec" not in metadata:
+                metadata["width"] = stream.get("width")
+                metadata["height"] = stream.get("height")
+                metadata["video_codec"] = stream.get("codec_name")
 
-        audio_output = _run_ffprobe(audio_args, f"Get audio codec of {video_path.name}")
-        audio_data = json.loads(audio_output)
+                # Parse frame rate (e.g., "30/1" or "30000/1001")
+                fps_str = stream.get("r_frame_rate", "0/1")
+                if "/" in fps_str:
+                    num, den = fps_str.split("/")
+                    metadata["fps"] = float(num) / float(den) if float(den) != 0 else 0
+                else:
+                    metadata["fps"] = float(fps_str)
 
-        if audio_data.get("streams"):
-            metadata["audio_codec"] = audio_data["streams"][0].get("codec_name")
+            elif codec_type == "audio" and "audio_codec" not in metadata:
+                metadata["audio_codec"] = stream.get("codec_name")
 
         logger.info(f"Video metadata: {metadata}")
         return metadata
@@ -271,6 +780,11 @@ def mux_audio_video(
     """
     Replace or add audio track to video.
 
+    The video stream is always copied without re-encoding, and the MP4 is
+    written with the moov atom first so it can start playing while it is
+    still downloading. When replacing the audio, AAC or MP3 input is copied
+    into MP4 outputs as well; anything else is encoded to AAC.
+
     Args:
         video_path: Path to input video file
         audio_path: Path to new audio file
@@ -288,18 +802,13 @@ def mux_audio_video(
     audio_path = Path(audio_path)
     output_path = Path(output_path)
 
-    if not video_path.exists():
-        raise FileNotFoundError(f"Video file not found: {video_path}")
-    if not audio_path.exists():
-        raise FileNotFoundError(f"Audio file not found: {audio_path}")
-
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
     if keep_original_audio:
         # Mix original and new audio
         args = [
-            "ffmpeg",
+            _FFMPEG,
             "-i", str(video_path),
             "-i", str(audio_path),
             "-filter_complex", "[0:a][1:a]amix=inputs=2:duration=first[aout]",
@@ -307,19 +816,22 @@ def mux_audio_video(
             "-map", "[aout]",
             "-c:v", "copy",
             "-c:a", "aac",
+            "-b:a", "192k",
+            "-threads", "0",
+            "-movflags", "+faststart",
             "-y",
             str(output_path)
         ]
     else:
         # Replace audio completely
         args = [
-            "ffmpeg",
+            _FFMPEG,
             "-i", str(video_path),
             "-i", str(audio_path),
             "-map", "0:v",  # Video from first input
             "-map", "1:a",  # Audio from second input
-            "-c:v", "copy",  # Copy video codec
-            "-c:a", "aac",  # Encode audio as AAC
+            *_mux_codec_args(audio_path, output_path),
+            "-movflags", "+faststart",  # moov atom first for progressive playback
             "-shortest",  # Match shortest stream duration
             "-y",
             str(output_path)
@@ -334,68 +846,460 @@ def mux_audio_video(
     return str(output_path)
 
 
+def mux_audio_video_with_subs(
+    video_path: str,
+    audio_path: str,
+    source_srt_path: str,
+    target_srt_path: str,
+    output_path: str,
+    source_language: str = "und",
+    target_language: str = "und",
+) -> str:
+    """
+    Replace the audio track and embed two subtitle tracks in a single pass.
+
+    The video stream is copied without re-encoding and both SRT files are
+    converted to MP4 text tracks (mov_text) in the same FFmpeg invocation.
+    AAC or MP3 audio is copied as well; anything else is encoded to AAC.
+
+    Args:
+        video_path: Path to input video file
+        audio_path: Path to new audio file
+        source_srt_path: Path to source language SRT file
+        target_srt_path: Path to target language SRT file
+        output_path: Path for output video file
+        source_language: ISO 639-2 code for the source subtitle track
+        target_language: ISO 639-2 code for the target subtitle track
+
+    Returns:
+        Path to output video file
+
+    Raises:
+        FFmpegError: If muxing fails
+        FileNotFoundError: If input files don't exist
+    """
+    video_path = Path(video_path)
+    output_path = Path(output_path)
+
+    # An SRT without entries has no subtitle stream to map, so it is left out
+    subtitles = [
+        (srt_path, language)
+        for srt_path, language in (
+            (Path(source_srt_path), source_language),
+            (Path(target_srt_path), target_language),
+        )
+        if _srt_has_entries(srt_path)
+    ]
+    if not subtitles:
+        logger.warning("Both subtitle files are empty, muxing audio only")
+        return mux_audio_video(str(video_path), str(audio_path), str(output_path))
+
+    # Ensure output directory exists
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    subtitle_inputs = []
+    subtitle_maps = []
+    subtitle_metadata = []
+    for i, (srt_path, language) in enumerate(subtitles):
+        subtitle_inputs += ["-i", str(srt_path)]
+        subtitle_maps += ["-map", f"{i + 2}:s"]  # Subtitles from the SRT inputs
+        subtitle_metadata += [f"-metadata:s:s:{i}", f"language={language}"]
+
+    args = [
+        _FFMPEG,
+        "-i", str(video_path),
+        "-i", str(audio_path),
+        *subtitle_inputs,
+        "-map", "0:v",  # Video from first input
+        "-map", "1:a",  # Audio from second input
+        *subtitle_maps,
+        *_mux_codec_args(Path(audio_path), output_path),
+        "-c:s", "mov_text",  # MP4 text subtitles
+        *subtitle_metadata,
+        "-movflags", "+faststart",  # moov atom first for progressive playback
+        "-shortest",  # Match shortest stream duration
+        "-y",
+        str(output_path)
+    ]
+
+    _run_ffmpeg(args, f"Mux audio and subtitles into {video_path.name}")
+
+    if not output_path.exists():
+        raise FFmpegError(f"Audio muxing failed: output file not created")
+
+    logger.info(f"Video with new audio and subtitles saved to {output_path}")
+    return str(output_path)
+
+
+def _srt_has_entries(srt_path: Path) -> bool:
+    """
+    Check whether an SRT file holds at least one entry.
+
+    The SRT writers leave the file empty when every segment was skipped.
+
+    Raises:
+        FileNotFoundError: If the SRT file doesn't exist
+    """
+    try:
+        with open(srt_path, "rb") as fh:
+            # Entries start right at the top of the file; only the head is read
+            return bool(fh.read(STREAM_CHUNK_SIZE).strip())
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Subtitle file not found: {srt_path}")
+
+
+def _mux_codec_args(audio_path: Path, output_path: Path) -> List[str]:
+    """
+    Codec arguments for muxing a replacement audio track.
+
+    Video is always copied. Audio is copied too when the container accepts
+    its codec, and encoded to AAC otherwise (or when the probe fails).
+    """
+    audio_codec = None
+    if output_path.suffix.lower() in COPY_AUDIO_CONTAINERS:
+        try:
+            audio_codec = _probe_audio_codec(*_probe_cache_key(audio_path))
+        except (FFmpegError, FileNotFoundError) as e:
+            logger.warning(f"Could not probe audio codec of {audio_path.name}, re-encoding: {e}")
+
+    if audio_codec in COPYABLE_AUDIO_CODECS:
+        return ["-c:v", "copy", "-c:a", "copy"]
+
+    return [
+        "-c:v", "copy",  # Copy video codec
+        "-c:a", "aac",  # Encode audio as AAC
+        "-b:a", "192k",
+        "-threads", "0",  # Encoder threads: one per core
+    ]
+
+
+@functools.lru_cache(maxsize=PROBE_CACHE_SIZE)
+def _probe_audio_codec(audio_path: str, mtime_ns: int, size: int) -> Optional[str]:
+    """Probe the first audio stream's codec; mtime_ns and size only serve as cache keys."""
+    args = [
+        _FFPROBE,
+        "-v", "error",
+        "-select_streams", "a:0",
+        "-show_entries", "stream=codec_name",
+        "-of", "json",
+        audio_path
+    ]
+
+    output = _run_ffprobe(args, f"Get audio codec of {Path(audio_path).name}")
+
+    try:
+        streams = _loads(output).get("streams", [])
+    except ValueError as e:
+        raise FFmpegError(f"Failed to parse audio codec: {e}")
+
+    return streams[0].get("codec_name") if streams else None
+
+
 def concatenate_audio_files(
     audio_files: list,
     output_path: str,
-    format: str = "mp3"
+    format: str = "mp3",
+    parallel: Optional[int] = None,
 ) -> str:
     """
     Concatenate multiple audio files into one.
 
+    MP3 inputs concatenated to MP3 are joined with FFmpeg's ``concat:``
+    protocol and stream-copied, without decoding or re-encoding. Long MP3
+    lists are split into contiguous partitions that are joined by parallel
+    FFmpeg processes, then the partial files are joined in order. Other
+    formats go through the concat demuxer with the list piped to stdin.
+
     Args:
         audio_files: List of paths to audio files
         output_path: Path for output audio file
         format: Output format (mp3, wav, etc.)
+        parallel: Number of MP3 partitions; defaults to one per
+            ``CONCAT_PARTITION_SIZE`` inputs, capped at the CPU count
 
     Returns:
         Path to concatenated audio file
 
     Raises:
         FFmpegError: If concatenation fails
+        FileNotFoundError: If an input file doesn't exist
         ValueError: If audio_files is empty
     """
+    if parallel is None:
+        parallel = min(len(audio_files) // CONCAT_PARTITION_SIZE + 1, os.cpu_count() or 1)
+    if parallel > 1 and len(audio_files) > 1 and _is_stream_copy_concat(audio_files, format):
+        return _concatenate_partitioned(audio_files, output_path, parallel)
+
+    args, concat_list = _concat_command(audio_files, output_path, format)
+    _run_ffmpeg(args, f"Concatenate {len(audio_files)} audio files", input=concat_list)
+    return _check_concatenated_audio(output_path)
+
+
+def _concatenate_partitioned(audio_files: list, output_path: str, parallel: int) -> str:
+    """Join contiguous MP3 partitions concurrently, then join the partial files."""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Contiguous slices keep the segments in order
+    size = -(-len(audio_files) // parallel)
+    chunks = [audio_files[i:i + size] for i in range(0, len(audio_files), size)]
+
+    with tempfile.TemporaryDirectory(dir=output_path.parent) as temp_dir:
+        parts = [str(Path(temp_dir) / f"part_{i}.mp3") for i in range(len(chunks))]
+
+        # FFmpeg does the work in child processes; threads only wait on them
+        with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+            list(executor.map(
+                lambda chunk, part: concatenate_audio_files(chunk, part, "mp3", parallel=1),
+                chunks,
+                parts,
+            ))
+
+        return concatenate_audio_files(parts, str(output_path), "mp3", parallel=1)
+
+
+async def concatenate_audio_files_async(
+    audio_files: list,
+    output_path: str,
+    format: str = "mp3"
+) -> str:
+    """
+    Async variant of ``concatenate_audio_files``.
+
+    Raises:
+        FFmpegError: If concatenation fails
+        FileNotFoundError: If an input file doesn't exist
+        ValueError: If audio_files is empty
+    """
+    args, concat_list = _concat_command(audio_files, output_path, format)
+    await _run_ffmpeg_async(args, f"Concatenate {len(audio_files)} audio files", input=concat_list)
+    return _check_concatenated_audio(output_path)
+
+
+def _concat_command(
+    audio_files: list,
+    output_path: str,
+    format: str,
+) -> Tuple[list, Optional[str]]:
+    """Build the FFmpeg arguments and optional piped concat list for a concatenation."""
     if not audio_files:
         raise ValueError("No audio files provided for concatenation")
 
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Verify all input files exist
-    for audio_file in audio_files:
-        if not Path(audio_file).exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_file}")
+    input_paths = [str(Path(audio_file).absolute()) for audio_file in audio_files]
 
-    # Create concat file list
-    concat_file = output_path.parent / "concat_list.txt"
-    with open(concat_file, "w") as f:
-        for audio_file in audio_files:
-            # Escape single quotes in file paths
-            escaped_path = str(Path(audio_file).absolute()).replace("'", "'\\''")
-            f.write(f"file '{escaped_path}'\n")
-
-    try:
+    if _is_stream_copy_concat(input_paths, format):
         args = [
-            "ffmpeg",
-            "-f", "concat",
-            "-safe", "0",
-            "-i", str(concat_file),
-            "-c:a", "libmp3lame" if format == "mp3" else "pcm_s16le",
+            _FFMPEG,
+            "-i", "concat:" + "|".join(input_paths),
+            "-c", "copy",
             "-y",
             str(output_path)
         ]
+        return args, None
 
-        _run_ffmpeg(args, f"Concatenate {len(audio_files)} audio files")
+    # Build the concat list in memory and pipe it to FFmpeg's stdin
+    concat_lines = []
+    for input_path in input_paths:
+        # Escape single quotes in file paths
+        escaped_path = input_path.replace("'", "'\\''")
+        concat_lines.append(f"file '{escaped_path}'\n")
 
-        if not output_path.exists():
-            raise FFmpegError(f"Audio concatenation failed: output file not created")
+    args = [
+        _FFMPEG,
+        "-f", "concat",
+        "-safe", "0",
+        "-protocol_whitelist", "file,pipe",  # List from stdin, entries from disk
+        "-i", "pipe:0",
+        "-c:a", "libmp3lame" if format == "mp3" else "pcm_s16le",
+        "-y",
+        str(output_path)
+    ]
 
-        logger.info(f"Concatenated audio saved to {output_path}")
-        return str(output_path)
+    return args, "".join(concat_lines)
+
+
+def _is_stream_copy_concat(audio_files: list, format: str) -> bool:
+    """Whether the inputs can be joined with the concat protocol and stream copy."""
+    # MP3 frames can be joined byte-for-byte; "|" is the protocol's separator
+    return format == "mp3" and all(
+        str(audio_file).lower().endswith(".mp3") and "|" not in str(Path(audio_file).absolute())
+        for audio_file in audio_files
+    )
+
+
+def _check_concatenated_audio(output_path: str) -> str:
+    """Verify that the concatenated file was written."""
+    output_path = Path(output_path)
+    if not output_path.exists():
+        raise FFmpegError(f"Audio concatenation failed: output file not created")
+
+    logger.info(f"Concatenated audio saved to {output_path}")
+    return str(output_path)
 
-    finally:
-        # Clean up concat file
-        if concat_file.exists():
-            concat_file.unlink()
+
+def decode_audio_to_numpy(video_path: str, sample_rate: int = 16000) -> np.ndarray:
+    """
+    Decode the first audio stream of a file in-process with PyAV.
+
+    Avoids spawning FFmpeg and writing an intermediate WAV; the samples can
+    be handed straight to local Whisper.
+
+    Args:
+        video_path: Path to input video or audio file
+        sample_rate: Output sample rate (default 16000 for Whisper)
+
+    Returns:
+        float32 numpy array of mono samples in [-1.0, 1.0]
+
+    Raises:
+        FFmpegError: If PyAV is not installed or decoding fails
+        FileNotFoundError: If input file doesn't exist
+    """
+    try:
+        import av
+    except ImportError as e:
+        raise FFmpegError("PyAV is not installed (required when USE_PYAV_EXTRACT is enabled)") from e
+
+    logger.info(f"Decoding audio in-process: {Path(video_path).name}")
+
+    resampler = av.AudioResampler(format="flt", layout="mono", rate=sample_rate)
+    chunks = []
+
+    try:
+        with av.open(str(video_path)) as container:
+            for frame in container.decode(audio=0):
+                for resampled in resampler.resample(frame):
+                    chunks.append(resampled.to_ndarray()[0])
+            # Flush samples buffered in the resampler
+            for resampled in resampler.resample(None):
+                chunks.append(resampled.to_ndarray()[0])
+    except FileNotFoundError:
+        raise
+    except av.error.FFmpegError as e:
+        raise FFmpegError(f"Failed to decode audio from {video_path}: {e}") from e
+
+    if not chunks:
+        return np.zeros(0, dtype=np.float32)
+    return np.concatenate(chunks).astype(np.float32, copy=False)
+
+
+def stream_audio_to_array(video_path: str, sample_rate: int = 16000) -> np.ndarray:
+    """
+    Decode and resample the audio of a file to float32 samples via an FFmpeg pipe.
+
+    FFmpeg resamples to mono float32 and writes raw samples to stdout, so
+    nothing touches the disk and no WAV has to be re-read and converted.
+
+    Args:
+        video_path: Path to input video or audio file
+        sample_rate: Output sample rate (default 16000 for Whisper)
+
+    Returns:
+        float32 numpy array of mono samples in [-1.0, 1.0]
+
+    Raises:
+        FFmpegError: If decoding fails
+        FileNotFoundError: If input file doesn't exist
+    """
+    args = [
+        _FFMPEG,
+        "-threads", "0",  # Decoder threads: one per core
+        "-i", str(video_path),
+        "-map", "0:a",
+        "-vn",  # No video
+        "-f", "f32le",  # Raw 32-bit float little-endian
+        "-ac", "1",
+        "-ar", str(sample_rate),
+        "pipe:1"
+    ]
+
+    output = _run_ffmpeg_pipe(args, f"Decode audio of {Path(video_path).name} to float32")
+    return np.frombuffer(output, dtype=np.float32)
+
+
+def decode_audio_to_pcm(
+    audio_path: str,
+    sample_rate: int = 44100,
+    channels: int = 1
+) -> np.ndarray:
+    """
+    Decode an audio file to 16-bit PCM samples in memory.
+
+    Args:
+        audio_path: Path to audio file
+        sample_rate: Output sample rate
+        channels: Number of output channels (samples are interleaved)
+
+    Returns:
+        int16 numpy array of samples
+
+    Raises:
+        FFmpegError: If decoding fails
+        FileNotFoundError: If audio file doesn't exist
+    """
+    audio_path = Path(audio_path)
+
+    args = [
+        _FFMPEG,
+        "-i", str(audio_path),
+        "-f", "s16le",  # Raw PCM 16-bit little-endian
+        "-ar", str(sample_rate),
+        "-ac", str(channels),
+        "pipe:1"
+    ]
+
+    output = _run_ffmpeg_pipe(args, f"Decode {audio_path.name} to PCM")
+    return np.frombuffer(output, dtype=np.int16)
+
+
+def encode_pcm_to_file(
+    samples: np.ndarray,
+    output_path: str,
+    sample_rate: int = 44100,
+    channels: int = 1
+) -> str:
+    """
+    Encode 16-bit PCM samples to an audio file.
+
+    Args:
+        samples: int16 numpy array of (interleaved) samples
+        output_path: Path for output audio file (format determined by extension)
+        sample_rate: Sample rate of the samples
+        channels: Number of channels in the samples
+
+    Returns:
+        Path to encoded audio file
+
+    Raises:
+        FFmpegError: If encoding fails
+    """
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    args = [
+        _FFMPEG,
+        "-f", "s16le",
+        "-ar", str(sample_rate),
+        "-ac", str(channels),
+        "-i", "pipe:0",
+        "-y",
+        str(output_path)
+    ]
+
+    _run_ffmpeg_pipe(
+        args,
+        f"Encode PCM to {output_path.name}",
+        input=samples.astype(np.int16, copy=False).tobytes(),
+    )
+
+    if not output_path.exists():
+        raise FFmpegError(f"Audio encoding failed: output file not created")
+
+    logger.info(f"Encoded audio saved to {output_path}")
+    return str(output_path)
 
 
 def convert_audio_format(
@@ -420,25 +1324,52 @@ def convert_audio_format(
         FFmpegError: If conversion fails
         FileNotFoundError: If input file doesn't exist
     """
-    input_path = Path(input_path)
-    output_path = Path(output_path)
+    args = _convert_command(input_path, output_path, sample_rate, channels)
+    _run_ffmpeg(args, f"Convert {Path(input_path).name} to {Path(output_path).suffix}")
+    return _check_converted_audio(output_path)
 
-    if not input_path.exists():
-        raise FileNotFoundError(f"Audio file not found: {input_path}")
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+async def convert_audio_format_async(
+    input_path: str,
+    output_path: str,
+    sample_rate: Optional[int] = None,
+    channels: Optional[int] = None
+) -> str:
+    """
+    Async variant of ``convert_audio_format``.
 
-    args = ["ffmpeg", "-i", str(input_path)]
+    Raises:
+        FFmpegError: If conversion fails
+        FileNotFoundError: If input file doesn't exist
+    """
+    args = _convert_command(input_path, output_path, sample_rate, channels)
+    await _run_ffmpeg_async(args, f"Convert {Path(input_path).name} to {Path(output_path).suffix}")
+    return _check_converted_audio(output_path)
 
-    if sample_rate:
-        args.extend(["-ar", str(sample_rate)])
-    if channels:
-        args.extend(["-ac", str(channels)])
 
-    args.extend(["-y", str(output_path)])
+def _convert_command(
+    input_path: str,
+    output_path: str,
+    sample_rate: Optional[int],
+    channels: Optional[int],
+) -> list:
+    """Build the FFmpeg arguments for an audio format conversion."""
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    return [
+        _FFMPEG,
+        "-i", str(input_path),
+        *(("-ar", str(sample_rate)) if sample_rate else ()),
+        *(("-ac", str(channels)) if channels else ()),
+        "-y",
+        str(output_path)
+    ]
 
-    _run_ffmpeg(args, f"Convert {input_path.name} to {output_path.suffix}")
 
+def _check_converted_audio(output_path: str) -> str:
+    """Verify that the converted file was written."""
+    output_path = Path(output_path)
     if not output_path.exists():
         raise FFmpegError(f"Audio conversion failed: output file not created")
 
@@ -450,6 +1381,8 @@ def get_audio_duration(audio_path: str) -> float:
     """
     Get audio file duration in seconds.
 
+    Results are cached per (path, mtime, size), like ``get_video_duration``.
+
     Args:
         audio_path: Path to audio file
 
@@ -460,13 +1393,16 @@ def get_audio_duration(audio_path: str) -> float:
         FFmpegError: If duration cannot be determined
         FileNotFoundError: If audio file doesn't exist
     """
-    audio_path = Path(audio_path)
+    return _probe_audio_duration(*_probe_cache_key(audio_path))
+
 
-    if not audio_path.exists():
-        raise FileNotFoundError(f"Audio file not found: {audio_path}")
+@functools.lru_cache(maxsize=PROBE_CACHE_SIZE)
+def _probe_audio_duration(audio_path: str, mtime_ns: int, size: int) -> float:
+    """Probe audio duration; mtime_ns and size only serve as cache keys."""
+    audio_path = Path(audio_path)
 
     args = [
-        "ffprobe",
+        _FFPROBE,
         "-v", "error",
         "-show_entries", "format=duration",
         "-of", "json",
@@ -476,7 +1412,7 @@ def get_audio_duration(audio_path: str) -> float:
     output = _run_ffprobe(args, f"Get duration of {audio_path.name}")
 
     try:
-        data = json.loads(output)
+        data = _loads(output)
         duration = float(data["format"]["duration"])
         logger.info(f"Audio duration: {duration:.2f} seconds")
         return duration
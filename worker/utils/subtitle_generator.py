@@ -1,8 +1,14 @@
 """Subtitle generation utilities for SRT format."""
 
+import codecs
+import io
 import logging
+import re
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import Callable, Iterator, List, Optional, TextIO, Tuple, Union
+
+import numpy as np
 
 from dubwizard_shared import TranscriptionSegment, TranslationSegment
 
@@ -14,6 +20,39 @@ class SubtitleError(Exception):
     pass
 
 
+# Write buffer for SRT files; entries are flushed to disk as it fills
+SRT_WRITE_BUFFER_SIZE = 1 << 20
+
+# Zero-padded strings for timestamp fields ("00".."99" and "000".."999");
+# indexing a table avoids parsing a format spec for every field
+_D2 = tuple(f"{i:02d}" for i in range(100))
+_D3 = tuple(f"{i:03d}" for i in range(1000))
+
+# Fields of an SRT timestamp (HH:MM:SS,mmm). The fraction may be comma or dot
+# separated and of any width; shared by both patterns below so parse_srt_time
+# and parse_srt/validate_srt accept the same timestamps.
+_TS_FIELDS = r"(\d+):(\d{2}):(\d{2})[,.](\d+)"
+
+# A single SRT timestamp
+_TS_RE = re.compile(rf"^{_TS_FIELDS}$")
+
+# One SRT block: index line, timing line, then non-blank text lines up to the
+# next blank line
+_SRT_BLOCK_RE = re.compile(
+    r"^[ \t]*(\d+)[ \t]*\n"
+    rf"[ \t]*{_TS_FIELDS} --> {_TS_FIELDS}[^\n]*\n"
+    r"([^\n]*\S[^\n]*(?:\n[^\n]*\S[^\n]*)*)",
+    re.MULTILINE,
+)
+
+# The same pattern over UTF-8 bytes: ids and timestamps are ASCII, so only
+# each entry's text has to be decoded
+_SRT_BLOCK_BYTES_RE = re.compile(_SRT_BLOCK_RE.pattern.encode("ascii"), re.MULTILINE)
+
+# Blank line (possibly holding only spaces/tabs) separating SRT blocks
+_BLANK_LINE_RE = re.compile(r"\n[ \t]*\n")
+
+
 def format_srt_time(seconds: float) -> str:
     """
     Convert seconds to SRT timestamp format (HH:MM:SS,mmm).
@@ -32,15 +71,16 @@ def format_srt_time(seconds: float) -> str:
         >>> format_srt_time(3661.123)
         '01:01:01,123'
     """
-    if seconds < 0:
-        seconds = 0
+    # Round to whole milliseconds once, then split with integer divmods
+    millis = round(seconds * 1000) if seconds > 0 else 0
+    secs, millis = divmod(millis, 1000)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
 
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
-    millis = int((seconds % 1) * 1000)
-
-    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+    return (
+        (_D2[hours] if hours < 100 else str(hours)) + ":" + _D2[minutes] + ":" + _D2[secs]
+        + "," + _D3[millis]
+    )
 
 
 def parse_srt_time(timestamp: str) -> float:
@@ -57,19 +97,121 @@ def parse_srt_time(timestamp: str) -> float:
         ValueError: If timestamp format is invalid
     """
     try:
-        time_part, millis_part = timestamp.split(",")
-        hours, minutes, seconds = time_part.split(":")
-
-        total_seconds = (
-            int(hours) * 3600 +
-            int(minutes) * 60 +
-            int(seconds) +
-            int(millis_part) / 1000
+        match = _TS_RE.match(timestamp)
+    except TypeError as e:
+        raise ValueError(f"Invalid SRT timestamp format: {timestamp}") from e
+
+    if match is None:
+        raise ValueError(f"Invalid SRT timestamp format: {timestamp}")
+
+    return _block_time(*match.groups())
+
+
+def _format_srt_times(seconds: np.ndarray) -> List[str]:
+    """
+    Format an array of times as SRT timestamps (vectorised format_srt_time).
+
+    The millisecond rounding and H/M/S split run as numpy array operations;
+    only the table lookups that build each string stay in Python.
+    """
+    # Infinity would wrap around in the int64 cast; format_srt_time raises too
+    if np.isinf(seconds).any():
+        raise OverflowError("Cannot format an infinite time as an SRT timestamp")
+
+    # Same rounding as format_srt_time; NaN and negatives clamp to zero
+    millis = np.rint(np.where(seconds > 0, seconds, 0.0) * 1000).astype(np.int64)
+    secs, millis = np.divmod(millis, 1000)
+    minutes, secs = np.divmod(secs, 60)
+    hours, minutes = np.divmod(minutes, 60)
+
+    d2, d3 = _D2, _D3
+    return [
+        (d2[h] if h < 100 else str(h)) + ":" + d2[m] + ":" + d2[s] + "," + d3[ms]
+        for h, m, s, ms in zip(hours.tolist(), minutes.tolist(), secs.tolist(), millis.tolist())
+    ]
+
+
+def _srt_timing_lines(
+    segments: List[Union[TranscriptionSegment, TranslationSegment]],
+) -> List[str]:
+    """
+    Format the timestamp line of each SRT entry.
+
+    Computed once per segment list so the source and translated files can
+    share them.
+
+    Raises:
+        SubtitleError: If segment timing is invalid
+    """
+    count = len(segments)
+    starts = np.fromiter(map(attrgetter("start"), segments), dtype=np.float64, count=count)
+    ends = np.fromiter(map(attrgetter("end"), segments), dtype=np.float64, count=count)
+
+    # Validate segments
+    invalid = np.flatnonzero(
+        (starts < 0) | (ends < 0) | np.isinf(starts) | np.isinf(ends)
+    )
+    if invalid.size:
+        seg = segments[invalid[0]]
+        raise SubtitleError(
+            f"Invalid segment timing: start={seg.start}, end={seg.end} "
+            f"(segments {(invalid + 1).tolist()})"
         )
 
-        return total_seconds
-    except (ValueError, AttributeError) as e:
-        raise ValueError(f"Invalid SRT timestamp format: {timestamp}") from e
+    # Swap reversed timings in the arrays only; the caller's segments are untouched
+    swapped = ends < starts
+    if swapped.any():
+        for i in np.flatnonzero(swapped).tolist():
+            logger.warning(f"Segment {i + 1} has end time before start time, swapping")
+        starts, ends = np.where(swapped, ends, starts), np.where(swapped, starts, ends)
+
+    stamps = _format_srt_times(np.concatenate((starts, ends)))
+    return [f"{start} --> {end}\n" for start, end in zip(stamps[:count], stamps[count:])]
+
+
+def _text_getter(
+    sample: Union[TranscriptionSegment, TranslationSegment],
+    use_translated: bool,
+) -> Callable[[Union[TranscriptionSegment, TranslationSegment]], str]:
+    """
+    Pick the text attribute once for a list of segments.
+
+    Segment lists are uniform (all transcription or all translation
+    segments), so the type of the first one decides for the whole list.
+    """
+    if isinstance(sample, TranslationSegment):
+        return attrgetter("translated_text" if use_translated else "original_text")
+    return attrgetter("text")
+
+
+def _write_srt_stream(
+    segments: List[Union[TranscriptionSegment, TranslationSegment]],
+    fh: TextIO,
+    timing_lines: List[str],
+    use_translated: bool = False,
+) -> None:
+    """Write SRT entries to an open text handle, dropping empty segments first."""
+    if not segments:
+        return
+
+    get_text = _text_getter(segments[0], use_translated)
+    texts = [text.strip() if text else "" for text in map(get_text, segments)]
+    # Skipped segments leave no gap in the entry numbering
+    entries = [(timing, text) for timing, text in zip(timing_lines, texts) if text]
+
+    skipped = len(segments) - len(entries)
+    if skipped:
+        logger.warning(f"Skipping {skipped} empty segment(s)")
+    if not entries:
+        return
+
+    # Entries are separated by a blank line, with none after the last one
+    timing, text = entries[0]
+    fh.write(f"1\n{timing}{text}\n")
+    fh.writelines(
+        f"\n{index}\n{timing}{text}\n"
+        for index, (timing, text) in enumerate(entries[1:], start=2)
+    )
 
 
 def generate_srt(
@@ -92,37 +234,55 @@ def generate_srt(
     if not segments:
         return ""
 
-    srt_lines = []
-
-    for i, seg in enumerate(segments, start=1):
-        # Validate segment
-        if seg.start < 0 or seg.end < 0:
-            raise SubtitleError(f"Invalid segment timing: start={seg.start}, end={seg.end}")
-        if seg.end < seg.start:
-            logger.warning(f"Segment {i} has end time before start time, swapping")
-            seg.start, seg.end = seg.end, seg.start
-
-        # Get text based on segment type
-        if isinstance(seg, TranslationSegment) and use_translated:
-            text = seg.translated_text
-        elif isinstance(seg, TranslationSegment):
-            text = seg.original_text
-        else:
-            text = seg.text
+    buffer = io.StringIO()
+    stream_srt(segments, buffer, use_translated)
+    return buffer.getvalue()
 
-        # Skip empty segments
-        if not text or not text.strip():
-            logger.warning(f"Skipping empty segment {i}")
-            continue
 
-        # Format SRT entry
-        start_time = format_srt_time(seg.start)
-        end_time = format_srt_time(seg.end)
+def stream_srt(
+    segments: List[Union[TranscriptionSegment, TranslationSegment]],
+    file_like: TextIO,
+    use_translated: bool = False,
+) -> None:
+    """
+    Write SRT entries incrementally to an open text file or stream.
 
-        srt_entry = f"{i}\n{start_time} --> {end_time}\n{text.strip()}\n"
-        srt_lines.append(srt_entry)
+    Produces the same content as ``generate_srt`` without building the
+    whole document in memory first.
 
-    return "\n".join(srt_lines)
+    Args:
+        segments: List of transcription or translation segments
+        file_like: Writable text handle (e.g. a file opened with newline="")
+        use_translated: If True and segments are TranslationSegment, use translated_text
+
+    Raises:
+        SubtitleError: If segment data is invalid
+    """
+    _write_srt_stream(segments, file_like, _srt_timing_lines(segments), use_translated)
+
+
+def _write_srt(
+    segments: List[Union[TranscriptionSegment, TranslationSegment]],
+    timing_lines: List[str],
+    output_path: Path,
+    use_translated: bool,
+    encoding: str,
+) -> str:
+    """Stream SRT entries straight to disk without building the full string."""
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        # newline="" keeps "\n" line endings on every platform
+        with open(
+            output_path, "w", encoding=encoding, newline="", buffering=SRT_WRITE_BUFFER_SIZE
+        ) as f:
+            _write_srt_stream(segments, f, timing_lines, use_translated)
+
+        logger.info(f"Saved SRT file to {output_path}")
+        return str(output_path)
+
+    except IOError as e:
+        raise SubtitleError(f"Failed to save SRT file: {e}")
 
 
 def save_srt(
@@ -146,28 +306,97 @@ def save_srt(
     Raises:
         SubtitleError: If generation or saving fails
     """
-    output_path = Path(output_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    timing_lines = _srt_timing_lines(segments) if segments else []
+    return _write_srt(segments, timing_lines, Path(output_path), use_translated, encoding)
 
-    srt_content = generate_srt(segments, use_translated)
 
-    try:
-        with open(output_path, "w", encoding=encoding) as f:
-            f.write(srt_content)
+def save_srt_pair(
+    segments: List[TranslationSegment],
+    source_path: str,
+    target_path: str,
+    encoding: str = "utf-8",
+) -> Tuple[str, str]:
+    """
+    Save source and translated SRT files for the same segments.
 
-        logger.info(f"Saved SRT file to {output_path}")
-        return str(output_path)
+    Timestamps are formatted once and shared by both files; only the text
+    lines differ.
 
-    except IOError as e:
-        raise SubtitleError(f"Failed to save SRT file: {e}")
+    Args:
+        segments: List of translation segments
+        source_path: Path to save the source language SRT file
+        target_path: Path to save the translated SRT file
+        encoding: File encoding (default UTF-8)
+
+    Returns:
+        Tuple of (source_path, target_path)
+
+    Raises:
+        SubtitleError: If generation or saving fails
+    """
+    timing_lines = _srt_timing_lines(segments) if segments else []
 
+    return (
+        _write_srt(segments, timing_lines, Path(source_path), False, encoding),
+        _write_srt(segments, timing_lines, Path(target_path), True, encoding),
+    )
 
-def parse_srt(srt_content: str) -> List[dict]:
+
+def _block_time(hours: str, minutes: str, seconds: str, fraction: str) -> float:
+    """Convert captured timestamp fields to seconds."""
+    return int(hours) * 3600 + int(minutes) * 60 + int(seconds) + int(fraction) / 10 ** len(fraction)
+
+
+def _iter_srt_blocks(
+    srt_content: Union[str, bytes],
+) -> Iterator[Tuple[Optional[re.Match], Union[str, bytes]]]:
+    """
+    Yield every block of SRT content in order as ``(match, block_text)``.
+
+    Well-formed blocks come from a single ``_SRT_BLOCK_RE.finditer`` pass
+    (``_SRT_BLOCK_BYTES_RE`` for UTF-8 bytes). Text between them is split at
+    blank lines and each piece is yielded as ``str`` with ``match=None``, so
+    callers can skip or diagnose it.
+    """
+    if isinstance(srt_content, bytes):
+        pattern = _SRT_BLOCK_BYTES_RE
+        srt_content = srt_content.replace(b"\r\n", b"\n").strip()
+    else:
+        pattern = _SRT_BLOCK_RE
+        srt_content = srt_content.replace("\r\n", "\n").strip()
+    last_end = 0
+
+    for match in pattern.finditer(srt_content):
+        # Between well-formed blocks there is normally only a blank line
+        gap = srt_content[last_end:match.start()]
+        if not gap.isspace():
+            yield from _unmatched_blocks(gap)
+        last_end = match.end()
+        yield match, match.group(0)
+
+    yield from _unmatched_blocks(srt_content[last_end:])
+
+
+def _unmatched_blocks(text: Union[str, bytes]) -> Iterator[Tuple[None, str]]:
+    """Split text that didn't match the block pattern into raw blocks."""
+    if isinstance(text, bytes):
+        text = text.decode("utf-8", errors="replace")
+    for block in _BLANK_LINE_RE.split(text):
+        block = block.strip()
+        if block:
+            yield None, block
+
+
+def parse_srt(srt_content: Union[str, bytes]) -> List[dict]:
     """
     Parse SRT content into segment dictionaries.
 
+    The whole content is scanned with one precompiled pattern instead of
+    splitting it into blocks and lines first. UTF-8 bytes are scanned as
+    they are and only each entry's text is decoded.
+
     Args:
-        srt_content: SRT formatted string
+        srt_content: SRT formatted string, or UTF-8 encoded bytes
 
     Returns:
         List of dicts with id, start, end, text
@@ -176,46 +405,20 @@ def parse_srt(srt_content: str) -> List[dict]:
         SubtitleError: If SRT format is invalid
     """
     segments = []
+    is_bytes = isinstance(srt_content, bytes)
 
-    # Split into blocks (separated by blank lines)
-    blocks = srt_content.strip().split("\n\n")
-
-    for block in blocks:
-        if not block.strip():
-            continue
-
-        lines = block.strip().split("\n")
-
-        if len(lines) < 3:
+    for match, block in _iter_srt_blocks(srt_content):
+        if match is None:
             logger.warning(f"Skipping malformed SRT block: {block[:50]}...")
             continue
 
-        try:
-            # Parse segment ID
-            seg_id = int(lines[0].strip())
-
-            # Parse timestamps
-            timestamp_line = lines[1].strip()
-            if " --> " not in timestamp_line:
-                raise SubtitleError(f"Invalid timestamp line: {timestamp_line}")
-
-            start_str, end_str = timestamp_line.split(" --> ")
-            start = parse_srt_time(start_str.strip())
-            end = parse_srt_time(end_str.strip())
-
-            # Parse text (may span multiple lines)
-            text = "\n".join(lines[2:]).strip()
-
-            segments.append({
-                "id": seg_id,
-                "start": start,
-                "end": end,
-                "text": text,
-            })
-
-        except (ValueError, IndexError) as e:
-            logger.warning(f"Failed to parse SRT block: {e}")
-            continue
+        text = match.group(10).strip()
+        segments.append({
+            "id": int(match.group(1)),
+            "start": _block_time(*match.group(2, 3, 4, 5)),
+            "end": _block_time(*match.group(6, 7, 8, 9)),
+            "text": text.decode("utf-8") if is_bytes else text,
+        })
 
     return segments
 
@@ -224,6 +427,10 @@ def load_srt(file_path: str, encoding: str = "utf-8") -> List[dict]:
     """
     Load and parse SRT file.
 
+    The file is read with a single call. UTF-8 files are parsed straight
+    from the bytes; other encodings are decoded once first. ``parse_srt``
+    normalizes CRLF line endings itself.
+
     Args:
         file_path: Path to SRT file
         encoding: File encoding (default UTF-8)
@@ -237,82 +444,119 @@ def load_srt(file_path: str, encoding: str = "utf-8") -> List[dict]:
     """
     file_path = Path(file_path)
 
-    if not file_path.exists():
+    try:
+        content = file_path.read_bytes()
+    except FileNotFoundError:
         raise FileNotFoundError(f"SRT file not found: {file_path}")
+    except IOError as e:
+        raise SubtitleError(f"Failed to read SRT file: {e}")
+
+    if codecs.lookup(encoding).name != "utf-8":
+        content = content.decode(encoding)
+
+    return parse_srt(content)
 
+
+def _diagnose_srt_block(
+    number: int,
+    block: str,
+) -> Tuple[List[str], Optional[Tuple[float, float]]]:
+    """
+    Check a block that didn't match the block pattern line by line.
+
+    Returns:
+        Tuple of (errors, (start, end) if the timestamps parsed)
+    """
+    errors = []
+    id_line, _, rest = block.partition("\n")
+    timestamp_line, has_text_line, text = rest.partition("\n")
+
+    # Check minimum lines
+    if not has_text_line:
+        return [f"Block {number}: Insufficient lines (need at least 3)"], None
+
+    # Check segment ID
     try:
-        with open(file_path, "r", encoding=encoding) as f:
-            content = f.read()
+        seg_id = int(id_line.strip())
+        if seg_id != number:
+            errors.append(f"Block {number}: Segment ID mismatch (expected {number}, got {seg_id})")
+    except ValueError:
+        errors.append(f"Block {number}: Invalid segment ID '{id_line}'")
+
+    # Check timestamp format
+    timestamp_line = timestamp_line.strip()
+    if " --> " not in timestamp_line:
+        errors.append(f"Block {number}: Missing ' --> ' in timestamp")
+        return errors, None
+
+    timing = None
+    try:
+        start_str, end_str = timestamp_line.split(" --> ")
+        timing = (parse_srt_time(start_str.strip()), parse_srt_time(end_str.strip()))
+    except ValueError as e:
+        errors.append(f"Block {number}: Invalid timestamp format - {e}")
 
-        return parse_srt(content)
+    # Check text content
+    if not text.strip():
+        errors.append(f"Block {number}: Empty text content")
 
-    except IOError as e:
-        raise SubtitleError(f"Failed to read SRT file: {e}")
+    return errors, timing
 
 
 def validate_srt(srt_content: str) -> Tuple[bool, List[str]]:
     """
     Validate SRT content format.
 
+    Blocks are walked with the same single pass as ``parse_srt``; only
+    blocks the pattern rejects are re-checked line by line to explain why.
+    Timing checks (end after start, no overlap with any earlier block) run
+    vectorized over all blocks.
+
     Args:
         srt_content: SRT formatted string
 
     Returns:
         Tuple of (is_valid, list_of_errors)
     """
-    errors = []
-
     if not srt_content or not srt_content.strip():
         return False, ["Empty SRT content"]
 
-    blocks = srt_content.strip().split("\n\n")
-
-    prev_end = 0
-
-    for i, block in enumerate(blocks, start=1):
-        if not block.strip():
-            continue
-
-        lines = block.strip().split("\n")
-
-        # Check minimum lines
-        if len(lines) < 3:
-            errors.append(f"Block {i}: Insufficient lines (need at least 3)")
-            continue
-
-        # Check segment ID
-        try:
-            seg_id = int(lines[0].strip())
+    # (block number, message) so timing errors can be merged back in order
+    errors = []
+    block_numbers = []
+    starts = []
+    ends = []
+
+    for i, (match, block) in enumerate(_iter_srt_blocks(srt_content), start=1):
+        if match is not None:
+            fields = match.groups()
+            seg_id = int(fields[0])
             if seg_id != i:
-                errors.append(f"Block {i}: Segment ID mismatch (expected {i}, got {seg_id})")
-        except ValueError:
-            errors.append(f"Block {i}: Invalid segment ID '{lines[0]}'")
-
-        # Check timestamp format
-        timestamp_line = lines[1].strip()
-        if " --> " not in timestamp_line:
-            errors.append(f"Block {i}: Missing ' --> ' in timestamp")
-            continue
-
-        try:
-            start_str, end_str = timestamp_line.split(" --> ")
-            start = parse_srt_time(start_str.strip())
-            end = parse_srt_time(end_str.strip())
-
-            if end <= start:
-                errors.append(f"Block {i}: End time ({end}) <= start time ({start})")
-
-            if start < prev_end:
-                errors.append(f"Block {i}: Overlapping with previous segment")
-
-            prev_end = end
-
-        except ValueError as e:
-            errors.append(f"Block {i}: Invalid timestamp format - {e}")
-
-        # Check text content
-        text = "\n".join(lines[2:]).strip()
-        if not text:
-            errors.append(f"Block {i}: Empty text content")
-
-    return len(errors) == 0, errors
+                errors.append((i, f"Block {i}: Segment ID mismatch (expected {i}, got {seg_id})"))
+            timing = (_block_time(*fields[1:5]), _block_time(*fields[5:9]))
+        else:
+            block_errors, timing = _diagnose_srt_block(i, block)
+            errors.extend((i, message) for message in block_errors)
+
+        if timing is not None:
+            block_numbers.append(i)
+            starts.append(timing[0])
+            ends.append(timing[1])
+
+    if block_numbers:
+        start_arr = np.array(starts, dtype=np.float64)
+        end_arr = np.array(ends, dtype=np.float64)
+
+        for k in np.flatnonzero(end_arr <= start_arr):
+            i = block_numbers[k]
+            errors.append((i, f"Block {i}: End time ({ends[k]}) <= start time ({starts[k]})"))
+
+        # Compare each block's start with the latest end of all earlier
+        # blocks, so a long block overlapping several later ones is caught
+        latest_end = np.maximum.accumulate(end_arr)
+        for k in np.flatnonzero(start_arr[1:] < latest_end[:-1]) + 1:
+            i = block_numbers[k]
+            errors.append((i, f"Block {i}: Overlapping with previous segment"))
+
+    errors.sort(key=lambda error: error[0])
+    return len(errors) == 0, [message for _, message in errors]
@@ -2,19 +2,22 @@
 
 import logging
 import os
-import sys
+import select
 import signal
+import sys
 import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
+from typing import Optional
 
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-
-from dubwizard_shared import JobStatus, Job, Base, JobService, get_s3_service
+from sqlalchemy.orm import scoped_session, sessionmaker
 
-from worker.services.ai_service import AIService
-from worker.tasks.process_job import JobProcessor, JobProcessingError
+from dubwizard_shared import Job, Base, JobService, get_s3_service
 from dubwizard_shared.config import shared_settings as settings
+from dubwizard_shared.services.job_service import JOB_PENDING_CHANNEL
+from worker.tasks.process_job import JobProcessor, JobProcessingError, get_ai_service
 
 # Configure logging
 logging.basicConfig(
@@ -30,105 +33,264 @@ logger = logging.getLogger(__name__)
 class Worker:
     """Background worker for processing dubbing jobs."""
 
-    # Polling interval in seconds
+    # Polling interval in seconds (upper bound of the idle backoff)
     POLL_INTERVAL = 5
+    # First idle wait after a job; doubles on each empty poll up to POLL_INTERVAL
+    MIN_POLL_INTERVAL = 0.1
+    # Queued job IDs fetched per query; also caps how many one worker holds
+    # locally, so other workers still see the rest of the queue
+    PENDING_BATCH_SIZE = 16
 
     def __init__(self):
         """Initialize worker with services."""
         self.running = False
 
+        # Jobs processed at the same time, each on its own pool thread
+        self.concurrency = max(1, settings.WORKER_CONCURRENCY)
+
         # Database setup - use settings.DATABASE_URL (validated by pydantic)
         database_url = settings.DATABASE_URL
         # Handle Render's postgres:// URL format
         if database_url.startswith("postgres://"):
             database_url = database_url.replace("postgres://", "postgresql://", 1)
 
+        is_sqlite = "sqlite" in database_url
         self.engine = create_engine(
             database_url,
-            connect_args={"check_same_thread": False} if "sqlite" in database_url else {},
+            connect_args={"check_same_thread": False} if is_sqlite else {},
             pool_pre_ping=True,  # Verify connections before use
+            # One session per job thread plus the polling session; never grow past that
+            **({} if is_sqlite else {"pool_size": self.concurrency + 1, "max_overflow": 0}),
         )
         Base.metadata.create_all(bind=self.engine)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        # Polling session, reused across polls by the main loop
+        self.db = self.SessionLocal()
+        # One session per job thread, removed when its job finishes
+        self.Session = scoped_session(self.SessionLocal)
+        self.pool = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="job"
+        )
+        # Job IDs from the last batched query, oldest first
+        self._pending_queue = deque()
+
+        # PostgreSQL: wake up on NOTIFY instead of polling
+        self._listen_conn = self._open_listen_connection()
 
         # S3 service
         self.s3_service = get_s3_service()
 
-        # AI service
-        self.ai_service = AIService()
+        # AI service (shared across jobs; models are loaded before the first poll)
+        self.ai_service = get_ai_service()
+        self.ai_service.warm_up()
 
         logger.info("Worker initialized")
 
+    def _open_listen_connection(self):
+        """
+        Open a dedicated connection LISTENing for newly queued jobs.
+
+        Returns:
+            psycopg2 connection, or None when the database is not PostgreSQL
+            or LISTEN could not be set up (the worker then polls with backoff)
+        """
+        if self.engine.dialect.name != "postgresql":
+            return None
+
+        try:
+            raw = self.engine.raw_connection()
+            # Keep this connection out of the pool for the worker's lifetime
+            raw.detach()
+            conn = raw.driver_connection
+            conn.autocommit = True
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {JOB_PENDING_CHANNEL}")
+        except Exception as e:
+            logger.warning(f"LISTEN {JOB_PENDING_CHANNEL} unavailable, polling instead: {e}")
+            return None
+
+        logger.info(f"Listening for jobs on channel: {JOB_PENDING_CHANNEL}")
+        return conn
+
+    def _wait_for_job(self, timeout: float) -> None:
+        """
+        Block until a job may be available or the timeout elapses.
+
+        Args:
+            timeout: Maximum seconds to wait
+        """
+        conn = self._listen_conn
+        if conn is None:
+            time.sleep(timeout)
+            return
+
+        try:
+            if select.select([conn], [], [], timeout)[0]:
+                conn.poll()
+                conn.notifies.clear()
+        except Exception as e:
+            logger.warning(f"LISTEN connection lost, falling back to polling: {e}")
+            self._close_listen_connection()
+            time.sleep(timeout)
+
+    def _close_listen_connection(self) -> None:
+        """Close the LISTEN connection if one is open."""
+        if self._listen_conn is not None:
+            try:
+                self._listen_conn.close()
+            except Exception:
+                pass
+            self._listen_conn = None
+
     def get_db_session(self):
         """Get a new database session."""
         return self.SessionLocal()
 
-    def process_next_job(self) -> bool:
+    def _claim_next_job(self) -> Optional[str]:
         """
-        Process the next pending job.
+        Claim the next pending job for this worker.
 
         Returns:
-            True if a job was processed, False if no jobs available
+            ID of the job now marked as processing, or None if no jobs available
         """
-        db = self.get_db_session()
+        db = self.db
 
         try:
             job_service = JobService(db)
 
-            # Get next pending job
-            job = job_service.get_next_pending_job()
+            # Refill the local queue with one batched query when it runs dry
+            if not self._pending_queue:
+                self._pending_queue.extend(
+                    job_service.get_next_pending_jobs(self.PENDING_BATCH_SIZE)
+                )
+
+            # Claim (mark as processing) the next job still queued; another
+            # worker may have taken some of the prefetched IDs already
+            job = None
+            while job is None and self._pending_queue:
+                job = job_service.claim_job(self._pending_queue.popleft())
 
             if not job:
-                return False
+                # End the read transaction so the next poll sees new rows
+                db.commit()
+                return None
+
+            return job.id
+
+        except Exception:
+            db.rollback()
+            raise
 
-            logger.info(f"Processing job: {job.id}")
+        finally:
+            # Claimed rows are re-read by the job thread's own session
+            db.expire_all()
 
-            # Mark job as processing
-            job_service.update_job_status(job.id, JobStatus.PROCESSING, 0)
+    def _process_job(self, job_id: str) -> None:
+        """
+        Process a claimed job on the current thread.
+
+        Args:
+            job_id: ID of a job already marked as processing
+        """
+        db = self.Session()
+
+        try:
+            logger.info(f"Processing job: {job_id}")
 
             # Create processor and process job
             processor = JobProcessor(
                 s3_service=self.s3_service,
-                job_service=job_service,
+                job_service=JobService(db),
                 ai_service=self.ai_service,
             )
+            processor.process_job(job_id)
 
-            try:
-                processor.process_job(job.id)
-                return True
+        except JobProcessingError as e:
+            logger.error(f"Job {job_id} failed: {e}")
+            # Job is already marked as failed by processor
 
-            except JobProcessingError as e:
-                logger.error(f"Job {job.id} failed: {e}")
-                # Job is already marked as failed by processor
-                return True
+        except Exception as e:
+            logger.error(f"Job {job_id} crashed: {e}", exc_info=True)
+            db.rollback()
 
         finally:
-            db.close()
+            # Close this thread's session; the next job on it starts a fresh one
+            self.Session.remove()
+
+    def process_next_job(self) -> bool:
+        """
+        Process the next pending job on the calling thread.
+
+        Returns:
+            True if a job was processed, False if no jobs available
+        """
+        job_id = self._claim_next_job()
+        if job_id is None:
+            return False
+
+        self._process_job(job_id)
+        return True
 
     def run(self):
         """Run the worker main loop."""
-        logger.info("Starting worker...")
+        logger.info(f"Starting worker (concurrency={self.concurrency})...")
         self.running = True
 
         # Set up signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._handle_shutdown)
         signal.signal(signal.SIGTERM, self._handle_shutdown)
 
+        idle_wait = self.MIN_POLL_INTERVAL
+        inflight = set()
+
         while self.running:
             try:
-                # Process next job
-                job_processed = self.process_next_job()
-
-                if not job_processed:
-                    # No jobs available, wait before polling again
-                    logger.debug(f"No pending jobs, waiting {self.POLL_INTERVAL}s...")
-                    time.sleep(self.POLL_INTERVAL)
+                # Fill free job slots from the queue
+                claimed = False
+                while len(inflight) < self.concurrency:
+                    job_id = self._claim_next_job()
+                    if job_id is None:
+                        break
+                    inflight.add(self.pool.submit(self._process_job, job_id))
+                    claimed = True
+
+                if claimed:
+                    idle_wait = self.MIN_POLL_INTERVAL
+
+                if len(inflight) >= self.concurrency:
+                    # All slots busy: wait for one to free up
+                    inflight = wait(
+                        inflight, timeout=self.POLL_INTERVAL, return_when=FIRST_COMPLETED
+                    ).not_done
+                    continue
+
+                if claimed:
+                    continue
+
+                if self._listen_conn is not None:
+                    # NOTIFY wakes us early; the timeout only covers missed notifications
+                    logger.debug(f"No pending jobs, listening for up to {self.POLL_INTERVAL}s...")
+                    self._wait_for_job(self.POLL_INTERVAL)
+                else:
+                    # No jobs available, back off before polling again
+                    logger.debug(f"No pending jobs, waiting {idle_wait}s...")
+                    self._wait_for_job(idle_wait)
+                    idle_wait = min(idle_wait * 2, self.POLL_INTERVAL)
 
             except Exception as e:
                 logger.error(f"Worker error: {e}", exc_info=True)
                 # Wait before retrying
                 time.sleep(self.POLL_INTERVAL)
 
+            finally:
+                inflight = {future for future in inflight if not future.done()}
+
+        if inflight:
+            logger.info(f"Waiting for {len(inflight)} in-flight job(s) to finish...")
+        self.pool.shutdown(wait=True)
+        self._close_listen_connection()
+        self.db.close()
+        self.engine.dispose()
         logger.info("Worker stopped")
 
     def _handle_shutdown(self, signum, frame):